@@ -0,0 +1,284 @@
+"""Benchmarks of framework overhead.
+
+Two kinds of benchmark are run:
+
+chain
+    A chain of simple components, each connected to the next by a
+    configurable number of scalar connections.  The components do almost
+    no work, so the time measured is nearly all framework overhead.
+
+arch
+    An Architecture applied to the :class:`UnitScalableProblem` from
+    :mod:`openmdao.lib.optproblems.scalable` with a given number of
+    disciplines and problem size.
+
+For each case the wall time, number of component evaluations, time per
+evaluation, the ratio of framework time to component compute time, and the
+process's peak memory are recorded. Results can be written as JSON so that
+runs of different releases can be compared.
+"""
+
+import json
+import platform
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows.
+    resource = None
+
+from openmdao.main.api import Assembly, Component, set_as_top
+from openmdao.main.profiler import ComponentProfiler
+from openmdao.main.releaseinfo import __version__
+
+from openmdao.lib.datatypes.api import Float
+from openmdao.lib.optproblems.scalable import UnitScalableProblem
+from openmdao.lib.architectures.mdao_test_suite import build_arch_list
+
+
+class _ChainComp(Component):
+    """Copies each of its inputs to the corresponding output."""
+
+    def __init__(self, n_conns=1):
+        super(_ChainComp, self).__init__()
+        self._n_conns = n_conns
+        for i in range(n_conns):
+            self.add_trait('x%d' % i, Float(0., iotype='in'))
+            self.add_trait('y%d' % i, Float(0., iotype='out'))
+
+    def execute(self):
+        for i in range(self._n_conns):
+            setattr(self, 'y%d' % i, getattr(self, 'x%d' % i) + 1.)
+
+
+def build_chain_model(n_comps, n_conns):
+    """Returns a top level Assembly containing a chain of `n_comps`
+    components, each connected to the next by `n_conns` connections.
+
+    n_comps: int
+        Number of components in the chain.
+
+    n_conns: int
+        Number of connections between each pair of adjacent components.
+    """
+    top = set_as_top(Assembly())
+    names = []
+    for i in range(n_comps):
+        name = 'c%d' % i
+        top.add(name, _ChainComp(n_conns))
+        names.append(name)
+        if i:
+            for j in range(n_conns):
+                top.connect('%s.y%d' % (names[i-1], j), '%s.x%d' % (name, j))
+    top.driver.workflow.add(names)
+    return top
+
+
+def _peak_memory():
+    """Returns peak resident memory of this process in KB, or None if
+    it can't be determined.  Note that this is a high-water mark for the
+    whole process, so it never decreases from one case to the next.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':  # Reported in bytes.
+        peak /= 1024
+    return peak
+
+
+def _compute_time(stats, comp_paths):
+    """Returns the total execution time of the named components."""
+    return sum([stats[path]['self_time'] for path in comp_paths
+                                         if path in stats])
+
+
+def _result(kind, params, wall, evals, compute):
+    """Returns a dictionary of results for one case."""
+    result = dict(params)
+    result['kind'] = kind
+    result['wall_time'] = wall
+    result['evaluations'] = evals
+    result['time_per_evaluation'] = wall / evals if evals else None
+    if compute > 0.:
+        result['framework_ratio'] = (wall - compute) / compute
+    else:
+        result['framework_ratio'] = None
+    result['peak_memory_kb'] = _peak_memory()
+    return result
+
+
+def time_chain(n_comps, n_conns, iterations=100):
+    """Times `iterations` runs of a chain model, changing the input to the
+    first component before each run so the whole chain executes.
+    Returns a dictionary of results.
+
+    n_comps: int
+        Number of components in the chain.
+
+    n_conns: int
+        Number of connections between adjacent components.
+
+    iterations: int
+        Number of times to run the model.
+    """
+    top = build_chain_model(n_comps, n_conns)
+    names = top.driver.workflow.get_names()
+
+    def _run():
+        for i in range(iterations):
+            top.c0.x0 = float(i+1)
+            top.run()
+
+    # First time without instrumentation.
+    start = time.time()
+    _run()
+    wall = time.time() - start
+    evals = sum([getattr(top, name).exec_count for name in names])
+
+    # Then with the profiler, to get the time spent in components.
+    top.c0.x0 = 0.
+    with ComponentProfiler() as prof:
+        _run()
+    compute = _compute_time(prof.get_stats(), names)
+
+    return _result('chain', {'n_comps': n_comps, 'n_conns': n_conns,
+                             'iterations': iterations},
+                   wall, evals, compute)
+
+
+def time_architecture(arch_class, n_disciplines, prob_size):
+    """Times solution of a :class:`UnitScalableProblem` by the given
+    Architecture. Returns a dictionary of results.
+
+    arch_class: class
+        The Architecture class to use.
+
+    n_disciplines: int
+        Number of disciplines in the problem.
+
+    prob_size: int
+        Size of the variables of each discipline.
+    """
+    params = {'architecture': arch_class.__name__,
+              'n_disciplines': n_disciplines, 'prob_size': prob_size}
+
+    def _solve():
+        prob = set_as_top(UnitScalableProblem(n_disciplines, prob_size))
+        prob.architecture = arch_class()
+        prob.check_config()
+        prob.run()
+        return prob
+
+    start = time.time()
+    prob = _solve()
+    wall = time.time() - start
+    evals = sum([prob.get(name).exec_count for name in prob.disciplines])
+
+    with ComponentProfiler() as prof:
+        prob = _solve()
+    stats = prof.get_stats()
+    # Disciplines may be nested below the top level by the architecture.
+    paths = [path for path in stats
+                  if path.split('.')[-1] in prob.disciplines]
+    compute = _compute_time(stats, paths)
+
+    return _result('arch', params, wall, evals, compute)
+
+
+def run_benchmarks(n_comps=(10,), n_conns=(1,), iterations=100,
+                   archs=(), n_disciplines=(3,), prob_sizes=(3,)):
+    """Runs chain benchmarks for each combination of `n_comps` and `n_conns`
+    and architecture benchmarks for each combination of `archs`,
+    `n_disciplines` and `prob_sizes`. Returns a dictionary containing
+    information about the environment and a list of results.
+
+    n_comps: list of int
+        Numbers of components for the chain benchmark.
+
+    n_conns: list of int
+        Numbers of connections between chain components.
+
+    iterations: int
+        Number of runs of each chain model.
+
+    archs: list of Architectures
+        Architectures to benchmark on :class:`UnitScalableProblem`.
+
+    n_disciplines: list of int
+        Numbers of disciplines for the architecture benchmark.
+
+    prob_sizes: list of int
+        Problem sizes for the architecture benchmark.
+    """
+    results = []
+    for ncomp in n_comps:
+        for nconn in n_conns:
+            results.append(time_chain(ncomp, nconn, iterations))
+
+    for arch in archs:
+        for ndisc in n_disciplines:
+            for size in prob_sizes:
+                try:
+                    results.append(time_architecture(arch.__class__,
+                                                     ndisc, size))
+                except RuntimeError as err:  # Incompatible architecture.
+                    results.append({'kind': 'arch',
+                                    'architecture': arch.__class__.__name__,
+                                    'n_disciplines': ndisc,
+                                    'prob_size': size,
+                                    'error': str(err)})
+
+    return {'openmdao_version': __version__,
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'results': results}
+
+
+def write_report(data, stream=None):
+    """Writes a readable table of benchmark `data` to `stream`."""
+    if stream is None:
+        stream = sys.stdout
+    fmt = '%-30s %10s %12s %14s %10s %12s\n'
+    stream.write(fmt % ('case', 'wall (s)', 'evaluations', 'per eval (s)',
+                        'fw/compute', 'peak (KB)'))
+    for result in data['results']:
+        if result['kind'] == 'chain':
+            case = 'chain %(n_comps)d comps %(n_conns)d conns' % result
+        else:
+            case = '%(architecture)s %(n_disciplines)d disc size %(prob_size)d' \
+                   % result
+        if 'error' in result:
+            stream.write('%-30s %s\n' % (case, result['error']))
+            continue
+        per_eval = result['time_per_evaluation']
+        ratio = result['framework_ratio']
+        stream.write(fmt % (case, '%.4f' % result['wall_time'],
+                            result['evaluations'],
+                            '-' if per_eval is None else '%.3g' % per_eval,
+                            '-' if ratio is None else '%.2f' % ratio,
+                            result['peak_memory_kb'] or '-'))
+
+
+def cli_benchmark(parser=None, options=None, args=None):
+    """Runs the overhead benchmarks. A console script runs this function."""
+    if not parser:  # then you're not getting called from cli
+        return
+
+    if options.archs:
+        archs = build_arch_list(include=options.archs)
+    else:
+        archs = []
+
+    data = run_benchmarks(n_comps=options.n_comps, n_conns=options.n_conns,
+                          iterations=options.iterations, archs=archs,
+                          n_disciplines=options.n_disciplines,
+                          prob_sizes=options.prob_sizes)
+    write_report(data)
+    if options.output:
+        with open(options.output, 'w') as out:
+            json.dump(data, out, indent=2, sort_keys=True)
+    return 0
+
@@ -0,0 +1,40 @@
+import json
+import StringIO
+import unittest
+
+from openmdao.lib.architectures.mdf import MDF
+from openmdao.lib.architectures.mdao_benchmark import build_chain_model, \
+                                                     run_benchmarks, \
+                                                     write_report
+
+
+class TestBenchmark(unittest.TestCase): 
+
+    def test_chain_model(self):
+        top = build_chain_model(3, 2)
+        self.assertEqual(top.driver.workflow.get_names(), ['c0', 'c1', 'c2'])
+        top.c0.x1 = 5.
+        top.run()
+        self.assertEqual(top.c2.y1, 8.)
+
+    def test_run_benchmarks(self):
+        data = run_benchmarks(n_comps=[2, 4], n_conns=[1], iterations=3,
+                              archs=[MDF()], n_disciplines=[2], prob_sizes=[1])
+        results = data['results']
+        self.assertEqual(len(results), 3)
+        self.assertEqual([r['kind'] for r in results], ['chain', 'chain', 'arch'])
+        self.assertEqual(results[0]['evaluations'], 6)
+        self.assertEqual(results[1]['evaluations'], 12)
+        self.assertEqual(results[2]['architecture'], 'MDF')
+        self.assertTrue(results[2]['evaluations'] > 0)
+
+        # Results must be serializable.
+        json.loads(json.dumps(data))
+
+        stream = StringIO.StringIO()
+        write_report(data, stream)
+        self.assertEqual(len(stream.getvalue().splitlines()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,8 @@ iterators, and case filters in the standard library.
 
 from openmdao.lib.casehandlers.caseset import CaseArray, CaseSet, caseiter_to_caseset
 
+from openmdao.lib.casehandlers.asyncrecorder import AsyncCaseRecorder
+from openmdao.lib.casehandlers.casecache import DBCaseCache
 from openmdao.lib.casehandlers.csvcase import CSVCaseIterator, CSVCaseRecorder
 from openmdao.lib.casehandlers.dbcase import DBCaseIterator, DBCaseRecorder, \
                                              case_db_to_dict
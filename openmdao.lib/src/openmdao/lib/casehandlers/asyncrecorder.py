@@ -0,0 +1,112 @@
+"""A CaseRecorder that records cases in the background."""
+
+import Queue
+import threading
+
+# pylint: disable-msg=E0611,F0401
+from openmdao.main.interfaces import implements, ICaseRecorder
+
+_CLOSE = object()  # Queue entry requesting close.
+
+
+class AsyncCaseRecorder(object):
+    """Passes cases to another recorder from a background thread, so that a
+    slow recorder doesn't hold up the driver. Cases are recorded in the order
+    received. If more than `maxsize` cases are waiting to be recorded,
+    :meth:`record` blocks until there is room.
+
+    Each AsyncCaseRecorder has its own thread, so wrapping each of a driver's
+    recorders lets them record concurrently rather than one after another.
+    Cases must not be modified after they are recorded.
+
+    Any exception raised by the wrapped recorder is raised by the next call
+    to :meth:`record`, :meth:`flush` or :meth:`close`.
+
+    recorder: ICaseRecorder
+        The recorder to pass cases to.
+
+    maxsize: int
+        Maximum number of cases waiting to be recorded.
+    """
+
+    implements(ICaseRecorder)
+
+    def __init__(self, recorder, maxsize=1000):
+        self.recorder = recorder
+        self.maxsize = maxsize
+        self._queue = Queue.Queue(maxsize)
+        self._thread = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    def record(self, case):
+        """Queue `case` to be recorded."""
+        self._check_error()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer,
+                                                name='AsyncCaseRecorder')
+                self._thread.daemon = True
+                self._thread.start()
+        self._queue.put(case)
+
+    def _writer(self):
+        """Records cases from the queue until told to close."""
+        while True:
+            case = self._queue.get()
+            try:
+                if case is _CLOSE:
+                    self.recorder.close()
+                    return
+                if self._error is None:
+                    self.recorder.record(case)
+            except Exception as exc:
+                if self._error is None:
+                    self._error = exc
+            finally:
+                self._queue.task_done()
+
+    def _check_error(self):
+        """Raise any exception from the wrapped recorder."""
+        if self._error is not None:
+            exc, self._error = self._error, None
+            raise exc
+
+    def flush(self):
+        """Wait until all queued cases have been recorded."""
+        self._queue.join()
+        self._check_error()
+
+    def close(self):
+        """Record any queued cases, then close the wrapped recorder.
+        Recording may be resumed later, as for the wrapped recorder."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            self.recorder.close()
+        else:
+            self._queue.put(_CLOSE)
+            thread.join()
+        self._check_error()
+
+    def get_iterator(self):
+        """Record any queued cases and return the wrapped recorder's
+        iterator."""
+        self.flush()
+        return self.recorder.get_iterator()
+
+    def __getstate__(self):
+        """Return dict representing this recorder's state."""
+        self.flush()
+        state = self.__dict__.copy()
+        del state['_queue']
+        del state['_thread']
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore this recorder's state."""
+        self.__dict__.update(state)
+        self._queue = Queue.Queue(self.maxsize)
+        self._thread = None
+        self._lock = threading.Lock()
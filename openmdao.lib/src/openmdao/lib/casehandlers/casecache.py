@@ -0,0 +1,107 @@
+"""
+A persistent cache of Case results, keyed on a hash of the Case inputs and
+a model fingerprint. Drivers derived from :class:`CaseIterDriverBase` can
+use it to skip evaluation of cases that have already been run.
+"""
+
+import hashlib
+import sqlite3
+from cPickle import dumps, loads, HIGHEST_PROTOCOL
+
+from zope.interface import implements
+
+from openmdao.main.interfaces import ICaseCache
+
+
+class DBCaseCache(object):
+    """
+    Caches Case outputs in a relational DB (sqlite).
+
+    dbfile: string
+        The name of the database file, or ``:memory:`` for an in-memory
+        database.
+
+    fingerprint: string
+        Identifies the model (and version of it) which produced the results.
+        Results stored with one fingerprint won't be found by a cache using
+        a different fingerprint. Change this when the model changes in a way
+        which affects its outputs.
+
+    Lookup statistics are kept in `hits` and `misses`.
+    """
+
+    implements(ICaseCache)
+
+    def __init__(self, dbfile=':memory:', fingerprint=''):
+        self._dbfile = dbfile
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._connection = sqlite3.connect(dbfile)
+        self._connection.execute("""
+        create table if not exists results(
+         key TEXT PRIMARY KEY,
+         outputs BLOB
+         )""")
+        self._connection.commit()
+
+    @property
+    def dbfile(self):
+        """The name of the database."""
+        return self._dbfile
+
+    def get_key(self, case):
+        """
+        Return the key for `case`, a hash of `fingerprint` and the case's
+        input names and values.
+        """
+        sha = hashlib.sha1(self.fingerprint)
+        for name, value in sorted(case.items(iotype='in')):
+            sha.update(name)
+            sha.update('\0')
+            sha.update(dumps(value, HIGHEST_PROTOCOL))
+        return sha.hexdigest()
+
+    def lookup(self, case):
+        """
+        If all the outputs of `case` are cached, set them and return True.
+        Otherwise return False.
+        """
+        if self._connection is None:
+            raise RuntimeError('Attempt to lookup in closed cache')
+
+        cur = self._connection.execute(
+                  "select outputs from results where key=?",
+                  (self.get_key(case),))
+        row = cur.fetchone()
+        if row is not None:
+            outputs = loads(str(row[0]))
+            names = case.keys(iotype='out')
+            if all([name in outputs for name in names]):
+                for name in names:
+                    case[name] = outputs[name]
+                case.msg = None
+                self.hits += 1
+                return True
+        self.misses += 1
+        return False
+
+    def store(self, case):
+        """ Save the outputs of `case` if it was evaluated without error. """
+        if self._connection is None:
+            raise RuntimeError('Attempt to store in closed cache')
+        if case.msg:
+            return
+
+        outputs = dumps(dict(case.items(iotype='out')), HIGHEST_PROTOCOL)
+        self._connection.execute(
+            "insert or replace into results(key,outputs) values (?,?)",
+            (self.get_key(case), sqlite3.Binary(outputs)))
+        self._connection.commit()
+
+    def close(self):
+        """Commit and close DB connection if not using ``:memory:``."""
+        if self._connection is not None and self._dbfile != ':memory:':
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
@@ -1,10 +1,50 @@
 
+import numpy
+
 from openmdao.main.case import Case
 from openmdao.main.interfaces import implements, ICaseRecorder, ICaseIterator
 
+# Initial number of rows allocated for each column.
+_INITIAL_ROWS = 16
+
+# Column dtypes, keyed by kind. Values that aren't bool, int or float
+# (including arrays and strings) are kept in an object column.
+_DTYPES = {
+    'b': numpy.bool_,
+    'i': numpy.int_,
+    'f': numpy.float_,
+    'O': object,
+}
+
+
+def _kind(val):
+    """Return the kind of column needed to hold `val`."""
+    if isinstance(val, (bool, numpy.bool_)):
+        return 'b'
+    if isinstance(val, (int, numpy.integer)):
+        return 'i'
+    if isinstance(val, (float, numpy.floating)):
+        return 'f'
+    return 'O'
+
+
+def _common_kind(kind1, kind2):
+    """Return the kind of column that can hold values of both kinds."""
+    if kind1 == kind2:
+        return kind1
+    if kind1 in 'if' and kind2 in 'if':
+        return 'f'
+    return 'O'
+
+
 class CaseArray(object):
     """A CaseRecorder/CaseIterator containing Cases having the same set of
     input/output strings but different data. Cases are not necessarily unique.
+
+    Data is stored by column, one NumPy array per name. Columns holding
+    only bools, ints or floats are kept in arrays of that type, anything
+    else is kept in an object array. Cases are only created when iterating
+    or indexing by position.
     """
     
     implements(ICaseIterator, ICaseRecorder)
@@ -35,7 +75,10 @@ class CaseArray(object):
             self._names = []
         else:
             self._names = names[:]
-        self._values = []
+        self._split_idx = len(self._names)
+        self._columns = []
+        self._kinds = []
+        self._nrows = 0
         if isinstance(obj, dict):
             self._add_dict_cases(obj)
         elif isinstance(obj, Case):
@@ -47,17 +90,25 @@ class CaseArray(object):
     
     def copy(self):
         ca = CaseArray(parent_uuid=self._parent_uuid, names=self._names)
-        ca._values = self._values[:]
-        ca._split_idx = self._split_idx
+        self._copy_columns(ca)
         return ca
         
+    def _copy_columns(self, other):
+        other._columns = [col.copy() for col in self._columns]
+        other._kinds = self._kinds[:]
+        other._nrows = self._nrows
+        other._split_idx = self._split_idx
+
     def remove(self, case):
         """Remove the given Case from this CaseArray."""
         try:
             values = self._get_case_data(case)
         except KeyError:
             raise KeyError("Case to be removed is not a member of this CaseArray")
-        self._values.remove(values)
+        idx = self._find_row(values)
+        if idx is None:
+            raise ValueError("Case to be removed is not a member of this CaseArray")
+        self._delete_row(idx)
 
     def _add_dict_cases(self, dct):
         length = -1
@@ -79,12 +130,33 @@ class CaseArray(object):
                 raise ValueError("number of values at key '%s' (%d) differs " % (key,len(val)) +
                                  "from number of other values (%d) in CaseSet" % length)
             biglist.append(val)
-        self._values = []
         if length > 0:
-            idxs = range(len(self._names))
-            for i in range(length):
-                lst = [biglist[j][i] for j in idxs]
-                self._add_values(lst)
+            self._set_columns(biglist)
+        else:
+            self.clear()
+
+    def _set_columns(self, columns):
+        """Replace our data with `columns`, a list containing a sequence
+        of values for each of our names.
+        """
+        self.clear()
+        if not columns or not len(columns[0]):
+            return
+        for values in columns:
+            if isinstance(values, numpy.ndarray) and values.ndim == 1 and \
+               values.dtype.kind in 'biuf':
+                kind = 'i' if values.dtype.kind == 'u' else values.dtype.kind
+            else:
+                kind = reduce(_common_kind, [_kind(val) for val in values])
+            if kind == 'O':
+                col = numpy.empty(len(values), dtype=object)
+                for i, val in enumerate(values):
+                    col[i] = val
+            else:
+                col = numpy.array(values, dtype=_DTYPES[kind])
+            self._columns.append(col)
+            self._kinds.append(kind)
+        self._nrows = len(columns[0])
 
     def _record_first_case(self, case):
         """Called the first time we record a Case"""
@@ -110,7 +182,7 @@ class CaseArray(object):
         
     def record(self, case):
         """Record the given Case."""
-        if not self._values:
+        if not self._nrows:
             self._record_first_case(case)
         else:
             self._add_values(self._get_case_data(case))
@@ -123,8 +195,13 @@ class CaseArray(object):
         return self._next_case()
 
     def _next_case(self):
-        for i in range(len(self._values)):
-            yield self.__getitem__(i)
+        # Convert each column once rather than each value.
+        columns = [self._column(i).tolist() for i in range(len(self._columns))]
+        for values in zip(*columns):
+            yield self._case_from_values(values)
+        if not columns:
+            for i in range(self._nrows):
+                yield self._case_from_values(())
     
     def __getitem__(self, key):
         """If key is a varname or expression, returns a list of
@@ -133,16 +210,65 @@ class CaseArray(object):
         case.
         """
         if isinstance(key, basestring): # return all of the values for the given name
-            try: 
-                idx = self._names.index(key)
-            except ValueError as err: 
-                raise KeyError("CaseSet has no input or outputs named %s"%key )
-            return [lst[idx] for lst in self._values]
+            return self.get_column(key).tolist()
         else:  # key is the case numbe
-            return self._case_from_values(self._values[key])
+            return self._case_from_values(self._row(key))
         
-    
-            
+    def get_column(self, name):
+        """Returns a NumPy array of all of the recorded values for the
+        given varname or expression. The array is a view of this container's
+        data, so it must not be modified and its contents are only valid
+        until the next Case is recorded or removed.
+        """
+        try: 
+            idx = self._names.index(name)
+        except ValueError as err: 
+            raise KeyError("CaseSet has no input or outputs named %s" % name)
+        if idx >= len(self._columns):  # Nothing recorded yet.
+            return numpy.zeros(0)
+        return self._column(idx)
+
+    def _column(self, idx):
+        return self._columns[idx][:self._nrows]
+
+    def _row(self, idx):
+        """Returns the list of values for row `idx`."""
+        if idx < 0:
+            idx += self._nrows
+        if idx < 0 or idx >= self._nrows:
+            raise IndexError("case index out of range")
+        return [col[idx] if kind == 'O' else col[idx].item()
+                for col, kind in zip(self._columns, self._kinds)]
+
+    def _find_row(self, values):
+        """Returns the index of the first row equal to `values`,
+        or None.
+        """
+        rows = None
+        # Use a numeric column (if any) to find candidate rows quickly.
+        for i, kind in enumerate(self._kinds):
+            if kind != 'O' and _kind(values[i]) != 'O':
+                rows = numpy.nonzero(self._column(i) == values[i])[0]
+                break
+        if rows is None:
+            rows = range(self._nrows)
+        values = list(values)
+        for idx in rows:
+            if self._row(idx) == values:
+                return idx
+        return None
+
+    def _delete_row(self, idx):
+        """Removes row `idx`, shifting later rows down."""
+        if idx < 0:
+            idx += self._nrows
+        end = self._nrows
+        for col in self._columns:
+            col[idx:end-1] = col[idx+1:end]
+            if col.dtype == object:
+                col[end-1] = None  # Release reference.
+        self._nrows -= 1
+
     def _case_from_values(self, values):
         return Case(inputs=[(n,v) for n,v in zip(self._names[0:self._split_idx],
                                                  values[0:self._split_idx])],
@@ -160,10 +286,37 @@ class CaseArray(object):
             raise KeyError("input or output is missing from case: %s" % str(err))
         
     def _add_values(self, vals):
-        self._values.append(vals)
+        if not self._columns:
+            if not vals:  # No names, just count rows.
+                self._nrows += 1
+                return
+            self._kinds = [_kind(val) for val in vals]
+            self._columns = [numpy.empty(_INITIAL_ROWS, dtype=_DTYPES[kind])
+                             for kind in self._kinds]
+        nrows = self._nrows
+        if nrows == len(self._columns[0]):
+            self._grow()
+        for i, val in enumerate(vals):
+            kind = self._kinds[i]
+            new_kind = _common_kind(kind, _kind(val))
+            if new_kind != kind:
+                self._columns[i] = self._columns[i].astype(_DTYPES[new_kind])
+                self._kinds[i] = new_kind
+            self._columns[i][nrows] = val
+        self._nrows += 1
+
+    def _grow(self):
+        """Double the number of rows allocated for each column. New arrays
+        are allocated so that any views previously returned are unaffected.
+        """
+        nrows = self._nrows
+        for i, col in enumerate(self._columns):
+            new = numpy.empty(max(2*len(col), _INITIAL_ROWS), dtype=col.dtype)
+            new[:nrows] = col[:nrows]
+            self._columns[i] = new
 
     def __len__(self):
-        return len(self._values)
+        return self._nrows
     
     def __contains__(self, case):
         if not isinstance(case, Case):
@@ -172,16 +325,15 @@ class CaseArray(object):
             values = self._get_case_data(case)
         except KeyError:
             return False
-        for val in self._values:
-            if val == values:
-                return True
-        return False
+        return self._find_row(values) is not None
     
     def clear(self):
         """Remove all case values from this container but leave list of
         variables intact.
         """
-        self._values = []
+        self._columns = []
+        self._kinds = []
+        self._nrows = 0
 
     def update(self, *case_containers):
         """Add Cases from other CaseSets or CaseArrays to this one."""
@@ -190,7 +342,9 @@ class CaseArray(object):
                 self.record(case)
                 
     def pop(self, idx=-1):
-        return self._case_from_values(self._values.pop(idx))
+        values = self._row(idx)
+        self._delete_row(idx)
+        return self._case_from_values(values)
                 
     def _check_compatability(self, case_container):
         if self._names != case_container._names:
@@ -230,16 +384,20 @@ class CaseSet(CaseArray):
 
     def copy(self):
         cs = CaseSet(parent_uuid=self._parent_uuid, names=self._names)
-        cs._values = self._values[:]
+        self._copy_columns(cs)
         cs._tupset = self._tupset.copy()
-        cs._split_idx = self._split_idx
         return cs
         
+    def _set_columns(self, columns):
+        self.clear()
+        for vals in zip(*columns):
+            self._add_values(vals)
+
     def _add_values(self, vals):
         tup = tuple(vals)
         if tup not in self._tupset:
             self._tupset.add(tup)
-            self._values.append(tup)
+            super(CaseSet, self)._add_values(tup)
 
     def __contains__(self, case):
         if not isinstance(case, Case):
@@ -253,9 +411,10 @@ class CaseSet(CaseArray):
     def _make_case_set(self, tupset):
         cs = CaseSet(parent_uuid=self._parent_uuid)
         cs._names = self._names[:]
-        cs._values = list(tupset)
-        cs._tupset = tupset
         cs._split_idx = self._split_idx
+        for tup in tupset:
+            CaseArray._add_values(cs, tup)
+        cs._tupset = tupset
         return cs
     
     def isdisjoint(self, case_set):
@@ -320,8 +479,9 @@ class CaseSet(CaseArray):
         self._tupset = set()
 
     def pop(self, idx=-1):
-        vals = self._values.pop(idx)
-        self._tupset.remove(vals)
+        vals = self._row(idx)
+        self._delete_row(idx)
+        self._tupset.remove(tuple(vals))
         return self._case_from_values(vals)
                 
     def remove(self, case):
@@ -330,7 +490,7 @@ class CaseSet(CaseArray):
         except KeyError:
             raise KeyError("Case to be removed is not a member of this CaseSet")
         self._tupset.remove(values)
-        self._values.remove(values)
+        self._delete_row(self._find_row(values))
 
     def __eq__(self, caseset):
         self._check_compatability(caseset)
@@ -3,10 +3,33 @@
 
 import csv
 import cStringIO, StringIO
+from itertools import islice
+
+from ordereddict import OrderedDict
+
+from numpy import array, empty
 
 # pylint: disable-msg=E0611,F0401
 from openmdao.main.interfaces import implements, ICaseRecorder, ICaseIterator
-from openmdao.main.case import Case
+from openmdao.main.case import Case, flatten_obj
+from openmdao.lib.casehandlers.caseset import CaseArray
+
+
+# Types recorded as a single column without flattening.
+_SCALARS = set((int, float, str, unicode))
+
+
+def _to_array(values):
+    """Return `values` as a float array if they are all numbers, otherwise
+    as an object array.
+    """
+    col = array(values)
+    if col.dtype.kind in 'biuf':
+        return col.astype(float)
+    col = empty(len(values), dtype=object)
+    col[:] = values
+    return col
+
 
 class CSVCaseIterator(object):
     """An iterator that returns :class:`Case` objects from a passed-in iterator
@@ -28,6 +51,7 @@ class CSVCaseIterator(object):
         self.data = []
         self.headers = headers
         self.label_field = None
+        self._layout = None
         
         #Open Input file
         self.filename = filename
@@ -43,6 +67,7 @@ class CSVCaseIterator(object):
         """Set the CSV file name."""
         
         self._filename = name
+        self._layout = None
         
         with open(self.filename, 'r') as infile:
             # Sniff out the dialect
@@ -69,56 +94,66 @@ class CSVCaseIterator(object):
     def __iter__(self):
         return self._next_case()
 
-    def _next_case(self):
-        """ Generator which returns Cases one at a time. """
-        
-        # Default case label for external csv files that don't have labels.
-        label = "External Case"
-        
-        retries = max_retries = 0
-        parent_uuid = msg = ""
-        retries_field = None
-        if self.headers is None:
-            input_fields = {}
-        else:
-            input_fields = self.headers
-        output_fields = {}
-        
-        for row in self.data:
+    def _get_layout(self):
+        """ Return the column layout of our data as a tuple of (index of the
+        first data row, dict of input names, dict of output names, label
+        column, retries column). The dicts map column index to name. The
+        layout is determined once, from the headers or the first row.
+        """
+        if self._layout is None:
+            start = 0
+            label_field = self.label_field
+            retries_field = None
+            if self.headers is None:
+                input_fields = {}
+            else:
+                input_fields = self.headers
+            output_fields = {}
             
             # Get fieldnames from file
-            if self.need_fieldnames:
-
+            if self.need_fieldnames and self.data:
+                row = self.data[0]
+                start = 1
+                
                 # OpenMDAO-style CSV file
-                if row[1] == '/INPUTS':
-                    
+                if len(row) > 1 and row[1] == '/INPUTS':
                     input_fields, output_fields = self._parse_fieldnames(row)
-                        
-                    self.label_field = 0
+                    label_field = 0
                     retries_field = row.index('/METADATA') + 1
-                    max_retries_field = retries_field + 1
-                    parent_uuid_field = retries_field + 2
-                    msg_field = retries_field + 3
                     
                 # Read headers from file
-                elif self.headers is None:
+                else:
                     for i, field in enumerate(row):
                         if field == 'label':
-                            self.label_field = i
+                            label_field = i
                         else:
                             input_fields[i] = field
-                    
-                self.need_fieldnames = False
-                continue
+                            
+            self._layout = (start, input_fields, output_fields,
+                            label_field, retries_field)
+        return self._layout
 
-            if self.label_field is not None:
-                label = row[self.label_field]
+    def _next_case(self):
+        """ Generator which returns Cases one at a time. """
+        
+        # Default case label for external csv files that don't have labels.
+        label = "External Case"
+        
+        retries = max_retries = 0
+        parent_uuid = msg = ""
+        start, input_fields, output_fields, label_field, retries_field = \
+            self._get_layout()
+        input_fields = input_fields.items()
+        output_fields = output_fields.items()
+        
+        for row in islice(self.data, start, None):
+            
+            if label_field is not None:
+                label = row[label_field]
                 
             if retries_field is not None:
-                retries = row[retries_field]
-                max_retries = row[max_retries_field]
-                parent_uuid = row[parent_uuid_field]
-                msg = row[msg_field]
+                retries, max_retries, parent_uuid, msg = \
+                    row[retries_field:retries_field+4]
                 
                 # For some reason, default for these in a case is None
                 if not retries:
@@ -126,18 +161,54 @@ class CSVCaseIterator(object):
                 if not max_retries:
                     max_retries = None
                 
-            inputs = []
-            for i, field in input_fields.iteritems():
-                inputs.append( (field, row[i]) )
-            
-            outputs = []
-            for i, field in output_fields.iteritems():
-                outputs.append( (field, row[i]) )
+            inputs = [(field, row[i]) for i, field in input_fields]
+            outputs = [(field, row[i]) for i, field in output_fields]
                 
             yield Case(inputs=inputs, outputs=outputs, label=label, \
                        retries=retries, max_retries=max_retries, \
                        parent_uuid=parent_uuid, msg=msg)
 
+    def get_columns(self, iotype=None):
+        """ Return an ordered dict mapping variable names to arrays of their
+        values, one entry per row, in the order the columns appear in the
+        file. Columns containing only numbers are returned as float arrays,
+        others as object arrays.
+        
+        iotype: str (optional)
+            If 'in', only inputs are returned, if 'out' only outputs.
+            Otherwise both are returned.
+        """
+        start, input_fields, output_fields = self._get_layout()[:3]
+        fields = {}
+        if iotype != 'out':
+            fields.update(input_fields)
+        if iotype != 'in':
+            fields.update(output_fields)
+        
+        # csv has already converted unquoted fields to floats, so
+        # transposing the rows gives us the columns.
+        columns = zip(*islice(self.data, start, None))
+        result = OrderedDict()
+        for i in sorted(fields):
+            if columns:
+                result[fields[i]] = _to_array(columns[i])
+            else:
+                result[fields[i]] = empty(0)
+        return result
+
+    def get_case_array(self):
+        """ Return a :class:`CaseArray` of the inputs and outputs in the file.
+        Data is held by column, Cases are only created as the CaseArray is
+        iterated. Labels and other metadata are not included.
+        """
+        inputs = self.get_columns(iotype='in')
+        outputs = self.get_columns(iotype='out')
+        names = inputs.keys() + outputs.keys()
+        cases = CaseArray(names=names)
+        cases._split_idx = len(inputs)
+        cases._set_columns(inputs.values() + outputs.values())
+        return cases
+
     def _parse_fieldnames(self, row):
         ''' Parse our input and output fieldname dictionaries
         '''
@@ -173,14 +244,17 @@ class CSVCaseRecorder(object):
     implements(ICaseRecorder)
     
     def __init__(self, filename='cases.csv', append=False, delimiter=',',
-                 quotechar = '"'):
+                 quotechar = '"', buffer_size=1000):
         
         self.delimiter = delimiter
         self.quotechar = quotechar
         self.append = append
+        self.buffer_size = buffer_size
         self.outfile = None
         self.csv_writer = None
         self._header_size = 0
+        self._layout = None  # (input names, output names) in column order.
+        self._buffer = []
         
         #Open output file
         self._write_headers = False
@@ -196,6 +270,8 @@ class CSVCaseRecorder(object):
     def filename(self, name):
         """Set the CSV file name."""
         
+        if self._buffer:
+            self.flush()
         self._filename = name
         
         if self.append:
@@ -207,6 +283,7 @@ class CSVCaseRecorder(object):
             # of headers. These won't be available until the first
             # case is passed to self.record.
             self._write_headers = True
+            self._layout = None
             
         self.csv_writer = csv.writer(self.outfile, delimiter=self.delimiter,
                                      quotechar=self.quotechar,
@@ -231,20 +308,30 @@ class CSVCaseRecorder(object):
         Field i+j+7  - max_retries
         Field i+j+8  - parent_uuid
         Field i+j+9 - msg
+        
+        Rows are buffered and written `buffer_size` at a time, or
+        when :meth:`flush` or :meth:`close` is called.
         """
         
         if self.outfile is None:
             raise RuntimeError('Attempt to record on closed recorder')
 
+        if self._layout is None:
+            # Column layout is fixed by the first case.
+            self._layout = ([name for name, value in case.items(iotype='in')],
+                            [name for name, value in case.items(iotype='out')])
+
         if self._write_headers:
             
             headers = ['label', '/INPUTS']
             
-            headers.extend(case.keys(iotype='in', flatten=True))
+            headers.extend(name for name, value in
+                           self._flatten(case, 'in', self._layout[0]))
                 
             headers.append('/OUTPUTS')
             
-            headers.extend(case.keys(iotype='out', flatten=True))
+            headers.extend(name for name, value in
+                           self._flatten(case, 'out', self._layout[1]))
                 
             headers.extend(['/METADATA', 'retries', 'max_retries', 'parent_uuid',
                             'msg'])
@@ -253,11 +340,10 @@ class CSVCaseRecorder(object):
             self._write_headers = False
             self._header_size = len(headers)
             
-        data = [case.label]
-                
-        for iotype in ['in', 'out']:
-            data.append('')
-            data.extend(case.values(iotype=iotype, flatten=True))
+        data = [case.label, '']
+        self._append_values(data, case, 'in', self._layout[0])
+        data.append('')
+        self._append_values(data, case, 'out', self._layout[1])
             
         data.extend(['', case.retries, case.max_retries, 
                      case.parent_uuid, case.msg])
@@ -265,12 +351,47 @@ class CSVCaseRecorder(object):
         if self._header_size != len(data):
             raise RuntimeError("number of data points doesn't match header size in CSV recorder")
         
-        self.csv_writer.writerow(data)
+        self._buffer.append(data)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    @staticmethod
+    def _flatten(case, iotype, names):
+        """Return flattened (name, value) list for `names` in `case`."""
+        get = case.get_input if iotype == 'in' else case.get_output
+        items = []
+        for name in names:
+            items.extend(flatten_obj(name, get(name)))
+        return items
+
+    @staticmethod
+    def _append_values(data, case, iotype, names):
+        """Append values of `names` in `case` to `data`, in column order."""
+        if len(case.items(iotype=iotype)) != len(names):
+            raise RuntimeError("number of data points doesn't match header size in CSV recorder")
+        get = case.get_input if iotype == 'in' else case.get_output
+        for name in names:
+            try:
+                value = get(name)
+            except KeyError:
+                raise RuntimeError("number of data points doesn't match header size in CSV recorder")
+            if type(value) in _SCALARS:
+                data.append(value)
+            else:
+                data.extend(val for key, val in flatten_obj(name, value))
+
+    def flush(self):
+        """Writes any buffered rows to the file."""
+        
+        if self._buffer:
+            self.csv_writer.writerows(self._buffer)
+            self._buffer = []
 
     def close(self):
-        """Closes the file."""
+        """Writes any buffered rows and closes the file."""
 
         if self.csv_writer is not None:
+            self.flush()
             if not isinstance(self.outfile,
                               (StringIO.StringIO, cStringIO.OutputType)):
                 # Closing a StringIO deletes its contents.
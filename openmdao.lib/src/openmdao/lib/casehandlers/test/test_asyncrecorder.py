@@ -0,0 +1,83 @@
+"""
+Test AsyncCaseRecorder.
+"""
+
+import threading
+import time
+import unittest
+
+from openmdao.main.api import Case
+from openmdao.lib.casehandlers.api import AsyncCaseRecorder, ListCaseRecorder
+
+
+class SlowRecorder(ListCaseRecorder):
+    """Takes a while to record each case."""
+
+    def __init__(self, fail_at=None):
+        super(SlowRecorder, self).__init__()
+        self.fail_at = fail_at
+        self.closed = 0
+        self.threads = set()
+
+    def record(self, case):
+        time.sleep(0.01)
+        self.threads.add(threading.current_thread())
+        if len(self.cases) == self.fail_at:
+            raise RuntimeError('record failed')
+        super(SlowRecorder, self).record(case)
+
+    def close(self):
+        self.closed += 1
+
+
+class AsyncCaseRecorderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.cases = [Case(inputs=[('x', i)], label=str(i)) for i in range(20)]
+
+    def test_record(self):
+        slow1 = SlowRecorder()
+        slow2 = SlowRecorder()
+        recorders = [AsyncCaseRecorder(slow1, maxsize=5),
+                     AsyncCaseRecorder(slow2, maxsize=5)]
+        start = time.time()
+        for case in self.cases:
+            for recorder in recorders:
+                recorder.record(case)
+        # Both recorders work concurrently.
+        for recorder in recorders:
+            recorder.flush()
+        self.assertTrue(time.time() - start < 0.35)
+
+        for slow in (slow1, slow2):
+            self.assertEqual([case.label for case in slow.cases],
+                             [case.label for case in self.cases])
+            self.assertFalse(threading.current_thread() in slow.threads)
+        self.assertEqual(len(recorders[0].get_iterator()), 20)
+
+        # Close records everything, and recording may resume afterwards.
+        recorders[0].record(self.cases[0])
+        recorders[0].close()
+        self.assertEqual(len(slow1.cases), 21)
+        self.assertEqual(slow1.closed, 1)
+        recorders[0].record(self.cases[1])
+        recorders[0].close()
+        self.assertEqual(len(slow1.cases), 22)
+        self.assertEqual(slow1.closed, 2)
+
+    def test_error(self):
+        recorder = AsyncCaseRecorder(SlowRecorder(fail_at=3))
+        for case in self.cases[:5]:
+            recorder.record(case)
+        try:
+            recorder.flush()
+        except RuntimeError as exc:
+            self.assertEqual(str(exc), 'record failed')
+        else:
+            self.fail('Expected RuntimeError')
+        self.assertEqual(len(recorder.recorder.cases), 3)
+        recorder.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
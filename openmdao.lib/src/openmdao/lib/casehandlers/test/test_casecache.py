@@ -0,0 +1,104 @@
+"""
+Test for DBCaseCache.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from openmdao.main.api import Assembly, Case, set_as_top
+from openmdao.test.execcomp import ExecComp
+from openmdao.lib.casehandlers.api import DBCaseCache, ListCaseIterator, \
+                                          ListCaseRecorder
+from openmdao.lib.drivers.api import CaseIteratorDriver
+
+
+class DBCaseCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.top = top = set_as_top(Assembly())
+        driver = top.add('driver', CaseIteratorDriver())
+        top.add('comp1', ExecComp(exprs=['z=x+y']))
+        top.add('comp2', ExecComp(exprs=['z=x+1']))
+        top.connect('comp1.z', 'comp2.x')
+        driver.workflow.add(['comp1', 'comp2'])
+
+    def make_cases(self, n):
+        outputs = ['comp1.z', 'comp2.z']
+        cases = []
+        for i in range(n):
+            inputs = [('comp1.x', i), ('comp1.y', i*2)]
+            cases.append(Case(inputs=inputs, outputs=outputs, label='case%s'%i))
+        return cases
+
+    def test_lookup(self):
+        cache = DBCaseCache(fingerprint='model-1')
+        case = Case(inputs=[('comp1.x', 1), ('comp1.y', [1., 2.])],
+                    outputs=['comp1.z'])
+        self.assertFalse(cache.lookup(case))
+        case['comp1.z'] = 3.
+        cache.store(case)
+
+        other = Case(inputs=[('comp1.y', [1., 2.]), ('comp1.x', 1)],
+                     outputs=['comp1.z'])
+        self.assertTrue(cache.lookup(other))
+        self.assertEqual(other['comp1.z'], 3.)
+
+        # Different inputs.
+        other = Case(inputs=[('comp1.x', 2), ('comp1.y', [1., 2.])],
+                     outputs=['comp1.z'])
+        self.assertFalse(cache.lookup(other))
+
+        # Outputs not all cached.
+        other = Case(inputs=[('comp1.x', 1), ('comp1.y', [1., 2.])],
+                     outputs=['comp1.z', 'comp2.z'])
+        self.assertFalse(cache.lookup(other))
+
+        # Failed cases aren't stored.
+        other = Case(inputs=[('comp1.x', 5)], outputs=['comp1.z'])
+        other.msg = 'failed'
+        cache.store(other)
+        self.assertFalse(cache.lookup(other))
+
+        # Different model.
+        cache.fingerprint = 'model-2'
+        self.assertFalse(cache.lookup(case))
+
+        self.assertEqual((cache.hits, cache.misses), (1, 5))
+
+    def test_driver(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            dbfile = os.path.join(tmpdir, 'cache.db')
+            driver = self.top.driver
+            driver.case_cache = DBCaseCache(dbfile, fingerprint='test')
+            driver.recorders = [ListCaseRecorder()]
+            driver.iterator = ListCaseIterator(self.make_cases(5))
+            self.top.run()
+            self.assertEqual(self.top.comp1.exec_count, 5)
+            driver.case_cache.close()
+
+            # Reopen and run with some new cases.
+            driver.case_cache = DBCaseCache(dbfile, fingerprint='test')
+            driver.recorders = [ListCaseRecorder()]
+            driver.iterator = ListCaseIterator(self.make_cases(8))
+            self.top.run()
+            self.assertEqual(self.top.comp1.exec_count, 8)
+            self.assertEqual((driver.case_cache.hits,
+                              driver.case_cache.misses), (5, 3))
+
+            cases = driver.recorders[0].cases
+            self.assertEqual(len(cases), 8)
+            for case in cases:
+                i = int(case.label[4:])
+                self.assertEqual(case.msg, None)
+                self.assertEqual(case['comp1.z'], 3*i)
+                self.assertEqual(case['comp2.z'], 3*i+1)
+            driver.case_cache.close()
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -76,7 +76,42 @@ class CaseArrayTestCase(unittest.TestCase):
         self.assertTrue(self.case1_dup in ca)
         self.assertFalse(self.case2 in ca)
         self.assertFalse(None in ca)
-        
+
+    def test_columns(self):
+        ca = CaseArray()
+        for i in range(40):
+            ca.record(Case(inputs=[('x', i), ('s', 'abc')],
+                           outputs=[('y', float(i)/2)]))
+        self.assertEqual(40, len(ca))
+        x = ca.get_column('x')
+        self.assertEqual(x.dtype.kind, 'i')
+        self.assertEqual(x.sum(), sum(range(40)))
+        self.assertEqual(ca.get_column('y').dtype.kind, 'f')
+        self.assertEqual(ca.get_column('s').dtype.kind, 'O')
+        self.assertEqual(ca['s'], ['abc']*40)
+
+        # Int column becomes float when a float is recorded.
+        ca.record(Case(inputs=[('x', 0.5), ('s', 'def')],
+                       outputs=[('y', 1.)]))
+        self.assertEqual(ca.get_column('x').dtype.kind, 'f')
+        self.assertEqual(ca['x'][-1], 0.5)
+        self.assertEqual(ca[3]['x'], 3.)
+
+        case = ca.pop(0)
+        self.assertEqual(case['x'], 0.)
+        self.assertEqual(40, len(ca))
+        self.assertEqual(ca['x'][0], 1.)
+        ca.remove(Case(inputs=[('x', 0.5), ('s', 'def')], outputs=[('y', 1.)]))
+        self.assertEqual(39, len(ca))
+        self.assertEqual(ca['s'], ['abc']*39)
+
+        try:
+            ca.get_column('z')
+        except KeyError as err:
+            self.assertEqual(str(err), "'CaseSet has no input or outputs named z'")
+        else:
+            self.fail('expected KeyError')
+
 
 class CaseSetTestCase(unittest.TestCase):
 
@@ -10,6 +10,7 @@ from openmdao.lib.casehandlers.api import CSVCaseIterator, CSVCaseRecorder, \
                                           ListCaseIterator, ListCaseRecorder, \
                                           DumpCaseRecorder
 from openmdao.lib.datatypes.api import Array, Str, Slot
+from openmdao.lib.doegenerators.api import CSVFile
 from openmdao.lib.drivers.api import SimpleCaseIterDriver, CaseIteratorDriver
 from openmdao.main.api import Component, Assembly, Case, set_as_top
 from openmdao.main.numpy_fallback import array
@@ -340,6 +341,53 @@ class CSVCaseRecorderTestCase(unittest.TestCase):
             #self.top.driver.recorders[0].close()
             #self.fail('ValueError Expected')
         
+    def test_columns(self):
+        rec = CSVCaseRecorder(filename=self.filename, buffer_size=3)
+        for i in range(10):
+            rec.record(Case(inputs=[('comp1.x', float(i)), ('comp1.y', i*2.)],
+                            outputs=[('comp1.z', i*3.), ('comp1.s', 's%d' % i)],
+                            label='case%d' % i))
+        self.assertEqual(len(rec._buffer), 1)
+        cases = rec.get_iterator()
+        self.assertEqual(rec._buffer, [])
+
+        columns = cases.get_columns()
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(list(columns['comp1.y']), [i*2. for i in range(10)])
+        self.assertEqual(columns['comp1.z'].dtype.kind, 'f')
+        self.assertEqual(columns['comp1.s'].dtype.kind, 'O')
+        self.assertEqual(columns['comp1.s'][3], 's3')
+        self.assertEqual(sorted(cases.get_columns(iotype='in').keys()),
+                         ['comp1.x', 'comp1.y'])
+
+        case_array = cases.get_case_array()
+        self.assertEqual(len(case_array), 10)
+        case = case_array[4]
+        self.assertEqual(case['comp1.x'], 4.)
+        self.assertEqual(case['comp1.s'], 's4')
+        self.assertEqual(sorted(case.keys(iotype='out')),
+                         ['comp1.s', 'comp1.z'])
+
+        # Rows read by the CSVFile DOE generator are the recorded inputs,
+        # matched to parameters by name and normalized.
+        gen = CSVFile(self.filename)
+        gen.num_parameters = 1
+        gen.param_ranges = [('comp1.y', 0., 40.)]
+        rows = list(gen)
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[5], [0.25])
+        gen.num_parameters = 2
+        gen.param_ranges = [('comp1.y', 0., 40.), ('comp1.x', -10., 10.)]
+        rows = list(gen)
+        self.assertEqual(rows[5], [0.25, 0.75])
+        blocks = list(gen.iter_blocks(4))
+        self.assertEqual([len(block) for block in blocks], [4, 4, 2])
+
+        gen.param_ranges = [('comp1.y', 0., 40.), ('comp1.q', 0., 1.)]
+        assert_raises(self, 'list(gen)', globals(), locals(), RuntimeError,
+                      "%s: no recorded input for parameter 'comp1.q'"
+                      % self.filename)
+
     def test_close(self):
         self.top.driver.recorders = [CSVCaseRecorder(filename=self.filename)]
         self.top.run()
@@ -3,7 +3,7 @@
 import logging
 
 try:
-    from numpy import exp, abs, pi, array,isnan, diag, random
+    from numpy import exp, abs, pi, array,isnan, diag, random, column_stack
 except ImportError as err:
     logging.warn("In %s: %r" % (__file__, err))
 _check=['numpy']
@@ -66,13 +66,14 @@ class MultiObjExpectedImprovement(Component):
         flat_crit= self.criteria.ravel()
 
         try:
-            y_star = zip(*[self.best_cases[crit] for crit in self.criteria])
+            y_star = column_stack([self.best_cases.get_column(crit)
+                                   for crit in self.criteria])
         except KeyError:
             self.raise_exception('no cases in the provided case_set had output '
                  'matching the provided criteria, %s'%self.criteria, ValueError)
         
         #sort list on first objective
-        y_star = array(y_star)[array([i[0] for i in y_star]).argsort()]
+        y_star = y_star[y_star[:, 0].argsort()]
         return y_star
         
     def _2obj_PI(self,mu,sigma):
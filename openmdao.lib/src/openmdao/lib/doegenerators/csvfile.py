@@ -1,14 +1,24 @@
 import csv
+from itertools import islice
+
+from numpy import array, column_stack
 
 from enthought.traits.api import HasTraits
 from openmdao.lib.datatypes.api import Int, Str
 from openmdao.main.interfaces import implements, IDOEgenerator
+from openmdao.lib.casehandlers.csvcase import CSVCaseIterator
 
 
 class CSVFile(HasTraits):
     """
     DOEgenerator that returns rows in a CSV file.
     Plugs into the DOEgenerator socket on a DOEdriver.
+
+    If the file was written by a :class:`CSVCaseRecorder`, the recorded
+    inputs are matched to parameters by name (the first target of each
+    parameter) and normalized using the parameter ranges, so a recorded DOE
+    can be rerun. Other recorded inputs, such as events, are ignored.
+    DOEdriver sets `param_ranges` from its parameters before iterating.
     """
     
     implements(IDOEgenerator)
@@ -21,6 +31,7 @@ class CSVFile(HasTraits):
     def __init__(self, doe_filename=None, *args, **kwargs):
         super(CSVFile, self).__init__(*args, **kwargs)
         self.doe_filename = doe_filename
+        self.param_ranges = None  # List of (name, low, high) per parameter.
 
     def __iter__(self):
         """ Return an iterator over our sets of input values. """
@@ -28,12 +39,86 @@ class CSVFile(HasTraits):
 
     def _next_row(self):
         """ Generate float values from CSV file. """
+        values = self._read_case_file()
+        if values is not None:
+            for row in values:
+                yield list(row)
+            return
+
         inp = open(self.doe_filename, 'rb')
         num_params = self.num_parameters
         for i, row in enumerate(csv.reader(inp)):
             if len(row) != num_params:
                 raise RuntimeError('%s line %d: expected %d parameters, got %d'
-                                   % (self.doe_filename. i+1,
+                                   % (self.doe_filename, i+1,
                                       num_params, len(row)))
             yield [float(val) for val in row]
 
+    def iter_blocks(self, size):
+        """ Return an iterator over arrays of at most `size` rows. """
+        return self._next_block(size)
+
+    def _next_block(self, size):
+        """ Generate arrays of float values from CSV file. """
+        values = self._read_case_file()
+        if values is not None:
+            for i in range(0, len(values), size):
+                yield values[i:i+size]
+            return
+
+        inp = open(self.doe_filename, 'rb')
+        try:
+            num_params = self.num_parameters
+            reader = csv.reader(inp)
+            line = 0
+            while True:
+                rows = list(islice(reader, size))
+                if not rows:
+                    break
+                for i, row in enumerate(rows):
+                    if len(row) != num_params:
+                        raise RuntimeError('%s line %d: expected %d parameters,'
+                                           ' got %d' % (self.doe_filename,
+                                                        line+i+1, num_params,
+                                                        len(row)))
+                line += len(rows)
+                yield array(rows, dtype=float).reshape(len(rows), num_params)
+        finally:
+            inp.close()
+
+    def _read_case_file(self):
+        """
+        If our file was written by a CSVCaseRecorder, return an array of
+        the normalized parameter values, one row per case.
+        Otherwise return None.
+        """
+        with open(self.doe_filename, 'rb') as inp:
+            line = inp.readline()
+        try:
+            dialect = csv.Sniffer().sniff(line)
+        except csv.Error:
+            return None
+        header = next(csv.reader([line], dialect), None)
+        if not header or len(header) < 2 or header[1] != '/INPUTS':
+            return None
+
+        if self.param_ranges is None:
+            raise RuntimeError('%s: parameter ranges are required to read'
+                               ' recorded cases' % self.doe_filename)
+        if len(self.param_ranges) != self.num_parameters:
+            raise RuntimeError('%s: expected %d parameters, got %d ranges'
+                               % (self.doe_filename, self.num_parameters,
+                                  len(self.param_ranges)))
+
+        columns = CSVCaseIterator(self.doe_filename).get_columns(iotype='in')
+        values = []
+        for name, low, high in self.param_ranges:
+            try:
+                column = columns[name]
+            except KeyError:
+                raise RuntimeError('%s: no recorded input for parameter %r'
+                                   % (self.doe_filename, name))
+            values.append((array(column, dtype=float) - low) / (high - low))
+        if not values:
+            return array([])
+        return column_stack(values)
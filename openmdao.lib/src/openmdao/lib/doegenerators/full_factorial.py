@@ -38,4 +38,25 @@ class FullFactorial(HasTraits):
         
         return product(*[linspace(0., 1., self.num_levels)
                          for i in range(self.num_parameters)])
+
+    def iter_blocks(self, size):
+        """Return an iterator over arrays of at most `size` sets of input
+        values, in the same order as :meth:`__iter__`."""
+        return self._next_block(size)
+
+    def _next_block(self, size):
+        """Generate blocks by decoding row indices into level indices."""
+        import numpy
+        nparams = self.num_parameters
+        nlevels = self.num_levels
+        levels = numpy.linspace(0., 1., nlevels)
+        total = nlevels ** nparams
+        for start in xrange(0, total, size):
+            index = numpy.arange(start, min(start+size, total))
+            block = numpy.empty((len(index), nparams))
+            # Last parameter varies fastest, as with product().
+            for i in range(nparams-1, -1, -1):
+                block[:, i] = levels[index % nlevels]
+                index //= nlevels
+            yield block
         
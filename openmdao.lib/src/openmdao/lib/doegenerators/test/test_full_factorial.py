@@ -25,6 +25,17 @@ class TestCase(unittest.TestCase):
         
         self.assertEqual([(0,0),(0,1),(1,0),(1,1)],cases)
 
+    def test_blocks(self):
+
+        ff = FullFactorial(num_levels=3)
+        ff.num_parameters = 3
+
+        blocks = list(ff.iter_blocks(5))
+        self.assertEqual([len(block) for block in blocks], [5]*5+[2])
+
+        cases = [tuple(row) for block in blocks for row in block]
+        self.assertEqual(list(ff), cases)
+
         
 if __name__ == "__main__":
     unittest.main()
@@ -42,4 +42,17 @@ class Uniform(HasTraits):
             return random.uniform(0,1,self.num_parameters)
         else:
             raise StopIteration()
+
+    def iter_blocks(self, size):
+        """Return an iterator over arrays of at most `size` sets of input
+        values. The values are the same as would be returned by iterating."""
+        if self.num_samples < 2: 
+            raise ValueError("Uniform distributions must have at least 2 samples. num_samples is set to less than 2.")
+        return self._next_block(size)
+
+    def _next_block(self, size):
+        while self.num < self.num_samples:
+            num = min(size, self.num_samples-self.num)
+            self.num = self.num+num
+            yield random.uniform(0,1,(num, self.num_parameters))
             
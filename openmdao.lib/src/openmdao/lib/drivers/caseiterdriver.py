@@ -3,22 +3,29 @@
 
 """
 
+import multiprocessing
 import os.path
 import Queue
+import select
+import shutil
 import sys
 import thread
 import threading
+import time
 import traceback
 
-from openmdao.main.datatypes.api import Bool, Dict, Enum, Int, Slot
+from openmdao.main.datatypes.api import Bool, Dict, Enum, Float, Int, Slot
 
-from openmdao.main.api import Driver
+from openmdao.main.api import Driver, Case
 from openmdao.main.exceptions import RunStopped, TracedError, traceback_str
-from openmdao.main.interfaces import ICaseIterator, ICaseRecorder, ICaseFilter
+from openmdao.main.interfaces import ICaseIterator, ICaseRecorder, \
+                                    ICaseFilter, ICaseCache
 from openmdao.main.rbac import get_credentials, set_credentials
 from openmdao.main.resource import ResourceAllocationManager as RAM
 from openmdao.main.resource import LocalAllocator
 from openmdao.util.filexfer import filexfer
+from openmdao.util.shmarray import share_items, attach_items, release_items, \
+                                   make_share_dir
 
 from openmdao.util.decorators import add_delegate
 from openmdao.main.hasparameters import HasParameters
@@ -28,6 +35,7 @@ from openmdao.lib.casehandlers.api import ListCaseRecorder
 _EMPTY     = 'empty'
 _LOADING   = 'loading'
 _EXECUTING = 'executing'
+_STOPPING  = 'stopping'
 
 class _ServerError(Exception):
     """ Raised when a server thread has problems. """
@@ -55,6 +63,21 @@ class CaseIterDriverBase(Driver):
     max_retries = Int(1, low=0, iotype='in',
                       desc='Maximum number of times to retry a failed case.')
 
+    cases_per_dispatch = Int(1, low=1, iotype='in',
+                             desc='Number of cases sent to a server at a time'
+                                  ' during concurrent evaluation.')
+
+    case_timeout = Float(0., low=0., iotype='in', units='s',
+                         desc='If non-zero, concurrently evaluated cases'
+                              ' taking longer than this are stopped and'
+                              ' treated as failed.')
+
+    speculative = Bool(False, iotype='in',
+                       desc='If True, when no cases remain to be started,'
+                            ' slow cases are duplicated on idle servers'
+                            ' during concurrent evaluation. The first'
+                            ' result is used and the other copy stopped.')
+
     extra_resources = Dict(iotype='in',
                            desc='Extra resource requirements (unusual).')
 
@@ -63,6 +86,22 @@ class CaseIterDriverBase(Driver):
                                         ' requirements will be included in the'
                                         ' generated egg.')
 
+    case_cache = Slot(ICaseCache, iotype='in', required=False,
+                      desc='If set, cases found here are not evaluated,'
+                           ' and results of evaluated cases are saved here.')
+
+    fork_workers = Bool(False, iotype='in',
+                        desc='If True, and only local servers are available,'
+                             ' evaluate cases concurrently in forked copies'
+                             ' of this process rather than in servers loaded'
+                             ' from an egg.')
+
+    shared_array_threshold = Int(1000000, low=0, iotype='in',
+                                 desc='Array outputs of at least this many'
+                                      ' bytes are returned from forked'
+                                      ' workers via shared memory rather'
+                                      ' than pickled. Zero disables this.')
+
     def __init__(self, *args, **kwargs):
         super(CaseIterDriverBase, self).__init__(*args, **kwargs)
         self._iter = None  # Set to None when iterator is empty.
@@ -76,6 +115,7 @@ class CaseIterDriverBase(Driver):
 
         self._reply_q = None  # Replies from server threads.
         self._server_lock = None  # Lock for server data.
+        self._share_dir = None  # Shared array files from forked workers.
 
         # Various per-server data keyed by server name.
         self._servers = {}
@@ -92,6 +132,14 @@ class CaseIterDriverBase(Driver):
         self._rerun = []  # Cases that failed and should be retried.
         self._generation = 0  # Used to keep worker names unique.
 
+        # Straggler handling (single case dispatch to servers only).
+        self._exec_start = {}   # Case start time keyed by server name.
+        self._copies = {}       # Servers running case, keyed by seqno.
+        self._speculate = []    # Cases to be duplicated.
+        self._speculated = set()  # Seqnos of duplicated cases.
+        self._stoppers = {}     # Threads stopping servers.
+        self._exec_times = []   # Times of completed cases.
+
     def execute(self):
         """
         Runs all cases and records results in `recorder`.
@@ -124,11 +172,17 @@ class CaseIterDriverBase(Driver):
                         self.step()
                     except StopIteration:
                         break
+            elif self._use_fork():
+                self._logger.info('Start forked evaluation.')
+                self._start_forked()
             else:
                 self._logger.info('Start concurrent evaluation.')
                 self._start()
         finally:
             self._cleanup(remove_egg)
+            if self.case_cache is not None:
+                self._logger.info('case cache: %d hits, %d misses',
+                                  self.case_cache.hits, self.case_cache.misses)
 
         if self._stop:
             if self._abort_exc is None:
@@ -174,7 +228,7 @@ class CaseIterDriverBase(Driver):
         """
         self._cleanup(remove_egg=replicate)
 
-        if not self.sequential:
+        if not self.sequential and not self._use_fork():
             if replicate or self._egg_file is None:
                 # Save model to egg.
                 # Must do this before creating any locks or queues.
@@ -213,6 +267,177 @@ class CaseIterDriverBase(Driver):
         """Returns a new iterator over the Case set."""
         raise NotImplementedError('get_case_iterator')
 
+    def _use_fork(self):
+        """
+        Return True if concurrent evaluation should use forked copies of
+        this process. This requires `fork_workers`, ``os.fork()``, and that
+        every allocator which may be used be a :class:`LocalAllocator`.
+        """
+        if not self.fork_workers or not hasattr(os, 'fork'):
+            return False
+        allocators = RAM.list_allocators()
+        if self.extra_resources and 'allocator' in self.extra_resources:
+            name = self.extra_resources['allocator']
+            allocators = [alloc for alloc in allocators if alloc.name == name]
+        if not allocators:
+            return False
+        for allocator in allocators:
+            if not isinstance(allocator, LocalAllocator):
+                return False
+        return True
+
+    def _start_forked(self):
+        """
+        Start evaluating cases concurrently in forked worker processes.
+        Each worker has a copy-on-write copy of the model and communicates
+        over a pipe, so no egg is required.
+        """
+        resources = {'python_version': sys.version[:3]}
+        if self.extra_resources:
+            resources.update(self.extra_resources)
+        max_workers = RAM.max_servers(resources)
+        self._logger.debug('max_workers %d', max_workers)
+        if max_workers <= 0:
+            msg = 'No servers supporting required resources %s' % resources
+            self.raise_exception(msg, RuntimeError)
+
+        idle = []
+        busy = {}  # (case, seqno) keyed by connection.
+        procs = []
+        # Workers share arrays via files here, removed when we're done
+        # in case any weren't attached.
+        self._share_dir = make_share_dir()
+        try:
+            while True:
+                # Start workers as needed and send cases to idle workers.
+                while self._more_to_go():
+                    if not idle:
+                        if len(busy) >= max_workers:
+                            break
+                        conn, child_conn = multiprocessing.Pipe()
+                        proc = multiprocessing.Process(target=self._forked_worker,
+                                                       args=(child_conn,))
+                        proc.daemon = True
+                        proc.start()
+                        child_conn.close()
+                        procs.append(proc)
+                        idle.append(conn)
+                    item = self._next_case()
+                    if item is None:
+                        break
+                    case, seqno = item
+                    conn = idle.pop()
+                    conn.send((seqno, case.uuid, case.items('in'),
+                               case.keys('out')))
+                    busy[conn] = item
+
+                if not busy:
+                    break
+
+                ready = select.select(busy.keys(), [], [])[0]
+                for conn in ready:
+                    case, seqno = busy.pop(conn)
+                    try:
+                        seqno, outputs, msg, tback = conn.recv()
+                    except EOFError:
+                        msg = 'Worker process for case %s died' % case.uuid
+                        self._logger.error(msg)
+                        exc = RuntimeError(msg)
+                        case.msg = '%s: %s' % (self.get_pathname(), msg)
+                    else:
+                        for name, value in attach_items(outputs):
+                            case[name] = value
+                        case.msg = msg
+                        if tback is None:
+                            exc = None
+                        else:
+                            exc = TracedError(RuntimeError(msg), tback)
+                        idle.append(conn)
+                    self._case_done(case, seqno, exc)
+        finally:
+            for conn in idle:
+                conn.send(None)
+            for conn in idle + busy.keys():
+                conn.close()
+            for proc in procs:
+                proc.join(1)
+                if proc.is_alive():
+                    proc.terminate()
+            shutil.rmtree(self._share_dir, ignore_errors=True)
+            self._share_dir = None
+
+    def _forked_worker(self, conn):
+        """
+        Loop run by each forked worker process. If `reload_model`, each case
+        is run in a further fork so it starts from the original model state.
+        """
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            if self.reload_model:
+                pid = os.fork()
+                if pid == 0:
+                    status = 1
+                    try:
+                        self._forked_send(conn, self._forked_run_case(*request))
+                        status = 0
+                    finally:
+                        os._exit(status)
+                status = os.waitpid(pid, 0)[1]
+                if status:
+                    msg = '%s: Case process exited with status %s' \
+                          % (self.get_pathname(), status)
+                    conn.send((request[0], [], msg, msg))
+            else:
+                self._forked_send(conn, self._forked_run_case(*request))
+
+    @staticmethod
+    def _forked_send(conn, reply):
+        """
+        Send `reply` from a forked worker. If it can't be sent, its shared
+        array files are removed.
+        """
+        try:
+            conn.send(reply)
+        except Exception:
+            release_items(reply[1])
+            raise
+
+    def _forked_run_case(self, seqno, case_uuid, inputs, outputs):
+        """
+        Run a case in a forked worker process.
+        Returns ``(seqno, outputs, msg, traceback)``.
+        """
+        case = Case(inputs, outputs, case_uuid=case_uuid)
+        try:
+            for event in self.get_events():
+                self.parent.set(event, True)
+            case.apply_inputs(self.parent)
+        except Exception as exc:
+            msg = '%s: Exception setting case inputs: %s' \
+                  % (self.get_pathname(), exc)
+            return (seqno, [], msg, traceback.format_exc())
+
+        # Makes iteration coordinates match sequential evaluation.
+        self.workflow._exec_count = seqno - 1
+        try:
+            self.workflow.run(case_id=case_uuid)
+        except Exception as exc:
+            return (seqno, [], str(exc), traceback.format_exc())
+
+        tback = None
+        try:
+            case.update_outputs(self.parent)
+        except Exception as exc:
+            case.msg = '%s: Exception getting case outputs: %s' \
+                       % (self.get_pathname(), exc)
+            tback = traceback_str(exc)
+        return (seqno, share_items(case.items('out'),
+                                   self.shared_array_threshold,
+                                   self._share_dir),
+                case.msg, tback)
+
     def _start(self):
         """ Start evaluating cases concurrently. """
         # Need credentials in case we're using a PublicKey server.
@@ -304,6 +529,13 @@ class CaseIterDriverBase(Driver):
                     self._in_use[name] = self._server_ready(name)
 
         # Continue until no servers are busy.
+        if self.case_timeout:
+            poll = min(self.case_timeout / 10., 1.)
+        elif self.speculative:
+            poll = 1.
+        else:
+            poll = None
+        last_reply = time.time()
         while self._busy():
             if self._more_to_go():
                 timeout = None
@@ -312,10 +544,18 @@ class CaseIterDriverBase(Driver):
                 # This has happened with a server that got 'lost'
                 # in RAM.allocate()
                 timeout = 60
+            if poll:
+                self._check_stragglers()
+                wait = poll
+            else:
+                wait = timeout
             try:
-                name, result, exc = self._reply_q.get(timeout=timeout)
-            # Hard to force worker to hang, which is handled here.
-            except Queue.Empty:  #pragma no cover
+                name, result, exc = self._reply_q.get(timeout=wait)
+            except Queue.Empty:
+                if timeout is None or time.time() - last_reply < timeout:
+                    continue  # Just polling.
+
+                # Hard to force worker to hang, which is handled here.
                 msgs = []
                 for name, in_use in self._in_use.items():
                     if in_use:
@@ -332,11 +572,12 @@ class CaseIterDriverBase(Driver):
                                             % (name, self._servers[name],
                                                state, self._server_info[name]))
                                 self._in_use[name] = False
-                if msgs:
+                if msgs:  #pragma no cover
                     self._logger.error('Timeout waiting with nothing left to do:')
                     for msg in msgs:
                         self._logger.error('    %s', msg)
             else:
+                last_reply = time.time()
                 self._in_use[name] = self._server_ready(name)
 
         # Shut-down (started) servers.
@@ -356,6 +597,84 @@ class CaseIterDriverBase(Driver):
         for name in self._queues.keys():  #pragma no cover
             self._logger.warning('Timeout waiting for %r to shut-down.', name)
 
+    def _check_stragglers(self):
+        """
+        Stop cases which have exceeded `case_timeout`. If `speculative` and
+        there's nothing else to do, duplicate slow cases on idle servers.
+        """
+        now = time.time()
+        running = []
+        for server, start in self._exec_start.items():
+            elapsed = now - start
+            if self.case_timeout and elapsed > self.case_timeout:
+                self._timeout_case(server, elapsed)
+            else:
+                running.append((elapsed, server))
+
+        if not self.speculative or not running or self._more_to_go():
+            return
+
+        idle = [server for server in self._queues
+                       if not self._in_use.get(server) and
+                          self._server_states.get(server) == _EMPTY]
+        if not idle:
+            return
+
+        if self._exec_times:
+            threshold = sum(self._exec_times) / len(self._exec_times)
+        else:
+            threshold = 0.
+        running.sort(reverse=True)  # Slowest first.
+        for elapsed, server in running:
+            if not idle or elapsed <= threshold:
+                break
+            case, seqno = self._server_cases[server]
+            if len(self._copies[seqno]) > 1:
+                continue  # Already duplicated.
+            self._logger.debug('speculating case %s from %r after %g sec.',
+                               seqno, server, elapsed)
+            self._speculate.append((case, seqno))
+            self._speculated.add(seqno)
+            idle_server = idle.pop()
+            self._in_use[idle_server] = self._server_ready(idle_server)
+
+    def _timeout_case(self, server, elapsed):
+        """ Stop case running on `server` which has taken too long. """
+        case, seqno = self._server_cases[server]
+        self._logger.debug('case %s on %r timed out after %g sec.',
+                           seqno, server, elapsed)
+        self._stop_server(server)
+        self._copies[seqno].remove(server)
+        if self._copies[seqno]:
+            return  # Another copy is still running.
+        del self._copies[seqno]
+        msg = 'Case timed out after %g seconds' % elapsed
+        case.msg = '%s: %s' % (self.get_pathname(), msg)
+        case.exec_time = elapsed
+        case.speculated = seqno in self._speculated
+        self._case_done(case, seqno, RuntimeError(case.msg))
+
+    def _stop_server(self, server):
+        """
+        Abandon the case running on `server` and try to stop it.
+        The server is reused once it replies.
+        """
+        self._server_states[server] = _STOPPING
+        del self._exec_start[server]
+        stopper = threading.Thread(target=self._remote_stop,
+                                   args=(server, get_credentials()))
+        stopper.daemon = True
+        stopper.start()
+        self._stoppers[server] = stopper
+
+    def _remote_stop(self, server, credentials):
+        """ Stop the model in `server`. """
+        set_credentials(credentials)
+        try:
+            self._top_levels[server].stop()
+        except Exception as exc:
+            self._logger.debug('stop of %r failed: %r', server, exc)
+
     def _busy(self):
         """ Return True while at least one server is in use. """
         return any(self._in_use.values())
@@ -382,6 +701,13 @@ class CaseIterDriverBase(Driver):
         self._todo = []
         self._rerun = []
 
+        self._exec_start = {}
+        self._copies = {}
+        self._speculate = []
+        self._speculated = set()
+        self._stoppers = {}
+        self._exec_times = []
+
         if self._egg_file and os.path.exists(self._egg_file):
             os.remove(self._egg_file)
             self._egg_file = None
@@ -431,9 +757,42 @@ class CaseIterDriverBase(Driver):
                         self._server_states[server] = _EMPTY
                         in_use = False
 
+        elif state == _EXECUTING and isinstance(self._server_cases[server], list):
+            # A chunk of cases has been run.
+            chunk = self._server_cases[server]
+            self._server_cases[server] = None
+            exc = self._model_status(server)
+            for item in chunk:
+                if len(item) == 3:
+                    self._case_done(*item)
+                elif exc is not None:  # Not run due to request failure.
+                    case, seqno = item
+                    case.msg = str(exc)
+                    self._case_done(case, seqno, exc)
+
+            # Set up for next chunk.
+            in_use = self._start_processing(server, stepping, reload=True)
+
+        elif state == _STOPPING:
+            # Result of an abandoned case, ignore it.
+            self._logger.debug('    stopped')
+            self._server_cases[server] = None
+            stopper = self._stoppers.pop(server, None)
+            if stopper is not None:
+                stopper.join(10)
+            in_use = self._start_processing(server, stepping, reload=True)
+
         elif state == _EXECUTING:
             case, seqno = self._server_cases[server]
             self._server_cases[server] = None
+            if server in self._exec_start:
+                case.exec_time = time.time() - self._exec_start.pop(server)
+                self._exec_times.append(case.exec_time)
+            others = []
+            if seqno in self._copies:
+                others = [name for name in self._copies.pop(seqno)
+                                if name != server]
+            case.speculated = seqno in self._speculated
             exc = self._model_status(server)
             if exc is None:
                 # Grab the data from the model.
@@ -448,13 +807,14 @@ class CaseIterDriverBase(Driver):
                 self._logger.debug('    exception while executing: %r', exc)
                 case.msg = str(exc)
 
-            if case.msg is not None and self.error_policy == 'ABORT':
-                if self._abort_exc is None:
-                    self._abort_exc = exc
-                self._stop = True
-
-            # Record the data.
-            self._record_case(case, seqno)
+            if case.msg is not None and others:
+                # Let the other copy finish.
+                self._copies[seqno] = others
+            else:
+                # First result wins.
+                for name in others:
+                    self._stop_server(name)
+                self._case_done(case, seqno, exc)
 
             # Set up for next case.
             in_use = self._start_processing(server, stepping, reload=True)
@@ -471,11 +831,21 @@ class CaseIterDriverBase(Driver):
 
         return in_use
 
+    def _case_done(self, case, seqno, exc):
+        """ Apply `error_policy` to a completed case and record it. """
+        if case.msg is not None and self.error_policy == 'ABORT':
+            if self._abort_exc is None:
+                self._abort_exc = exc
+            self._stop = True
+
+        # Record the data.
+        self._record_case(case, seqno)
+
     def _more_to_go(self, stepping=False):
         """ Return True if there's more work to do. """
         if self._stop:
             return False
-        if self._todo or self._rerun:
+        if self._todo or self._rerun or self._speculate:
             return True
         if not stepping and self._iter is not None:
             return True
@@ -508,35 +878,85 @@ class CaseIterDriverBase(Driver):
 
     def _start_next_case(self, server, stepping=False):
         """ Look for the next case and start it. """
-        if self._todo:
-            self._logger.debug('    run startup case')
-            case, seqno = self._todo.pop(0)
-            in_use = self._run_case(case, seqno, server)
-        elif self._rerun:
-            self._logger.debug('    rerun case')
-            case, seqno = self._rerun.pop(0)
-            in_use = self._run_case(case, seqno, server, rerun=True)
-        elif self._iter is None:
+        if server is not None and self.cases_per_dispatch > 1:
+            return self._start_next_chunk(server)
+
+        item = self._next_case(stepping)
+        if item is None:
             self._logger.debug('    no more cases')
-            in_use = False
-        elif stepping:
-            in_use = False
-        else:
-            try:
-                case = self._iter.next()
-            except StopIteration:
-                self._logger.debug('    no more cases')
-                self._iter = None
-                self._seqno = 0
-                in_use = False
+            return False
+        case, seqno = item
+        return self._run_case(case, seqno, server)
+
+    def _start_next_chunk(self, server):
+        """
+        Collect up to `cases_per_dispatch` cases and send them to `server`
+        to be run in one request. Returns True if started.
+        """
+        chunk = []
+        while len(chunk) < self.cases_per_dispatch:
+            item = self._next_case()
+            if item is None:
+                break
+            chunk.append(item)
+
+        if not chunk:
+            self._logger.debug('    no more cases')
+            return False
+
+        self._logger.debug('    run %d cases', len(chunk))
+        self._server_cases[server] = chunk
+        self._exceptions[server] = None
+        self._queues[server].put((self._remote_run_chunk, server))
+        self._server_states[server] = _EXECUTING
+        return True
+
+    def _next_case(self, stepping=False):
+        """
+        Return ``(case, seqno)`` for the next case to be run, initialized
+        for running, or None if there are no more cases.
+        If `stepping`, then we don't grab any new cases.
+        Cases found in `case_cache` are recorded and skipped.
+        """
+        while True:
+            if self._speculate:
+                case, seqno = self._speculate.pop(0)
+                if seqno in self._copies:  # Still running.
+                    self._logger.debug('    speculative case')
+                    return (case, seqno)
+                continue
+            elif self._todo:
+                self._logger.debug('    startup case')
+                case, seqno = self._todo.pop(0)
+                self._init_case(case)
+            elif self._rerun:
+                self._logger.debug('    rerun case')
+                case, seqno = self._rerun.pop(0)
+                self._init_case(case, rerun=True)
+                return (case, seqno)  # Failed, so won't be cached.
+            elif self._iter is None or stepping:
+                return None
             else:
-                self._logger.debug('    run next case')
+                try:
+                    case = self._iter.next()
+                except StopIteration:
+                    self._iter = None
+                    self._seqno = 0
+                    return None
+                self._logger.debug('    next case')
                 self._seqno += 1
-                in_use = self._run_case(case, self._seqno, server)
-        return in_use
+                seqno = self._seqno
+                self._init_case(case)
 
-    def _run_case(self, case, seqno, server, rerun=False):
-        """ Setup and start a case. Returns True if started. """
+            if self.case_cache is not None and self.case_cache.lookup(case):
+                self._logger.debug('    cached')
+                for recorder in self.recorders:
+                    recorder.record(case)
+            else:
+                return (case, seqno)
+
+    def _init_case(self, case, rerun=False):
+        """ Initialize retry and status information prior to running. """
         if not rerun:
             if not case.max_retries:
                 case.max_retries = self.max_retries
@@ -544,6 +964,8 @@ class CaseIterDriverBase(Driver):
         case.msg = None
         case.parent_uuid = self._case_id
 
+    def _run_case(self, case, seqno, server):
+        """ Setup and start a case. Returns True if started. """
         try:
             for event in self.get_events(): 
                 try: 
@@ -560,11 +982,15 @@ class CaseIterDriverBase(Driver):
                 self._logger.debug('    %s', msg)
                 self.raise_exception(msg, _ServerError)
             self._server_cases[server] = (case, seqno)
+            if server is not None and self.cases_per_dispatch == 1:
+                self._exec_start[server] = time.time()
+                self._copies.setdefault(seqno, []).append(server)
             self._model_execute(server)
             self._server_states[server] = _EXECUTING
         except _ServerError as exc:
-            case.msg = str(exc)
-            self._record_case(case, seqno)
+            if not self._copies.get(seqno):  # Not a speculative copy.
+                case.msg = str(exc)
+                self._record_case(case, seqno)
             return self._start_processing(server, stepping=False)
         else:
             return True
@@ -576,6 +1002,8 @@ class CaseIterDriverBase(Driver):
             case.retries += 1
             self._rerun.append((case, seqno))
         else:
+            if self.case_cache is not None:
+                self.case_cache.store(case)
             for recorder in self.recorders:
                 recorder.record(case)
 
@@ -680,9 +1108,45 @@ class CaseIterDriverBase(Driver):
         else:
             self._queues[server].put((self._remote_model_execute, server))
 
+    def _remote_run_chunk(self, server):
+        """
+        Run a chunk of cases in remote server with a single request.
+        Each entry of the chunk is replaced by ``(case, seqno, exc)``.
+        Retries and `error_policy` are applied per case when the reply
+        is processed.
+        """
+        chunk = self._server_cases[server]
+        cases = [(case.items(iotype='in'), case.keys(iotype='out'),
+                  seqno, case.uuid) for case, seqno in chunk]
+        egg_file = self._egg_file if self.reload_model else None
+        try:
+            results = self._servers[server].run_cases(cases,
+                                                      self.get_itername(),
+                                                      self.get_events(),
+                                                      egg_file)
+        except Exception as exc:
+            self._exceptions[server] = TracedError(exc, traceback.format_exc())
+            self._logger.error('Caught exception running cases on %r: %r',
+                               server, exc)
+            return
+
+        for i, (outputs, exc) in enumerate(results):
+            case, seqno = chunk[i]
+            if exc is None:
+                for name, value in outputs:
+                    case.add_output(name, value)
+            else:
+                self._logger.debug('    exception while executing: %r', exc)
+                case.msg = str(exc)
+            chunk[i] = (case, seqno, exc)
+
     def _remote_model_execute(self, server):
         """ Execute model in remote server. """
         case, seqno = self._server_cases[server]
+        self._remote_execute(server, case, seqno)
+
+    def _remote_execute(self, server, case, seqno):
+        """ Execute model in remote server for `case`. """
         try:
             self._top_levels[server].set_itername(self.get_itername(), seqno)
             self._top_levels[server].run(case_id=case.uuid)
@@ -6,9 +6,12 @@
 """
 
 import csv
+from itertools import chain, islice
 
 # pylint: disable-msg=E0611,F0401
-from openmdao.lib.datatypes.api import Bool, ListStr, Slot, Float, Str
+from numpy import array
+
+from openmdao.lib.datatypes.api import Bool, Int, ListStr, Slot, Float, Str
 
 from openmdao.main.case import Case
 from openmdao.main.interfaces import IDOEgenerator, ICaseFilter
@@ -17,6 +20,47 @@ from openmdao.util.decorators import add_delegate
 from openmdao.main.hasparameters import HasParameters
 
 
+def doe_blocks(generator, size):
+    """
+    Returns an iterator over 2D arrays of at most `size` rows of normalized
+    values from `generator`. If the generator has an ``iter_blocks()``
+    method it is used, otherwise rows from the generator are collected.
+
+    generator: IDOEgenerator
+        Source of normalized values.
+
+    size: int
+        Maximum number of rows in a block.
+    """
+    if hasattr(generator, 'iter_blocks'):
+        return generator.iter_blocks(size)
+    return _collect_blocks(iter(generator), size)
+
+
+def _collect_blocks(rows, size):
+    """ Generate 2D arrays from `rows`. """
+    while True:
+        block = list(islice(rows, size))
+        if not block:
+            return
+        yield array(block, dtype=float)
+
+
+def _make_case(targets, row, events, outputs, parent_uuid):
+    """
+    Return a new :class:`Case` setting each list of targets in `targets`
+    to the corresponding value in `row`, with `events` set and `outputs`
+    to be collected.
+    """
+    inputs = []
+    for names, val in zip(targets, row):
+        for name in names:
+            inputs.append((name, val))
+    for name in events:
+        inputs.append((name, True))
+    return Case(inputs, outputs, parent_uuid=parent_uuid)
+
+
 @add_delegate(HasParameters)
 class DOEdriver(CaseIterDriverBase):
     """ Driver for Design of Experiments. """
@@ -38,6 +82,10 @@ class DOEdriver(CaseIterDriverBase):
     case_filter = Slot(ICaseFilter, iotype='in',
                        desc='Selects cases to be run.')
 
+    block_size = Int(1000, low=1, iotype='in',
+                     desc='Number of DOE values generated and scaled at'
+                          ' a time.')
+
     def execute(self):
         """Generate and evaluate cases."""
         self._csv_file = None
@@ -52,13 +100,22 @@ class DOEdriver(CaseIterDriverBase):
         return self._get_cases()
         
     def _get_cases(self):
-        """Generate each case."""
+        """
+        Generate each case. Values are generated and scaled a block at a
+        time, and each Case is only created when it is requested.
+        """
         params = self.get_parameters().values()
         self.DOEgenerator.num_parameters = len(params)
+        if hasattr(self.DOEgenerator, 'param_ranges'):
+            self.DOEgenerator.param_ranges = [(p.targets[0], p.low, p.high)
+                                              for p in params]
         record_doe = self.record_doe
         events = self.get_events()
         outputs = self.case_outputs
         case_filter = self.case_filter
+        targets = [p.targets for p in params]
+        lows = array([p.low for p in params])
+        spans = array([p.high - p.low for p in params])
 
         if record_doe:
             if not self.doe_filename:
@@ -66,17 +123,18 @@ class DOEdriver(CaseIterDriverBase):
             self._csv_file = open(self.doe_filename, 'wb')
             csv_writer = csv.writer(self._csv_file)
 
-        for i, row in enumerate(self.DOEgenerator):
+        i = 0
+        for block in doe_blocks(self.DOEgenerator, self.block_size):
             if record_doe:
-                csv_writer.writerow(['%.16g' % val for val in row])
-            vals = [p.low+(p.high-p.low)*val for p,val in zip(params,row)]
-            case = self.set_parameters(vals, Case(parent_uuid=self._case_id))
-            # now add events
-            for varname in events: 
-                case.add_input(varname, True)
-            case.add_outputs(outputs)    
-            if case_filter is None or case_filter.select(i, case):
-                yield case
+                csv_writer.writerows([['%.16g' % val for val in row]
+                                      for row in block])
+            block = (lows + spans * block).tolist()
+            for row in block:
+                case = _make_case(targets, row, events, outputs,
+                                  self._case_id)
+                if case_filter is None or case_filter.select(i, case):
+                    yield case
+                i += 1
 
         if record_doe:
             self._csv_file.close()
@@ -101,42 +159,46 @@ class NeighborhoodDOEdriver(CaseIterDriverBase):
     beta = Float(.01, low=.001, high=1.0, iotype='in',
                  desc='Another factor for neighborhood DOE Driver.')
 
+    block_size = Int(1000, low=1, iotype='in',
+                     desc='Number of DOE values generated and scaled at'
+                          ' a time.')
+
     def get_case_iterator(self):
         """Returns a new iterator over the Case set."""
         return self._get_cases()
         
     def _get_cases(self):
+        """
+        Generate each case, followed by a case at the current point.
+        Values are generated and scaled a block at a time, and each Case
+        is only created when it is requested.
+        """
         params = self.get_parameters().values()
         self.DOEgenerator.num_parameters = len(params)
-        
-        M = []
-        P = []
-
-        for p in params:
-            temp = p.evaluate()
-            P.append(temp)
-            M.append((temp-p.low)/(p.high-p.low))
-
-        for row in list(self.DOEgenerator)+[tuple(M)]:
-            vals = []
-            for p,val,curval in zip(params, row, P):                
-                delta_low = curval-p.low
-                k_low = 1.0/(1.0+(1-self.beta)*delta_low)
-                new_low = curval - self.alpha*k_low*delta_low#/(self.exec_count+1)
-
-                delta_high = p.high-curval
-                k_high = 1.0/(1.0+(1-self.beta)*delta_high)
-                new_high = curval + self.alpha*k_high*delta_high#/(self.exec_count+1)
-
-                newval = new_low+(new_high-new_low)*val
-
-                vals.append(newval)
-                
-            case = self.set_parameters(vals, Case(parent_uuid=self._case_id))
-            # now add events
-            for varname in self.get_events(): 
-
-                case.add_input(varname, True)
-            case.add_outputs(self.case_outputs)
-            
-            yield case            
+        events = self.get_events()
+        outputs = self.case_outputs
+        targets = [p.targets for p in params]
+
+        P = array([p.evaluate() for p in params], dtype=float)
+        lows = array([p.low for p in params], dtype=float)
+        highs = array([p.high for p in params], dtype=float)
+        M = (P-lows)/(highs-lows)
+
+        delta_low = P-lows
+        k_low = 1.0/(1.0+(1-self.beta)*delta_low)
+        new_low = P - self.alpha*k_low*delta_low#/(self.exec_count+1)
+
+        delta_high = highs-P
+        k_high = 1.0/(1.0+(1-self.beta)*delta_high)
+        new_high = P + self.alpha*k_high*delta_high#/(self.exec_count+1)
+
+        spans = new_high-new_low
+        if hasattr(self.DOEgenerator, 'param_ranges'):
+            self.DOEgenerator.param_ranges = zip([p.targets[0] for p in params],
+                                                 new_low, new_high)
+
+        blocks = doe_blocks(self.DOEgenerator, self.block_size)
+        for block in chain(blocks, [M.reshape(1, len(params))]):
+            for row in (new_low + spans * block).tolist():
+                yield _make_case(targets, row, events, outputs,
+                                 self._case_id)            
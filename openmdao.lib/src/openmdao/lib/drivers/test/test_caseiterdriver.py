@@ -2,11 +2,13 @@
 Test CaseIteratorDriver.
 """
 
+import glob
 import logging
 import os
 import pkg_resources
 import re
 import sys
+import tempfile
 import time
 import unittest
 import nose
@@ -27,6 +29,7 @@ from openmdao.lib.casehandlers.api import ListCaseRecorder, ListCaseIterator, \
                                           SequenceCaseFilter
 
 from openmdao.test.cluster import init_cluster
+from openmdao.util import shmarray
 
 from openmdao.util.testutil import assert_raises
 
@@ -247,6 +250,94 @@ class TestCase(unittest.TestCase):
         self.run_cases(sequential=False, forced_errors=True, retry=False)
         self.run_cases(sequential=False, forced_errors=True, retry=True)
 
+    def test_concurrent_chunks(self):
+        logging.debug('')
+        logging.debug('test_concurrent_chunks')
+        init_cluster(encrypted=True, allow_shell=True)
+        self.model.driver.cases_per_dispatch = 3
+        self.run_cases(sequential=False)
+
+        self.generate_cases(force_errors=True)
+        self.run_cases(sequential=False, forced_errors=True, retry=True)
+
+        self.model.driver.reload_model = False
+        self.run_cases(sequential=False, forced_errors=True, retry=True)
+
+    def test_forked(self):
+        logging.debug('')
+        logging.debug('test_forked')
+        if not hasattr(os, 'fork'):
+            raise nose.SkipTest('Requires os.fork()')
+        self.model.driver.fork_workers = True
+        self.model.driver.extra_resources = {'allocator': 'LocalHost'}
+        self.assertTrue(self.model.driver._use_fork())
+        self.run_cases(sequential=False)
+        self.assertEqual(self.model.driver._egg_file, None)
+
+        self.generate_cases(force_errors=True)
+        self.run_cases(sequential=False, forced_errors=True, retry=False)
+        self.run_cases(sequential=False, forced_errors=True, retry=True)
+
+        self.model.driver.reload_model = False
+        self.run_cases(sequential=False, forced_errors=True, retry=True)
+
+        # Array outputs returned via shared memory.
+        self.model.driver.shared_array_threshold = 1
+        for case in self.cases:
+            case.add_output('driven.y')
+        self.model.driver.iterator = ListCaseIterator(self.cases)
+        results = ListCaseRecorder()
+        self.model.driver.recorders = [results]
+        self.model.driver.error_policy = 'RETRY'
+        self.model.run()
+        self.assertEqual(len(results), len(self.cases))
+        for case in results.cases:
+            if case.msg is None:
+                self.assertEqual(list(case.get_output('driven.y')),
+                                 list(case.get_input('driven.y')))
+
+        # Shared array files are removed even if the run is aborted.
+        pattern = os.path.join(shmarray._SHM_DIR or tempfile.gettempdir(),
+                               'omshm-*')
+        before = set(glob.glob(pattern))
+        self.generate_cases(force_errors=True)
+        for case in self.cases:
+            case.add_output('driven.y')
+        self.model.driver.iterator = ListCaseIterator(self.cases)
+        self.model.driver.error_policy = 'ABORT'
+        try:
+            self.model.run()
+        except RuntimeError:
+            pass
+        else:
+            self.fail('Expected RuntimeError')
+        self.assertEqual(set(glob.glob(pattern)) - before, set())
+
+    def test_case_timeout(self):
+        logging.debug('')
+        logging.debug('test_case_timeout')
+        init_cluster(encrypted=True, allow_shell=True)
+        self.cases[3].add_input('driven.sleep', 10.)
+        self.model.driver.case_timeout = 2.
+        self.model.driver.speculative = True
+        self.model.driver.max_retries = 0
+        self.model.driver.sequential = False
+        self.model.driver.iterator = ListCaseIterator(self.cases)
+        results = ListCaseRecorder()
+        self.model.driver.recorders = [results]
+        self.model.driver.error_policy = 'RETRY'
+        self.model.run()
+
+        self.assertEqual(len(results), len(self.cases))
+        for case in results.cases:
+            if case.label == '3':
+                self.assertTrue(case.msg.startswith('driver: Case timed out'))
+            else:
+                self.assertEqual(case.msg, None)
+                self.assertEqual(case['driven.rosen_suzuki'],
+                                 rosen_suzuki(case['driven.x']))
+            self.assertTrue(case.exec_time is not None)
+
     def test_unencrypted(self):
         logging.debug('')
         logging.debug('test_unencrypted')
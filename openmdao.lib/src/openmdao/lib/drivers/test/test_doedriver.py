@@ -16,9 +16,10 @@ from openmdao.main.api import Assembly, Component, set_as_top
 from openmdao.lib.datatypes.api import Float, Bool
 from openmdao.lib.casehandlers.api import SequenceCaseFilter
 from openmdao.lib.drivers.doedriver import DOEdriver, NeighborhoodDOEdriver
-from openmdao.lib.casehandlers.api import ListCaseRecorder, DumpCaseRecorder
+from openmdao.lib.casehandlers.api import ListCaseRecorder, DumpCaseRecorder, \
+                                         CSVCaseRecorder
 from openmdao.lib.doegenerators.api import OptLatinHypercube, FullFactorial, \
-                                           CSVFile
+                                           CSVFile, Uniform
 
 # Capture original working directory so we can restore in tearDown().
 ORIG_DIR = os.getcwd()
@@ -244,6 +245,21 @@ class TestCaseDOE(unittest.TestCase):
                           RuntimeError, "driver: Run aborted:"
                           " RuntimeError('driven: Forced error',)")
 
+    def test_blocks(self):
+        self.model.driver.DOEgenerator = FullFactorial(num_levels=3)
+        self.model.driver.block_size = 7
+        results = ListCaseRecorder()
+        self.model.driver.recorders = [results]
+        self.model.run()
+
+        self.assertEqual(len(results), 81)
+        expected = [-10., 0., 10.]
+        for i, case in enumerate(results.cases):
+            self.assertEqual(case['driven.x0'], case['driven.y0'])
+            self.assertEqual(case['driven.x0'], expected[(i/27) % 3])
+            self.assertEqual(case['driven.x3'], expected[i % 3])
+        self.verify_results()
+
     def test_scaling(self):
         self.model.driver.DOEgenerator = ff = FullFactorial(num_levels=3)
         ff.num_parameters = 4
@@ -283,6 +299,41 @@ class TestCaseDOE(unittest.TestCase):
         for i, case in enumerate(rerun.cases):
             self.assertEqual(case, orig_cases[rerun_seq[i]])
 
+    def test_rerun_recorded(self):
+        logging.debug('')
+        logging.debug('test_rerun_recorded')
+
+        # Rerun from cases recorded by a CSVCaseRecorder. The broadcast
+        # parameter records an extra input column.
+        filename = 'recorded.csv'
+        try:
+            self.model.driver.DOEgenerator = Uniform(num_samples=10)
+            self.model.driver.record_doe = False
+            recorder = CSVCaseRecorder(filename=filename)
+            results = ListCaseRecorder()
+            self.model.driver.recorders = [recorder, results]
+            self.model.run()
+            recorder.close()
+            orig_cases = results.cases
+
+            self.model.driver.DOEgenerator = CSVFile(filename)
+            rerun = ListCaseRecorder()
+            self.model.driver.recorders = [rerun]
+            self.model.run()
+
+            self.assertEqual(len(orig_cases), 10)
+            self.assertEqual(len(rerun.cases), 10)
+            names = ['driven.x0', 'driven.y0', 'driven.x1', 'driven.x2',
+                     'driven.x3']
+            for case, orig in zip(rerun.cases, orig_cases):
+                for name in names:
+                    self.assertAlmostEqual(case[name], orig[name], places=10)
+                self.assertTrue(-10. <= case['driven.x1'] <= 10.)
+            self.verify_results()
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+
 
 class MyModel2(Assembly):
     """ Use DOEdriver with DrivenComponent. """
@@ -276,11 +276,24 @@ class Assembly (Component):
         
         self._exprmapper = ExprMapper(self)
         
+        # (childname, outs, force) tuples collected while invalidation
+        # is being batched, and the nesting depth of the batch
+        self._invalidation_batch = []
+        self._batch_depth = 0
+        
         # default Driver executes its workflow once
         self.add('driver', Run_Once())
         
         set_as_top(self, first_only=True) # we're the top Assembly only if we're the first instantiated
         
+    def __setstate__(self, state):
+        super(Assembly, self).__setstate__(state)
+
+        # state saved before invalidation batching was added lacks these.
+        if '_invalidation_batch' not in self.__dict__:
+            self._invalidation_batch = []
+            self._batch_depth = 0
+
     @rbac(('owner', 'user'))
     def set_itername(self, itername, seqno=0):
         """
@@ -629,6 +642,7 @@ class Assembly (Component):
         """Execute a single child component and return."""
         self.driver.step()
         
+    @rbac('*', 'owner')
     def stop(self):
         """Stop the calculation."""
         self.driver.stop()
@@ -717,10 +731,61 @@ class Assembly (Component):
         """Invalidate all variables that depend on the outputs provided
         by the child that has been invalidated.
         """
+        if self._batch_depth:
+            self._invalidation_batch.append((childname, outs, force))
+            return []
         bouts = self._depgraph.invalidate_deps(self, [childname], [outs], force)
         if bouts and self.parent:
             self.parent.child_invalidated(self.name, bouts, force)
         return bouts
+
+    def begin_invalidation_batch(self):
+        """Defer the invalidation of downstream variables caused by
+        changes to our children until :meth:`end_invalidation_batch` is
+        called. This allows many inputs to be set (for example by
+        a driver setting all of its parameters) while walking the
+        dependency graph only once. Calls may be nested.
+        """
+        self._batch_depth += 1
+
+    def end_invalidation_batch(self):
+        """End a batch started by :meth:`begin_invalidation_batch`. When
+        the outermost batch ends, all of the invalidations collected during
+        the batch are combined and propagated in a single pass. Returns
+        the list of newly invalidated boundary outputs.
+        """
+        if self._batch_depth == 0:
+            self.raise_exception('end_invalidation_batch called without '
+                                 'a matching begin_invalidation_batch',
+                                 RuntimeError)
+        self._batch_depth -= 1
+        if self._batch_depth or not self._invalidation_batch:
+            return []
+
+        batch = self._invalidation_batch
+        self._invalidation_batch = []
+
+        # combine entries for the same child. outs of None means that all
+        # outputs of that child were invalidated.
+        combined = { False: {}, True: {} }
+        for childname, outs, force in batch:
+            merged = combined[force]
+            if outs is None or merged.get(childname, ()) is None:
+                merged[childname] = None
+            else:
+                merged.setdefault(childname, set()).update(outs)
+
+        bouts = set()
+        for force, merged in combined.items():
+            if merged:
+                names = merged.keys()
+                outs = self._depgraph.invalidate_deps(self, names,
+                                                  [merged[n] for n in names],
+                                                  force)
+                if outs and self.parent:
+                    self.parent.child_invalidated(self.name, outs, force)
+                bouts.update(outs)
+        return list(bouts)
                     
     def invalidate_deps(self, varnames=None, force=False):
         """Mark all Variables invalid that depend on varnames. 
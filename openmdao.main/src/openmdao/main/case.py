@@ -2,6 +2,7 @@
 from uuid import uuid1
 import re
 from array import array
+import threading
 import traceback
 from StringIO import StringIO
 from inspect import getmro
@@ -15,6 +16,34 @@ __all__ = ["Case"]
 class _Missing(object):
     pass
 
+# Result of is_legal_name() for each name seen, shared by all Cases.
+_legal_names = {}
+
+# Per-thread ExprEvaluators, keyed by expression. An ExprEvaluator's compiled
+# code depends on the last scope it was used with, so they aren't shared
+# between threads.
+_local = threading.local()
+
+def _get_expr(name):
+    """Return the interned ExprEvaluator for `name`, or None if `name` is
+    a simple variable name rather than an expression.
+    """
+    legal = _legal_names.get(name)
+    if legal is None:
+        legal = _legal_names[name] = is_legal_name(name)
+    if legal:
+        return None
+    try:
+        exprs = _local.exprs
+    except AttributeError:
+        exprs = _local.exprs = {}
+    expr = exprs.get(name)
+    # Replace evaluators whose last scope has been deleted, since they
+    # raise an exception when given a new scope.
+    if expr is None or (expr._scope is not None and expr._scope() is None):
+        expr = exprs[name] = ExprEvaluator(name)
+    return expr
+
 def _simpleflatten(name, obj):
     return [(name, obj)]
 
@@ -64,7 +93,17 @@ class Case(object):
     containing error messages associated with the running of the case (if
     any), and a unique case identifier. 
 
+    Since large numbers of Cases may be created, attributes are kept in
+    slots and the unique identifier isn't generated until it's first used.
+    Expressions are parsed when the Case is applied or updated, using
+    ExprEvaluators shared by all Cases.
     """
+
+    # '__dict__' allows other attributes to be added as needed.
+    __slots__ = ('_inputs', '_outputs', '_uuid', 'max_retries', 'retries',
+                 'msg', 'label', 'exec_time', 'speculated', 'parent_uuid',
+                 '__dict__', '__weakref__')
+
     def __init__(self, inputs=None, outputs=None, max_retries=None,
                  retries=None, label='', case_uuid=None, parent_uuid='', 
                  msg=None):
@@ -74,7 +113,6 @@ class Case(object):
         an iterator that returns strings containing names or expressions.
         
         """
-        self._exprs = None
         self._outputs = None
         self._inputs = {}
 
@@ -83,10 +121,12 @@ class Case(object):
         self.msg = msg                  # If non-null, error message.
                                         # Implies outputs are invalid. 
         self.label = label   # optional label
+        self.exec_time = None   # Evaluation wall-clock time, if known.
+        self.speculated = False # True if evaluation was duplicated.
         if case_uuid:
-            self.uuid = str(case_uuid)
+            self._uuid = str(case_uuid)
         else:
-            self.uuid = str(uuid1())  # unique identifier
+            self._uuid = None  # unique identifier, generated when needed
         self.parent_uuid = str(parent_uuid)  # identifier of parent case, if any
 
         if inputs: 
@@ -94,6 +134,31 @@ class Case(object):
         if outputs:
             self.add_outputs(outputs)
 
+    @property
+    def uuid(self):
+        """Unique identifier for this Case."""
+        if self._uuid is None:
+            self._uuid = str(uuid1())
+        return self._uuid
+
+    @uuid.setter
+    def uuid(self, value):
+        self._uuid = value
+
+    def __getstate__(self):
+        """Return dict representing this Case's state."""
+        state = dict(getattr(self, '__dict__', {}))
+        state['_uuid'] = self.uuid  # Copies must have the same uuid.
+        for name in Case.__slots__:
+            if name not in ('_uuid', '__dict__', '__weakref__'):
+                state[name] = getattr(self, name, None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore this Case's state."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __str__(self):
         if self._outputs:
             outs = self._outputs.items()
@@ -243,7 +308,7 @@ class Case(object):
         yet.
         """
         self.parent_uuid = ''
-        self.uuid = str(uuid1())
+        self._uuid = None
         self.retries = None
         for key in self._outputs.keys():
             self._outputs[key] = _Missing
@@ -253,15 +318,11 @@ class Case(object):
         to the specified scope.
         """
         scope._case_id = self.uuid
-        if self._exprs:
-            for name,value in self._inputs.items():
-                expr = self._exprs.get(name)
-                if expr:
-                    expr.set(value, scope)
-                else:
-                    scope.set(name, value)
-        else:
-            for name,value in self._inputs.items():
+        for name,value in self._inputs.items():
+            expr = _get_expr(name)
+            if expr:
+                expr.set(value, scope)
+            else:
                 scope.set(name, value)
 
     def update_outputs(self, scope, msg=None):
@@ -270,32 +331,20 @@ class Case(object):
         self.msg = msg
         last_excpt = None
         if self._outputs is not None:
-            if self._exprs:
-                for name in self._outputs.keys():
-                    expr = self._exprs.get(name)
-                    try:
-                        if expr:
-                            self._outputs[name] = expr.evaluate(scope)
-                        else:
-                            self._outputs[name] = scope.get(name)
-                    except Exception as err:
-                        last_excpt = TracedError(err, traceback.format_exc())
-                        self._outputs[name] = _Missing
-                        if self.msg is None:
-                            self.msg = str(err)
-                        else:
-                            self.msg = self.msg + " %s" % err
-            else:
-                for name in self._outputs.keys():
-                    try:
+            for name in self._outputs.keys():
+                expr = _get_expr(name)
+                try:
+                    if expr:
+                        self._outputs[name] = expr.evaluate(scope)
+                    else:
                         self._outputs[name] = scope.get(name)
-                    except Exception as err:
-                        last_excpt = TracedError(err, traceback.format_exc())
-                        self._outputs[name] = _Missing
-                        if self.msg is None:
-                            self.msg = str(err)
-                        else:
-                            self.msg = self.msg + " %s" % err
+                except Exception as err:
+                    last_excpt = TracedError(err, traceback.format_exc())
+                    self._outputs[name] = _Missing
+                    if self.msg is None:
+                        self.msg = str(err)
+                    else:
+                        self.msg = self.msg + " %s" % err
         if last_excpt:
             raise last_excpt
             
@@ -309,7 +358,6 @@ class Case(object):
         value: 
             Value that the input will be assigned to.
         """
-        self._register_expr(name)
         self._inputs[name] = value
         
     def add_inputs(self, inp_iter):
@@ -327,7 +375,6 @@ class Case(object):
         name: str
             Name of output to be added.
         """
-        self._register_expr(name)
         if self._outputs is None:
             self._outputs = { name: value }
         else:
@@ -361,15 +408,3 @@ class Case(object):
                 raise KeyError("'%s' is not part of this Case" % name)
         return Case(inputs=ins, outputs=outs, parent_uuid=self.parent_uuid,
                     max_retries=self.max_retries)
-
-        
-    def _register_expr(self, s):
-        """If the given string contains an expression, create an ExprEvaluator and
-        store it in self._exprs.
-        """
-        if not is_legal_name(s):
-            expr =  ExprEvaluator(s)
-            if self._exprs is None:
-                self._exprs = {}
-            self._exprs[s] = expr
-
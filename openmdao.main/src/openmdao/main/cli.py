@@ -154,6 +154,35 @@ def _get_openmdao_parser():
     except ImportError: 
         pass
 
+    try:
+        from openmdao.lib.architectures.mdao_benchmark import cli_benchmark
+        parser = subparsers.add_parser('benchmark', help='run the framework overhead benchmarks')
+        parser.set_defaults(func=cli_benchmark)
+        parser.add_argument("-c","--n_comps",action="store",type=int, nargs="+",
+                            dest="n_comps", default=[10, 100],
+                            help="Numbers of components in the chain benchmark.")
+        parser.add_argument("-n","--n_conns",action="store",type=int, nargs="+",
+                            dest="n_conns", default=[1, 10],
+                            help="Numbers of connections between chain components.")
+        parser.add_argument("-i","--iterations",action="store",type=int,
+                            dest="iterations", default=100,
+                            help="Number of runs of each chain model.")
+        parser.add_argument("-a","--arch",action="store",type=str, nargs="+",
+                            dest="archs", default=[], metavar="arch_class_name",
+                            help="Architecture class names to benchmark on the scalable problem.")
+        parser.add_argument("-d","--n_disciplines",action="store",type=int, nargs="+",
+                            dest="n_disciplines", default=[3],
+                            help="Numbers of disciplines for the architecture benchmark.")
+        parser.add_argument("-s","--prob_size",action="store",type=int, nargs="+",
+                            dest="prob_sizes", default=[3],
+                            help="Problem sizes for the architecture benchmark.")
+        parser.add_argument("-o","--output",action="store",type=str,
+                            dest="output", default=None, metavar="FILE",
+                            help="Write results as JSON to this file.")
+
+    except ImportError: 
+        pass
+
     # the following subcommands will only be available in a gui build
     try:
         import openmdao.gui.omg as gui
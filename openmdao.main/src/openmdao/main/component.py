@@ -37,6 +37,7 @@ from openmdao.main.rbac import rbac
 from openmdao.main.mp_support import has_interface, is_instance
 from openmdao.main.datatypes.slot import Slot
 from openmdao.main.publisher import Publisher
+import openmdao.main.exechooks as exechooks
 
 import openmdao.util.log as tracing
 
@@ -105,8 +106,72 @@ class DirectoryContext(object):
         self.component = weakref.ref(self.component)
 
 
+class _ValidityDict(object):
+    """Mapping of io variable name to its validity flag.  The names of
+    invalid variables are also kept in the `invalid` set, which is updated
+    incrementally whenever a flag changes, so checking whether anything is
+    invalid doesn't require a scan of every variable.
+    """
+
+    def __init__(self, items=()):
+        self._valids = {}
+        self.invalid = set()
+        for name, valid in items:
+            self[name] = valid
+
+    def __getitem__(self, name):
+        return self._valids[name]
+
+    def __setitem__(self, name, valid):
+        self._valids[name] = valid
+        if valid:
+            self.invalid.discard(name)
+        else:
+            self.invalid.add(name)
+
+    def __delitem__(self, name):
+        del self._valids[name]
+        self.invalid.discard(name)
+
+    def __contains__(self, name):
+        return name in self._valids
+
+    def __iter__(self):
+        return iter(self._valids)
+
+    def __len__(self):
+        return len(self._valids)
+
+    def get(self, name, default=None):
+        return self._valids.get(name, default)
+
+    def keys(self):
+        return self._valids.keys()
+
+    def values(self):
+        return self._valids.values()
+
+    def items(self):
+        return self._valids.items()
+
+
 _iodict = {'out': 'output', 'in': 'input'}
 
+# Maps class to whether its executions are traced (not an assembly or driver).
+_traced_classes = {}
+
+def _is_traced(comp):
+    """ Return True if executions of `comp` are traced. """
+    cls = comp.__class__
+    try:
+        return _traced_classes[cls]
+    except KeyError:
+        traced = not obj_has_interface(comp, IAssembly) and \
+                 not obj_has_interface(comp, IDriver)
+        _traced_classes[cls] = traced
+        return traced
+
+
 __attributes__ = '__attributes__'
 
 
@@ -144,7 +209,7 @@ class Component(Container):
 
         # contains validity flag for each io Trait (inputs are valid since they're not connected yet,
         # and outputs are invalid)
-        self._valid_dict = dict([(name, t.iotype == 'in') \
+        self._valid_dict = _ValidityDict([(name, t.iotype == 'in') \
             for name, t in self.class_traits().items() if t.iotype])
 
         # dependency graph between us and our boundaries (bookkeeps connections between our
@@ -171,6 +236,12 @@ class Component(Container):
         self._connected_inputs = None
         self._connected_outputs = None
 
+        # set versions of the cached name lists, for fast membership tests
+        self._input_set = None
+        self._output_set = None
+        self._connected_input_set = None
+        self._connected_output_set = None
+
         self.exec_count = 0
         self.derivative_exec_count = 0
         self.create_instance_dir = False
@@ -204,15 +275,19 @@ class Component(Container):
     @rbac(('owner', 'user'))
     def get_itername(self):
         """Return current 'iteration coordinates'."""
-        return self._itername
+        itername = self._itername
+        if isinstance(itername, tuple):  # deferred by a lean workflow
+            itername = self._itername = '%s-%d' % itername
+        return itername
 
     @rbac(('owner', 'user'))
     def set_itername(self, itername):
         """Set current 'iteration coordinates'. Typically called by the
         current workflow just before running the component.
 
-        itername: string
-            Iteration coordinates.
+        itername: string or tuple
+            Iteration coordinates, or a tuple of the form ``(base, count)``
+            which will be formatted as ``'base-count'`` only if requested.
         """
         self._itername = itername
 
@@ -224,7 +299,11 @@ class Component(Container):
                 #name = n
         self._input_check(name, old)
         self._call_execute = True
-        self._input_updated(name)
+        if exechooks.HOOKS:
+            exechooks.run_activity(self, exechooks.INVALIDATE,
+                                   self._input_updated, name)
+        else:
+            self._input_updated(name)
 
     def _input_updated(self, name):
         if self._valid_dict[name]:  # if var is not already invalid
@@ -242,12 +321,20 @@ class Component(Container):
         state['_expr_sources'] = None
         state['_connected_inputs'] = None
         state['_connected_outputs'] = None
+        state['_input_set'] = None
+        state['_output_set'] = None
+        state['_connected_input_set'] = None
+        state['_connected_output_set'] = None
 
         return state
 
     def __setstate__(self, state):
         super(Component, self).__setstate__(state)
 
+        # state saved before validity tracking was added has a plain dict.
+        if isinstance(self._valid_dict, dict):
+            self._valid_dict = _ValidityDict(self._valid_dict.items())
+
         # make sure all input callbacks are in place.  If callback is
         # already there, this will have no effect.
         for name, trait in self._alltraits().items():
@@ -351,15 +438,19 @@ class Component(Container):
                                  # so Variable validity doesn't apply. Just execute.
             self._call_execute = True
             valids = self._valid_dict
-            for name in self.list_inputs():
+            for name in self.list_inputs(valid=False):
                 valids[name] = True
         else:
             valids = self._valid_dict
-            invalid_ins = [inp for inp in self.list_inputs(connected=True)
-                                    if valids.get(inp) is False]
+            invalid_ins = self.list_inputs(valid=False, connected=True)
             if invalid_ins:
                 self._call_execute = True
-                self.parent.update_inputs(self.name, invalid_ins)
+                if exechooks.HOOKS:
+                    exechooks.run_activity(self, exechooks.TRANSFER,
+                                           self.parent.update_inputs,
+                                           self.name, invalid_ins)
+                else:
+                    self.parent.update_inputs(self.name, invalid_ins)
                 for name in invalid_ins:
                     valids[name] = True
             elif self._call_execute == False and len(self.list_outputs(valid=False)):
@@ -473,30 +564,38 @@ class Component(Container):
             if self._call_execute or force:
                 #print 'execute: %s' % self.get_pathname()
 
-                if ffd_order == 1 and \
-                   hasattr(self, 'calculate_first_derivatives'):
-                    # During Fake Finite Difference, the available derivatives
-                    # are used to approximate the outputs.
-                    self._execute_ffd(1)
-
-                elif ffd_order == 2 and \
-                   hasattr(self, 'calculate_second_derivatives'):
-                    # During Fake Finite Difference, the available derivatives
-                    # are used to approximate the outputs.
-                    self._execute_ffd(2)
+                hooks = exechooks.HOOKS
+                if hooks:
+                    for hook in hooks:
+                        hook.pre_execute(self)
+                try:
+                    if ffd_order == 1 and \
+                       hasattr(self, 'calculate_first_derivatives'):
+                        # During Fake Finite Difference, the available derivatives
+                        # are used to approximate the outputs.
+                        self._execute_ffd(1)
+
+                    elif ffd_order == 2 and \
+                       hasattr(self, 'calculate_second_derivatives'):
+                        # During Fake Finite Difference, the available derivatives
+                        # are used to approximate the outputs.
+                        self._execute_ffd(2)
 
-                else:
-                    # Component executes as normal
-                    self.exec_count += 1
-                    if tracing.TRACER is not None and \
-                        not obj_has_interface(self, IAssembly) and \
-                        not obj_has_interface(self, IDriver):
+                    else:
+                        # Component executes as normal
+                        self.exec_count += 1
+                        if tracing.TRACER is not None and _is_traced(self):
                             tracing.TRACER.debug(self.get_itername())
-                    self.execute()
+                        self.execute()
+                finally:
+                    if hooks:
+                        for hook in hooks:
+                            hook.post_execute(self)
 
                 self._post_execute()
-            #else:
-                #print 'skipping: %s' % self.get_pathname()
+            elif exechooks.HOOKS:
+                for hook in exechooks.HOOKS:
+                    hook.skipped(self)
             self._post_run()
         except:
             self._set_exec_state('INVALID')
@@ -602,7 +701,7 @@ class Component(Container):
         """Return False if any of our variables is invalid."""
         if self._call_execute:
             return False
-        if False in self._valid_dict.values():
+        if self._valid_dict.invalid:
             self._call_execute = True
             return False
         if self.parent is not None:
@@ -665,6 +764,10 @@ class Component(Container):
         self._output_names = None
         self._connected_inputs = None
         self._connected_outputs = None
+        self._input_set = None
+        self._output_set = None
+        self._connected_input_set = None
+        self._connected_output_set = None
         self._container_names = None
         self._expr_sources = None
         self._call_check_config = True
@@ -684,8 +787,10 @@ class Component(Container):
         if self._connected_inputs is None:
             nset = set([k for k, v in self.items(iotype='in')])
             self._connected_inputs = self._depgraph.get_connected_inputs()
+            self._connected_input_set = set(self._connected_inputs)
             nset.update(self._connected_inputs)
             self._input_names = list(nset)
+            self._input_set = nset
 
         if valid is None:
             if connected is None:
@@ -693,16 +798,20 @@ class Component(Container):
             elif connected is True:
                 return self._connected_inputs
             else:  # connected is False
-                return [n for n in self._input_names if n not in self._connected_inputs]
+                return [n for n in self._input_names
+                                 if n not in self._connected_input_set]
 
         valids = self._valid_dict
-        ret = self._input_names
-        ret = [n for n in ret if valids[n] == valid]
+        if valid:
+            ret = [n for n in self._input_names if valids[n]]
+        else:  # only look at the names we know are invalid
+            names = self._input_set
+            ret = [n for n in valids.invalid if n in names]
 
         if connected is True:
-            return [n for n in ret if n in self._connected_inputs]
+            return [n for n in ret if n in self._connected_input_set]
         elif connected is False:
-            return [n for n in ret if n not in self._connected_inputs]
+            return [n for n in ret if n not in self._connected_input_set]
 
         return ret  # connected is None, valid is not None
 
@@ -720,8 +829,10 @@ class Component(Container):
         if self._connected_outputs is None:
             nset = set([k for k, v in self.items(iotype='out')])
             self._connected_outputs = self._depgraph.get_connected_outputs()
+            self._connected_output_set = set(self._connected_outputs)
             nset.update(self._connected_outputs)
             self._output_names = list(nset)
+            self._output_set = nset
 
         if valid is None:
             if connected is None:
@@ -729,16 +840,20 @@ class Component(Container):
             elif connected is True:
                 return self._connected_outputs
             else:  # connected is False
-                return [n for n in self._output_names if n not in self._connected_outputs]
+                return [n for n in self._output_names
+                                 if n not in self._connected_output_set]
 
         valids = self._valid_dict
-        ret = self._output_names
-        ret = [n for n in ret if valids[n] == valid]
+        if valid:
+            ret = [n for n in self._output_names if valids[n]]
+        else:  # only look at the names we know are invalid
+            names = self._output_set
+            ret = [n for n in valids.invalid if n in names]
 
         if connected is True:
-            return [n for n in ret if n in self._connected_outputs]
+            return [n for n in ret if n in self._connected_output_set]
         elif connected is False:
-            return [n for n in ret if n not in self._connected_outputs]
+            return [n for n in ret if n not in self._connected_output_set]
 
         return ret  # connected is None, valid is not None
 
@@ -1402,6 +1517,7 @@ class Component(Container):
         """
         self.run()
 
+    @rbac('*', 'owner')
     def stop(self):
         """Stop this component."""
         self._stop = True
@@ -1446,12 +1562,11 @@ class Component(Container):
         if varnames is None:
             for var in self.list_inputs(connected=True):
                 valids[var] = False
-        else:
-            conn = self.list_inputs(connected=True)
-            if conn:
-                for var in varnames:
-                    if var in conn:
-                        valids[var] = False
+        elif self.list_inputs(connected=True):
+            conn = self._connected_input_set
+            for var in varnames:
+                if var in conn:
+                    valids[var] = False
 
         # this assumes that all outputs are either valid or invalid
         if not force and outs and (valids[outs[0]] is False):
@@ -1510,6 +1625,8 @@ class Component(Container):
                 obj.register_published_vars('.'.join(parts[1:]), publish)
 
     def publish_vars(self):
+        if not self._publish_vars:  # nothing subscribed, skip the lookup
+            return
         pub = Publisher.get_instance()
         if pub:
             pub_vars = self._publish_vars.keys()
@@ -88,6 +88,14 @@ class DependencyGraph(object):
         self._graph.add_nodes_from(_fakes)
         self._allsrcs = {}
         
+        # cache of (srcnode, varset) -> [(destnode, destvars), ...]
+        # used during invalidation. Cleared whenever connectivity changes.
+        self._fanout_cache = {}
+        
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._fanout_cache = {}
+        
     def __contains__(self, compname):
         """Return True if this graph contains the given component."""
         return compname in self._graph
@@ -115,6 +123,7 @@ class DependencyGraph(object):
     def add(self, name):
         """Add the name of a Component to the graph."""
         self._graph.add_node(name)
+        self._fanout_cache.clear()
 
     def remove(self, name):
         """Remove the name of a Component from the graph. It is not
@@ -122,6 +131,7 @@ class DependencyGraph(object):
         """
         self.disconnect(name)
         self._graph.remove_node(name)
+        self._fanout_cache.clear()
                                     
     def invalidate_deps(self, scope, cnames, varsets, force=False):
         """Walk through all dependent nodes in the graph, invalidating all
@@ -145,24 +155,42 @@ class DependencyGraph(object):
         outset = set()  # set of changed boundary outputs
         while(stack):
             src, varset = stack.pop()
-            for dest, link in self.out_links(src):
-                #if varset is None:
-                #    srcvars = set(link._srcs.keys())
-                #else:
-                #    srcvars = varset
+            for dest, dests in self._get_fanout(src, varset):
                 if dest == '@bout':
-                    bouts = link.get_dests(varset)
-                    outset.update(bouts)
-                    scope.set_valid(bouts, False)
+                    outset.update(dests)
+                    scope.set_valid(dests, False)
                 else:
-                    dests = link.get_dests(varset)
-                    if dests:
-                        comp = getattr(scope, dest)
-                        outs = comp.invalidate_deps(varnames=dests, force=force)
-                        if (outs is None) or outs:
-                            stack.append((dest, outs))
+                    comp = getattr(scope, dest)
+                    outs = comp.invalidate_deps(varnames=dests, force=force)
+                    if (outs is None) or outs:
+                        stack.append((dest, outs))
         return outset
 
+    def _get_fanout(self, src, varset):
+        """Return a list of tuples of the form (destnode, destvars) for each
+        node that is directly connected to the given source variables of node
+        `src`. If `varset` is None, all outputs of `src` are used.  Results
+        are cached until the next change in connectivity.
+        
+        Only the direct fanout can be cached because whether invalidation
+        proceeds past a node depends on that node's current validity.
+        """
+        if varset is None:
+            key = (src, None)
+        else:
+            key = (src, frozenset(varset))
+        try:
+            return self._fanout_cache[key]
+        except KeyError:
+            pass
+        fanout = []
+        for dest, link in self.out_links(src):
+            dests = link.get_dests(varset)
+            if dests:
+                fanout.append((dest, dests))
+        self._fanout_cache[key] = fanout
+        return fanout
+
     def list_connections(self, show_passthrough=True):
         """Return a list of tuples of the form (outvarname, invarname).
         """
@@ -288,6 +316,7 @@ class DependencyGraph(object):
         """Add an edge to our Component graph from 
         *srccompname* to *destcompname*. 
         """
+        self._fanout_cache.clear()
         graph = self._graph
         srccompname, srcvarname, destcompname, destvarname = \
                            _cvt_names_to_graph(srcpath, destpath)
@@ -395,6 +424,7 @@ class DependencyGraph(object):
                 self.disconnect(src, dest)
             return
 
+        self._fanout_cache.clear()
         graph = self._graph
         srccompname, srcvarname, destcompname, destvarname = \
                            _cvt_names_to_graph(srcpath, destpath)
@@ -4,6 +4,8 @@
 __all__ = ["Driver"]
 
 import fnmatch
+import sys
+import threading
 
 from enthought.traits.api import List
 
@@ -25,6 +27,10 @@ from openmdao.main.mp_support import is_instance, has_interface
 from openmdao.main.rbac import rbac
 from openmdao.main.datatypes.api import Slot, Str
 
+# Per-thread number of running drivers and drivers whose recorders
+# are to be flushed when the outermost driver is done.
+_running = threading.local()
+
 
 @add_delegate(HasEvents)
 class Driver(Component):
@@ -178,9 +184,47 @@ class Driver(Component):
             If applied to the top-level assembly, this will be prepended to
             all iteration coordinates.
         """
-        # Override just to reset the workflow :-(
+        # Override to reset the workflow and flush recorders once the
+        # outermost driver is done.
         self.workflow.reset()
-        super(Driver, self).run(force, ffd_order, case_id)
+        depth = getattr(_running, 'depth', 0)
+        if depth == 0:
+            _running.drivers = []
+        _running.depth = depth + 1
+        if self.recorders and self not in _running.drivers:
+            _running.drivers.append(self)
+        try:
+            super(Driver, self).run(force, ffd_order, case_id)
+        except:
+            exc_info = sys.exc_info()
+            _running.depth = depth
+            if depth == 0:
+                # Don't hide the original exception.
+                self._flush_recorders(log_errors=True)
+            raise exc_info[0], exc_info[1], exc_info[2]
+        _running.depth = depth
+        if depth == 0:
+            self._flush_recorders()
+
+    def _flush_recorders(self, log_errors=False):
+        """
+        Have any recorders which buffer cases, for this driver and drivers
+        run within it, finish recording them.
+        If `log_errors`, errors are logged rather than raised.
+        """
+        drivers, _running.drivers = _running.drivers, []
+        for driver in drivers:
+            for recorder in driver.recorders:
+                flush = getattr(recorder, 'flush', None)
+                if flush is None:
+                    continue
+                try:
+                    flush()
+                except Exception as exc:
+                    if not log_errors:
+                        raise
+                    self._logger.error('flush of %s failed: %r',
+                                       recorder, exc)
 
     def execute(self):
         """ Iterate over a workflow of Components until some condition
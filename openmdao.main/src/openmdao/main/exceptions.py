@@ -33,6 +33,10 @@ class TracedError(Exception):
     def __repr__(self):
         return "%s%s" % (self.__class__.__name__, self.args)
     
+    def __reduce__(self):
+        # So it can be returned from a remote server.
+        return (self.__class__, (self.orig_exc, self.traceback))
+    
     def reraise(self, with_traceback=True):
         if with_traceback:
             raise self.orig_exc.__class__(self.traceback)
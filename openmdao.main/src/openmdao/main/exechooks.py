@@ -0,0 +1,137 @@
+"""
+Hooks that are called around the execution of every Component.
+
+Instrumentation such as profiling should register an :class:`ExecHook`
+rather than adding work to :meth:`Component.run`. When no hooks are
+registered the only cost to a run is a test of an empty tuple.
+"""
+
+__all__ = ['ExecHook', 'register_exec_hook', 'unregister_exec_hook',
+           'get_exec_hooks', 'run_activity',
+           'TRANSFER', 'INVALIDATE', 'DERIVATIVES']
+
+# Activities other than execution which hooks are notified of.
+TRANSFER = 'transfer'        # Transfer of data to invalid inputs.
+INVALIDATE = 'invalidate'    # Invalidation due to an input being set.
+DERIVATIVES = 'derivatives'  # Calculation of derivatives.
+
+# Registered hooks.  This is replaced rather than modified so that it can
+# be iterated without locking while hooks are being added or removed.
+HOOKS = ()
+
+
+class ExecHook(object):
+    """
+    Base class for execution hooks. Override whichever methods are of
+    interest; the defaults do nothing.
+    """
+
+    def pre_execute(self, comp):
+        """
+        Called just before `comp` executes.
+
+        comp: Component
+            The component about to execute.
+        """
+        pass
+
+    def post_execute(self, comp):
+        """
+        Called just after `comp` executes, whether or not execution
+        raised an exception.
+
+        comp: Component
+            The component that executed.
+        """
+        pass
+
+    def skipped(self, comp):
+        """
+        Called when `comp` is run but doesn't execute because it is
+        already valid.
+
+        comp: Component
+            The component that was skipped.
+        """
+        pass
+
+    def pre_activity(self, comp, activity):
+        """
+        Called just before `comp` starts `activity`.
+
+        comp: Component
+            The component performing the activity.
+
+        activity: string
+            One of :data:`TRANSFER`, :data:`INVALIDATE` or :data:`DERIVATIVES`.
+        """
+        pass
+
+    def post_activity(self, comp, activity):
+        """
+        Called just after `comp` finishes `activity`, whether or not it
+        raised an exception.
+
+        comp: Component
+            The component performing the activity.
+
+        activity: string
+            One of :data:`TRANSFER`, :data:`INVALIDATE` or :data:`DERIVATIVES`.
+        """
+        pass
+
+
+def register_exec_hook(hook):
+    """
+    Register `hook` to be called around each component execution.
+    Registering a hook that is already registered has no effect.
+
+    hook: :class:`ExecHook`
+        Hook to register.
+    """
+    global HOOKS
+    if hook not in HOOKS:
+        HOOKS = HOOKS + (hook,)
+
+
+def unregister_exec_hook(hook):
+    """
+    Remove `hook` from the registered hooks. It is not an error if `hook`
+    is not registered.
+
+    hook: :class:`ExecHook`
+        Hook to remove.
+    """
+    global HOOKS
+    HOOKS = tuple([h for h in HOOKS if h is not hook])
+
+
+def get_exec_hooks():
+    """ Return a tuple of the registered hooks. """
+    return HOOKS
+
+
+def run_activity(comp, activity, func, *args, **kwargs):
+    """
+    Call ``func(*args, **kwargs)``, notifying registered hooks that `comp`
+    is performing `activity`. Returns the result of `func`.
+    Callers should only use this if :data:`HOOKS` is non-empty.
+
+    comp: Component
+        The component performing the activity.
+
+    activity: string
+        One of :data:`TRANSFER`, :data:`INVALIDATE` or :data:`DERIVATIVES`.
+
+    func: callable
+        Performs the activity.
+    """
+    hooks = HOOKS
+    for hook in hooks:
+        hook.pre_activity(comp, activity)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        for hook in hooks:
+            hook.post_activity(comp, activity)
+
@@ -13,7 +13,10 @@ import fnmatch
 import os.path
 import string
 import sys
+import threading
+import time
 
+from openmdao.main import job_array
 from openmdao.main.mp_support import OpenMDAO_Manager, register
 from openmdao.main.objserverfactory import ObjServer
 from openmdao.main.rbac import rbac
@@ -45,6 +48,13 @@ class GridEngineAllocator(FactoryAllocator):
         in created servers. Since :meth:`execute_command` is required, this
         is defaulted to be True.
 
+    refresh_interval: float (seconds)
+        Time between `qhost` queries. While estimates are being requested,
+        host information is refreshed by a background thread. Servers
+        deployed since the last refresh are added to the load of the host
+        they are expected to run on. If zero, `qhost` is run for every
+        estimate.
+
     .. warning::
 
         There is a security risk with `allow_shell` True. Be careful to limit
@@ -57,6 +67,7 @@ class GridEngineAllocator(FactoryAllocator):
         pattern: *
         authkey: PublicKey
         allow_shell: True
+        refresh_interval: 30
         MPICH2: mpich
         OpenMPI: ompi
 
@@ -68,13 +79,21 @@ class GridEngineAllocator(FactoryAllocator):
     _QHOST = ['qhost']  # Replaced with path to fake for testing.
 
     def __init__(self, name='GridEngine', pattern='*', authkey=None,
-                 allow_shell=True):
+                 allow_shell=True, refresh_interval=30.):
         super(GridEngineAllocator, self).__init__(name, authkey, allow_shell)
         self.factory.manager_class = _ServerManager
         self.factory.server_classname = \
             'grid_engine_grid_engine_GridEngineServer'
         self.pattern = pattern
         self.category_map = {}
+        self.refresh_interval = refresh_interval
+        self._hosts_lock = threading.RLock()
+        self._hosts = None       # List of [hostname, ncpu, load] from qhost.
+        self._hostnames = None   # Cached result of _get_hosts().
+        self._refreshed = 0      # Time of last refresh.
+        self._queried = False    # Set by _get_hosts(), cleared by refresh.
+        self._deployed = {}      # Maps server to (hostname, cpus, time).
+        self._refresher = None
 
     def configure(self, cfg):
         """
@@ -92,6 +111,12 @@ class GridEngineAllocator(FactoryAllocator):
         if cfg.has_option(self.name, 'pattern'):
             self.pattern = cfg.get(self.name, 'pattern')
             self._logger.debug('    pattern: %s', self.pattern)
+        if cfg.has_option(self.name, 'refresh_interval'):
+            self.refresh_interval = cfg.getfloat(self.name, 'refresh_interval')
+            self._logger.debug('    refresh_interval: %s',
+                               self.refresh_interval)
+        with self._hosts_lock:
+            self._hosts = None  # Force refresh with new configuration.
         for category in JOB_CATEGORIES:
             if cfg.has_option(self.name, category):
                 parallel_environment = cfg.get(self.name, category)
@@ -190,17 +215,84 @@ class GridEngineAllocator(FactoryAllocator):
         return (0, {})
 
     def _get_hosts(self):
-        """ Return list of hostnames sorted by load. """
+        """ Return list of hostnames sorted by load, one entry per CPU. """
+        with self._hosts_lock:
+            self._queried = True
+            if self._hosts is None or \
+               (self._refresher is None and
+                time.time() - self._refreshed >= self.refresh_interval):
+                self._refresh()
+            if self._refresher is None and self.refresh_interval > 0:
+                self._refresher = threading.Thread(target=self._refresh_loop,
+                                                   name='%s-qhost' % self.name)
+                self._refresher.daemon = True
+                self._refresher.start()
+
+            if self._hostnames is None:
+                hostnames = []
+                for hostname, ncpu, load in self._ranked_hosts():
+                    hostnames.extend([hostname] * ncpu)
+                self._hostnames = hostnames
+            return self._hostnames
+
+    def _ranked_hosts(self):
+        """
+        Return host table sorted by CPU-adjusted load, including the load of
+        servers deployed since the last refresh.
+        """
+        pending = {}
+        for hostname, cpus, when in self._deployed.values():
+            pending[hostname] = pending.get(hostname, 0) + cpus
+        loads = [(hostname, ncpu, load + pending.get(hostname, 0))
+                 for hostname, ncpu, load in self._hosts]
+        return sorted(loads, key=lambda item: item[2] / item[1])
+
+    def _refresh_loop(self):
+        """
+        Refresh host table every `refresh_interval` seconds until an interval
+        passes without any estimates being requested.
+        """
+        while True:
+            time.sleep(self.refresh_interval)
+            with self._hosts_lock:
+                if not self._queried or self.refresh_interval <= 0:
+                    self._refresher = None
+                    return
+            # Don't hold up estimates while waiting for qhost.
+            started = time.time()
+            hosts = self._run_qhost()
+            with self._hosts_lock:
+                self._refresh(hosts, started)
+
+    def _refresh(self, hosts=None, started=None):
+        """
+        Update host table from `hosts` or `qhost`. Servers deployed after
+        `started` (when `hosts` was obtained) are still accounted for.
+        """
+        if hosts is None:
+            started = time.time()
+            hosts = self._run_qhost()
+        self._queried = False
+        self._refreshed = started
+        self._hosts = hosts
+        self._hostnames = None
+        for server, (hostname, cpus, when) in self._deployed.items():
+            if when < started:
+                del self._deployed[server]
+
+    def _run_qhost(self):
+        """ Return list of ``[hostname, ncpu, load]`` from `qhost`. """
         # Get host load information.
         try:
             proc = ShellProc(self._QHOST, stdout=PIPE)
+            lines = proc.stdout.readlines()
+            proc.wait()
         except Exception as exc:
             self._logger.error('%r failed: %s' % (self._QHOST, exc))
             return []
-        lines = proc.stdout.readlines()
 
-        # Reduce to hosts we're interested in and sort by CPU-adjusted load.
-        loads = []
+        # Reduce to hosts we're interested in.
+        hosts = []
         for line in lines:
             if line.startswith(('HOSTNAME', '-')):
                 continue
@@ -214,14 +306,7 @@ class GridEngineAllocator(FactoryAllocator):
                 ncpu = int(ncpu)
             except ValueError:
                 continue
-            loads.append((hostname, load / ncpu, ncpu))
-        loads = sorted(loads, key=lambda item: item[1])
-
-        # Return list of hostnames.
-        hosts = []
-        for hostname, load, ncpu in loads:
-            for i in range(ncpu):
-                hosts.append(hostname)
+            hosts.append([hostname, ncpu, load])
         return hosts
 
     @rbac('*')
@@ -243,13 +328,37 @@ class GridEngineAllocator(FactoryAllocator):
         server = super(GridEngineAllocator, self).deploy(name, resource_desc,
                                                          criteria)
         server.configure(self.category_map)
+
+        # Account for load until the next refresh.
+        with self._hosts_lock:
+            if self._hosts:
+                hostname = self._ranked_hosts()[0][0]
+                cpus = resource_desc.get('min_cpus', 1)
+                self._deployed[server] = (hostname, cpus, time.time())
+                self._hostnames = None
         return server
 
+    @rbac(('owner', 'user'))
+    def release(self, server):
+        """
+        Release `server`.
+
+        server: :class:`GridEngineServer`
+            Previously deployed server to be shut down.
+        """
+        with self._hosts_lock:
+            if self._deployed.pop(server, None) is not None:
+                self._hostnames = None
+        super(GridEngineAllocator, self).release(server)
+
 
 class GridEngineServer(ObjServer):
     """ Knows about executing a command via `qsub`. """
 
     _QSUB = ['qsub']  # Replaced with path to fake for testing.
+    _QSTAT = ['qstat']  # Replaced with path to fake for testing.
+
+    _monitor = None  # JobMonitor for job arrays.
 
     @rbac('owner')
     def configure(self, category_map):
@@ -365,8 +474,120 @@ class GridEngineServer(ObjServer):
 
         cmd = list(self._QSUB)
         cmd.extend(('-V', '-sync', 'yes', '-b', 'yes'))
+        options, env = self._qsub_options(resource_desc)
+        cmd.extend(options)
+
+        # Set default command configuration.
+        if not self.work_dir:
+            cmd.append('-cwd')
+        if 'input_path' not in resource_desc:
+            cmd.extend(('-i', DEV_NULL))
+        if 'output_path' not in resource_desc:
+            base = os.path.basename(resource_desc['remote_command'])
+            cmd.extend(('-o', '%s.stdout' % base))
+        if 'error_path' not in resource_desc and \
+           not resource_desc.get('join_files'):
+            cmd.extend(('-j', 'yes'))
+
+        # Add 'escape' clause.
+        if 'native_specification' in resource_desc:
+            cmd.extend(resource_desc['native_specification'])
+
+        cmd.append(self._fix_path(resource_desc['remote_command']))
+
+        if 'args' in resource_desc:
+            for arg in resource_desc['args']:
+                cmd.append(self._fix_path(arg))
+
+        self._logger.info('%r', ' '.join(cmd))
+        try:
+            process = ShellProc(cmd, DEV_NULL, 'qsub.out', STDOUT, env)
+        except Exception as exc:
+            self._logger.error('exception creating process: %s', exc)
+            raise
+
+        self._logger.debug('    PID = %d', process.pid)
+        return_code, error_msg = process.wait(1)
+        self._logger.debug('    returning %s', (return_code, error_msg))
+        return (return_code, error_msg)
+
+    @rbac('owner')
+    def execute_array(self, resource_descs, poll_delay=5.):
+        """
+        Submit a job array with one task per entry in `resource_descs` and
+        wait for all tasks to complete. Returns a list of
+        ``(return_code, error_msg)``, one per task.
+
+        resource_descs: list(dict)
+            Descriptions of commands and required resources.
+
+        poll_delay: float (seconds)
+            Time between `qstat` polls while waiting.
+
+        Rather than using '-sync yes', the job array is submitted with
+        ``-t 1-N`` and completion is detected by polling `qstat` from a
+        single background thread. The submitted script selects the command
+        for each task based on ``SGE_TASK_ID``.
+
+        'remote_command', 'args', 'job_environment', 'working_directory',
+        'input_path', 'output_path', 'error_path', and 'join_files' may differ
+        between tasks and are handled in the generated script. Defaults are
+        as for :meth:`execute_command`, except that the default output path
+        is ``<remote_command>.<index>.stdout``. All other keys apply to the
+        whole job, and must be the same in every description. They are
+        translated as for :meth:`execute_command`.
+
+        Job arrays are not supported on Windows.
+
+        Output from `qsub` itself is routed to ``qsub.out``.
+        """
+        if sys.platform == 'win32':  # pragma no cover
+            raise NotImplementedError('job arrays require a POSIX shell')
+
+        self.home_dir = os.path.expanduser('~')
+        self.work_dir = ''
+
+        job_desc, task_descs = job_array.split_descriptions(resource_descs)
+        if 'job_name' in job_desc:
+            base = self._jobname(job_desc['job_name'])
+        else:
+            base = os.path.basename(task_descs[0]['remote_command'])
+        script_name = os.path.join(os.getcwd(), '%s.array.qsub' % base)
+
+        commands = []
+        root = os.getcwd()
+        for i, task_desc in enumerate(task_descs):
+            self.work_dir = ''
+            if 'working_directory' in task_desc:
+                self.work_dir = self._fix_path(task_desc['working_directory'])
+            work_dir = os.path.join(root, self.work_dir)
+            commands.append(job_array.task_command(task_desc, i+1,
+                                                   self._fix_path, work_dir))
+        job_array.write_script(script_name, [], commands, 'SGE_TASK_ID',
+                               script_name+'.status')
+
+        cmd = list(self._QSUB)
+        cmd.extend(('-V', '-terse', '-t', '1-%d' % len(task_descs)))
+        options, env = self._qsub_options(job_desc)
+        cmd.extend(options)
+        cmd.extend(('-cwd', '-o', DEV_NULL, '-j', 'yes'))
+        if 'native_specification' in job_desc:
+            cmd.extend(job_desc['native_specification'])
+        cmd.append(script_name)
+
+        if self._monitor is None:
+            self._monitor = job_array.JobMonitor(self._QSTAT)
+        self._monitor.poll_delay = poll_delay
+        return job_array.submit(cmd, env, len(task_descs),
+                                script_name+'.status', self._monitor)
+
+    def _qsub_options(self, resource_desc):
+        """
+        Return ``(options, env)`` for `resource_desc`. `options` is the list
+        of `qsub` options other than defaults and 'native_specification'.
+        """
+        options = []
         env = None
-        inp, out, err = None, None, None
 
         # Set working directory now, for possible path fixing.
         try:
@@ -375,7 +596,7 @@ class GridEngineServer(ObjServer):
             pass
         else:
             self.work_dir = self._fix_path(value)
-            cmd.extend(('-wd', value))
+            options.extend(('-wd', value))
 
         # Process description in fixed, repeatable order.
         keys = ('submit_as_hold',
@@ -404,45 +625,40 @@ class GridEngineServer(ObjServer):
 
             if key == 'submit_as_hold':
                 if value:
-                    cmd.append('-h')
+                    options.append('-h')
             elif key == 'rerunnable':
-                cmd.extend(('-r', 'yes' if value else 'no'))
+                options.extend(('-r', 'yes' if value else 'no'))
             elif key == 'job_environment':
                 env = value
             elif key == 'email':
-                cmd.extend(('-M', ','.join(value)))
+                options.extend(('-M', ','.join(value)))
             elif key == 'email_on_started':
                 email_events += 'b'
             elif key == 'email_on_terminated':
                 email_events += 'e'
             elif key == 'job_name':
-                cmd.extend(('-N', self._jobname(value)))
+                options.extend(('-N', self._jobname(value)))
             elif key == 'input_path':
-                cmd.extend(('-i', self._fix_path(value)))
-                inp = value
+                options.extend(('-i', self._fix_path(value)))
             elif key == 'output_path':
-                cmd.extend(('-o', self._fix_path(value)))
-                out = value
+                options.extend(('-o', self._fix_path(value)))
             elif key == 'error_path':
-                cmd.extend(('-e', self._fix_path(value)))
-                err = value
+                options.extend(('-e', self._fix_path(value)))
             elif key == 'join_files':
-                cmd.extend(('-j', 'yes' if value else 'no'))
-                if value:
-                    err = 'yes'
+                options.extend(('-j', 'yes' if value else 'no'))
             elif key == 'reservation_id':
-                cmd.extend(('-ar', value))
+                options.extend(('-ar', value))
             elif key == 'queue_name':
-                cmd.extend(('-q', value))
+                options.extend(('-q', value))
             elif key == 'priority':
-                cmd.extend(('-p', str(value)))
+                options.extend(('-p', str(value)))
             elif key == 'start_time':
-                cmd.extend(('-a', value.strftime('%Y%m%d%H%M.%S')))
+                options.extend(('-a', value.strftime('%Y%m%d%H%M.%S')))
             elif key == 'accounting_id':
-                cmd.extend(('-A', value))
+                options.extend(('-A', value))
 
         if email_events:
-            cmd.extend(('-m', email_events))
+            options.extend(('-m', email_events))
 
         # Setup parallel environment.
         if 'job_category' in resource_desc:
@@ -455,51 +671,20 @@ class GridEngineServer(ObjServer):
                 raise ValueError(msg)
             min_cpus = resource_desc.get('min_cpus', 1)
             max_cpus = resource_desc.get('max_cpus', min_cpus)
-            cmd.extend(('-pe', parallel_environment,
-                        '%d-%d' % (min_cpus, max_cpus)))
+            options.extend(('-pe', parallel_environment,
+                            '%d-%d' % (min_cpus, max_cpus)))
 
         # Set resource limits.
         if 'resource_limits' in resource_desc:
             limits = resource_desc['resource_limits']
             if 'cpu_time' in limits:
                 cpu_time = limits['cpu_time']
-                cmd.extend(('-l', 'h_cpu=%s' % self._timelimit(cpu_time)))
+                options.extend(('-l', 'h_cpu=%s' % self._timelimit(cpu_time)))
             if 'wallclock_time' in limits:
                 wall_time = limits['wallclock_time']
-                cmd.extend(('-l', 'h_rt=%s' % self._timelimit(wall_time)))
-
-        # Set default command configuration.
-        if not self.work_dir:
-            cmd.append('-cwd')
-        if inp is None:
-            cmd.extend(('-i', DEV_NULL))
-        if out is None:
-            base = os.path.basename(resource_desc['remote_command'])
-            cmd.extend(('-o', '%s.stdout' % base))
-        if err is None:
-            cmd.extend(('-j', 'yes'))
-
-        # Add 'escape' clause.
-        if 'native_specification' in resource_desc:
-            cmd.extend(resource_desc['native_specification'])
-
-        cmd.append(self._fix_path(resource_desc['remote_command']))
-
-        if 'args' in resource_desc:
-            for arg in resource_desc['args']:
-                cmd.append(self._fix_path(arg))
-
-        self._logger.info('%r', ' '.join(cmd))
-        try:
-            process = ShellProc(cmd, DEV_NULL, 'qsub.out', STDOUT, env)
-        except Exception as exc:
-            self._logger.error('exception creating process: %s', exc)
-            raise
+                options.extend(('-l', 'h_rt=%s' % self._timelimit(wall_time)))
 
-        self._logger.debug('    PID = %d', process.pid)
-        return_code, error_msg = process.wait(1)
-        self._logger.debug('    returning %s', (return_code, error_msg))
-        return (return_code, error_msg)
+        return (options, env)
 
     def _fix_path(self, path):
         """ Translates special prefixes. """
@@ -484,8 +484,18 @@ class HasParameters(object):
                              (len(values),len(self._parameters)))
 
         if case is None:
-            for val, param in zip(values, self._parameters.values()):
-                param.set(val, self._get_scope(scope))
+            scope = self._get_scope(scope)
+            # batch the invalidation so that downstream dependencies are
+            # only traversed once rather than once per parameter
+            batch = hasattr(scope, 'begin_invalidation_batch')
+            if batch:
+                scope.begin_invalidation_batch()
+            try:
+                for val, param in zip(values, self._parameters.values()):
+                    param.set(val, scope)
+            finally:
+                if batch:
+                    scope.end_invalidation_batch()
         else:
             for val, parameter in zip(values, self._parameters.values()):
                 for target in parameter.targets:
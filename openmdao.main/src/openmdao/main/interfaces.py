@@ -392,9 +392,29 @@ class ICaseFilter(Interface):
         of `case` in the sequence of cases."""
 
 
+class ICaseCache(Interface):
+    """Stores results of evaluated Cases, keyed by their inputs, so that
+    a Case with the same inputs needn't be evaluated again."""
+
+    def lookup(case):
+        """If results for `case` are available, set its outputs and return
+        True. Otherwise return False."""
+
+    def store(case):
+        """Save the outputs of the successfully evaluated `case`."""
+
+    def close():
+        """Perform any operations required to shut-down this cache."""
+
+
 class IDOEgenerator(Interface):
     """An iterator that returns lists of normalized values that are mapped
     to design variables by a Driver.
+
+    A generator may also provide ``iter_blocks(size)``, returning an
+    iterator over 2D arrays of at most `size` rows, in the same order as
+    :meth:`__iter__`. Drivers use this, if available, to avoid per-row
+    overhead on large designs.
     """
     
     num_parameters = Attribute("number of parameters in the DOE")
@@ -0,0 +1,334 @@
+"""
+.. _`job_array.py`:
+
+Support for running many commands as a single queuing system job array.
+
+A job array is submitted once, using a script which selects the command to
+run based on the task index set by the queuing system. Each task writes its
+exit status to a file. A :class:`JobMonitor` polls `qstat` from a single
+background thread to detect tasks which ended without writing a status.
+"""
+
+import logging
+import os.path
+import pipes
+import threading
+import time
+
+from openmdao.util.shellproc import ShellProc, PIPE, STDOUT, DEV_NULL
+
+# Keys which may differ between the tasks of a job array.
+TASK_KEYS = set((
+    'remote_command',
+    'args',
+    'job_environment',
+    'working_directory',
+    'input_path',
+    'output_path',
+    'error_path',
+    'join_files',
+))
+
+
+def split_descriptions(resource_descs):
+    """
+    Return ``(job_desc, task_descs)`` from `resource_descs`.
+    `job_desc` contains the job-level keys, which must be the same in each
+    description. `task_descs` contains the task keys for each description.
+
+    resource_descs: list(dict)
+        Descriptions of commands and required resources.
+    """
+    if not resource_descs:
+        raise ValueError('No resource descriptions')
+
+    job_desc = {}
+    for key, value in resource_descs[0].items():
+        if key not in TASK_KEYS:
+            job_desc[key] = value
+
+    task_descs = []
+    for resource_desc in resource_descs:
+        task_desc = {}
+        for key, value in resource_desc.items():
+            if key in TASK_KEYS:
+                task_desc[key] = value
+            elif key not in job_desc or job_desc[key] != value:
+                raise ValueError('Job array descriptions differ in %r' % key)
+        missing = set(job_desc) - set(resource_desc)
+        if missing:
+            raise ValueError('Job array descriptions differ in %r'
+                             % sorted(missing)[0])
+        if 'remote_command' not in task_desc:
+            raise KeyError('Job array description missing %r'
+                           % 'remote_command')
+        task_descs.append(task_desc)
+    return (job_desc, task_descs)
+
+
+def task_command(task_desc, index, fix_path, work_dir):
+    """
+    Return shell command line for a task.
+
+    task_desc: dict
+        Task keys of a resource description.
+
+    index: int
+        Task index, used for default output filename.
+
+    fix_path: callable
+        Translates special path prefixes.
+
+    work_dir: string
+        Absolute path of directory to execute in.
+    """
+    def quote(path):
+        return pipes.quote(fix_path(path))
+
+    words = []
+    env = task_desc.get('job_environment', {})
+    for name in sorted(env):
+        words.append('%s=%s' % (name, pipes.quote(env[name])))
+    words.append(quote(task_desc['remote_command']))
+    for arg in task_desc.get('args', []):
+        words.append(quote(arg))
+
+    words.append('<%s' % quote(task_desc.get('input_path', DEV_NULL)))
+    out = task_desc.get('output_path')
+    if out is None:
+        out = '%s.%d.stdout' \
+              % (os.path.basename(task_desc['remote_command']), index)
+    words.append('>%s' % quote(out))
+    err = task_desc.get('error_path')
+    if task_desc.get('join_files') or err is None:
+        words.append('2>&1')
+    else:
+        words.append('2>%s' % quote(err))
+
+    return 'cd %s && %s' % (pipes.quote(work_dir), ' '.join(words))
+
+
+def write_script(filename, header, commands, index_var, status_prefix):
+    """
+    Write job array script to `filename`. The script runs the command
+    selected by the task index in environment variable `index_var`, then
+    writes the exit status to ``<status_prefix>.<index>``.
+
+    filename: string
+        Name of script file.
+
+    header: list(string)
+        Lines to write at the start of the script (queuing system directives).
+
+    commands: list(string)
+        Shell command line for each task, in task index order (from 1).
+
+    index_var: string
+        Name of environment variable containing task index.
+
+    status_prefix: string
+        Path prefix for task exit status files.
+    """
+    with open(filename, 'w') as script:
+        script.write('#!/bin/sh\n')
+        for line in header:
+            script.write('%s\n' % line)
+        script.write('case $%s in\n' % index_var)
+        for i, command in enumerate(commands):
+            script.write('%d) %s ;;\n' % (i+1, command))
+        script.write('*) false ;;\n')
+        script.write('esac\n')
+        # Write to temporary file first so status is never read partially.
+        status = '%s.$%s' % (pipes.quote(status_prefix), index_var)
+        script.write('echo $? >%s.tmp && mv %s.tmp %s\n'
+                     % (status, status, status))
+    os.chmod(filename, 0700)
+
+
+def job_id(qsub_output):
+    """
+    Return job ID from `qsub` output line. Any server or task range suffix
+    (``1234[].server``, ``1234.1-10:1``) is removed.
+
+    qsub_output: string
+        Line written by `qsub` (or first column of `qstat` output).
+    """
+    return qsub_output.strip().split('.')[0]
+
+
+def submit(cmd, env, ntasks, status_prefix, monitor):
+    """
+    Submit job array via `cmd` and wait for its tasks to complete.
+    Returns a list of ``(return_code, error_msg)``, one per task.
+    Output from `qsub` is routed to ``qsub.out``, the last line of which
+    must contain the job ID.
+
+    cmd: list(string)
+        `qsub` command line.
+
+    env: dict
+        Environment variables to add for `qsub`.
+
+    ntasks: int
+        Number of tasks in the array.
+
+    status_prefix: string
+        Path prefix for task exit status files.
+
+    monitor: :class:`JobMonitor`
+        Monitor to track the job with.
+    """
+    logger = logging.getLogger('JobArray')
+    logger.info('%r', ' '.join(cmd))
+    try:
+        process = ShellProc(cmd, DEV_NULL, 'qsub.out', STDOUT, env)
+    except Exception as exc:
+        logger.error('exception creating process: %s', exc)
+        raise
+
+    logger.debug('    PID = %d', process.pid)
+    return_code, error_msg = process.wait(1)
+    if return_code:
+        logger.error('qsub failed: %s%s', return_code, error_msg)
+        raise RuntimeError('qsub failed: %s%s' % (return_code, error_msg))
+
+    with open('qsub.out', 'r') as inp:
+        lines = [line for line in inp if line.strip()]
+    job = JobArray(job_id(lines[-1]), ntasks, status_prefix)
+    logger.debug('    job %s, %d tasks', job.job_id, ntasks)
+    monitor.watch(job)
+    results = job.wait()
+    logger.debug('    returning %s', results)
+    return results
+
+
+def _error_message(return_code):
+    """ Return error message for `return_code`. """
+    if return_code > 0:
+        return ': %s' % os.strerror(return_code)
+    return ''
+
+
+class JobArray(object):
+    """
+    Tracks the tasks of a submitted job array.
+
+    job_id: string
+        Queuing system job ID (as returned by :func:`job_id`).
+
+    ntasks: int
+        Number of tasks in the array.
+
+    status_prefix: string
+        Path prefix for task exit status files.
+    """
+
+    def __init__(self, job_id, ntasks, status_prefix):
+        self.job_id = job_id
+        self.status_prefix = status_prefix
+        self.results = [None] * ntasks
+        self._pending = set(range(ntasks))
+        self._done = threading.Event()
+
+    def update(self, active):
+        """
+        Record results for tasks which have written their status. If this
+        job is not in `active`, then any remaining tasks have failed.
+        Returns True if all tasks are complete.
+
+        active: set(string)
+            IDs of jobs listed by `qstat`, or None if `qstat` failed.
+        """
+        for i in sorted(self._pending):
+            path = '%s.%d' % (self.status_prefix, i+1)
+            if os.path.exists(path):
+                with open(path, 'r') as inp:
+                    return_code = int(inp.read().strip())
+                os.remove(path)
+                self.results[i] = (return_code, _error_message(return_code))
+                self._pending.remove(i)
+            elif active is not None and self.job_id not in active:
+                self.results[i] = (None, 'Task %d ended without exit status'
+                                         % (i+1))
+                self._pending.remove(i)
+        if not self._pending:
+            self._done.set()
+            return True
+        return False
+
+    def wait(self):
+        """ Wait for all tasks to complete and return their results. """
+        self._done.wait()
+        return self.results
+
+
+class JobMonitor(object):
+    """
+    Polls `qstat` from a single background thread to track completion of
+    the tasks of submitted job arrays. The thread exits when there are no
+    job arrays to watch.
+
+    qstat: list(string)
+        Command used to list jobs. The job ID is expected to be the first
+        word on a line.
+
+    poll_delay: float (seconds)
+        Time between polls.
+    """
+
+    def __init__(self, qstat, poll_delay=5.):
+        self.qstat = qstat
+        self.poll_delay = poll_delay
+        self._jobs = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._logger = logging.getLogger('JobMonitor')
+
+    def watch(self, job):
+        """
+        Start tracking `job`.
+
+        job: :class:`JobArray`
+            Job array to be tracked.
+        """
+        with self._lock:
+            self._jobs.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll,
+                                                name='JobMonitor')
+                self._thread.daemon = True
+                self._thread.start()
+
+    def _poll(self):
+        """ Update job arrays until all are complete. """
+        while True:
+            time.sleep(self.poll_delay)
+            active = self._active_jobs()
+            with self._lock:
+                for job in list(self._jobs):
+                    try:
+                        done = job.update(active)
+                    except Exception as exc:
+                        self._logger.error('job %s update failed: %r',
+                                           job.job_id, exc)
+                        done = False
+                    if done:
+                        self._jobs.remove(job)
+                if not self._jobs:
+                    self._thread = None
+                    return
+
+    def _active_jobs(self):
+        """ Return set of job IDs listed by `qstat`, or None on failure. """
+        try:
+            proc = ShellProc(self.qstat, stdout=PIPE)
+            lines = proc.stdout.readlines()
+            return_code, error_msg = proc.wait()
+        except Exception as exc:
+            self._logger.error('%r failed: %s', self.qstat, exc)
+            return None
+        if return_code:
+            self._logger.error('%r failed: %s%s',
+                               self.qstat, return_code, error_msg)
+            return None
+        return set(job_id(line.split()[0]) for line in lines if line.strip())
@@ -6,12 +6,15 @@ This code assumes `ssh` has been set-up on all hosts such that no user
 intervention for passwords or passphrases is required.
 """
 
+import base64
 import copy
 import cPickle
 import getpass
+import hashlib
 import logging
 import os
 import Queue
+import select
 import shutil
 import socket
 import subprocess
@@ -38,6 +41,9 @@ if sys.platform == 'win32':  #pragma no cover
 else:
     _SSH = ['ssh']
 
+# Remote directory under which copies of startup files are kept.
+_CACHE_DIR = os.path.join('~', '.openmdao', 'mp_distributing')
+
 # Logging.
 _LOGGER = logging.getLogger('mp_distributing')
 
@@ -115,12 +121,20 @@ class Cluster(OpenMDAO_Manager):  #pragma no cover
     allow_shell: bool
         If True, :meth:`execute_command` and :meth:`load_model` are allowed
         in created servers. Use with caution!
+
+    max_workers: int
+        Maximum number of hosts to be starting concurrently.
     """
 
-    def __init__(self, hostlist, modules=None, authkey=None, allow_shell=False):
+    # Seconds to wait for another host to come up before giving up.
+    _STARTUP_TIMEOUT = 60
+
+    def __init__(self, hostlist, modules=None, authkey=None, allow_shell=False,
+                 max_workers=16):
         super(Cluster, self).__init__(authkey=authkey)
         self._hostlist = hostlist
         self._allow_shell = allow_shell
+        self._max_workers = max_workers
         modules = modules or []
         if __name__ not in modules:
             modules.append(__name__)
@@ -147,7 +161,7 @@ class Cluster(OpenMDAO_Manager):  #pragma no cover
         hostname = socket.getfqdn()
         listener = connection.Listener(address=(hostname, 0),
                                        authkey=self._authkey,
-                                       backlog=5)  # Default is 1.
+                                       backlog=self._max_workers)
 # TODO: support multiple addresses if multiple networks are attached.
 
         # Start managers in separate thread to avoid losing connections.
@@ -157,58 +171,52 @@ class Cluster(OpenMDAO_Manager):  #pragma no cover
         starter.start()
 
         # Accept callback connections from started managers.
-        waiting = ['']
-        retry = 0
-        while waiting:
-            host_processed = False
-            for host in self._hostlist:
-                host.poll()
-                if host.state == 'started':
-                    # Accept conection from *any* host.
-                    _LOGGER.debug('waiting for a connection, host %s',
-                                  host.hostname)
-                    # This will hang if server doesn't receive our address.
-                    conn = listener.accept()
-                    i, address, pubkey_text = conn.recv()
-                    conn.close()
-                    other_host = self._hostlist[i]
-                    if address is None:
-                        _LOGGER.error('Host %s died: %s', other_host.hostname,
-                                      pubkey_text)  # Exception text.
-                        continue
-
-                    other_host.manager = HostManager.from_address(address,
-                                                                  self._authkey)
-                    other_host.state = 'up'
-                    if pubkey_text:
-                        other_host.manager._pubkey = \
-                            decode_public_key(pubkey_text)
-                    host_processed = True
-                    _LOGGER.debug('Host %s is now up', other_host.hostname)
-                    self._up.append(other_host)
-
-            # See if there are still hosts to wait for.
+        sock = listener._listener._socket
+        deadline = time.time() + self._STARTUP_TIMEOUT
+        while True:
             waiting = []
             for host in self._hostlist:
                 host.poll()
                 if host.state == 'init' or host.state == 'started':
                     waiting.append(host)
-            if waiting:
-                if not host_processed:
-                    retry += 1
-                    if retry < 300:  # ~60 seconds.
-                        time.sleep(0.2)
-                    else:
-                        _LOGGER.warning('Cluster startup timeout,'
-                                        ' hosts not started:')
-                        for host in waiting:
-                            _LOGGER.warning('    %s (%s) in dir %s',
-                                            host.hostname, host.state,
-                                            host.tempdir)
-                        break
-            else:
+            if not waiting:
                 break
 
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                _LOGGER.warning('Cluster startup timeout,'
+                                ' hosts not started:')
+                for host in waiting:
+                    _LOGGER.warning('    %s (%s) in dir %s',
+                                    host.hostname, host.state,
+                                    host.tempdir)
+                break
+
+            # Wake periodically to check for failed host processes.
+            readable, writable, errors = select.select([sock], [], [],
+                                                       min(timeout, 0.5))
+            if not readable:
+                continue
+
+            # Accept connection from *any* host.
+            conn = listener.accept()
+            i, address, pubkey_text = conn.recv()
+            conn.close()
+            deadline = time.time() + self._STARTUP_TIMEOUT
+            host = self._hostlist[i]
+            if address is None:
+                _LOGGER.error('Host %s died: %s', host.hostname,
+                              pubkey_text)  # Exception text.
+                host.state = 'failed'
+                continue
+
+            host.manager = HostManager.from_address(address, self._authkey)
+            host.state = 'up'
+            if pubkey_text:
+                host.manager._pubkey = decode_public_key(pubkey_text)
+            _LOGGER.debug('Host %s is now up', host.hostname)
+            self._up.append(host)
+
         self._up = sorted(self._up, key=lambda host: host.hostname)
 
         self._base_shutdown = self.shutdown
@@ -224,7 +232,7 @@ class Cluster(OpenMDAO_Manager):  #pragma no cover
         """
         # Start first set of hosts.
         todo = []
-        max_workers = 5  # Somewhat related to listener backlog.
+        max_workers = self._max_workers  # Also used for listener backlog.
         for i, host in enumerate(self._hostlist):
             if i < max_workers:
                 worker_q = WorkerPool.get()
@@ -339,17 +347,18 @@ class Host(object):  #pragma no cover
             self.state = 'failed'
             return
 
-        self.tempdir = _copy_to_remote(self.hostname, files, self.python)
-        _LOGGER.debug('startup files copied to %s:%s',
-                      self.hostname, self.tempdir)
+        self.tempdir, cachedir = _copy_to_remote(self.hostname, files,
+                                                 self.python)
+        _LOGGER.debug('startup files in %s:%s, running in %s',
+                      self.hostname, cachedir, self.tempdir)
         cmd = copy.copy(_SSH)
         cmd.extend([self.hostname, self.python, '-c',
                    '"import sys;'
-                   ' sys.path.append(\'.\');'
+                   ' sys.path.append(\'%s\');'
                    ' import os;'
                    ' os.chdir(\'%s\');'
                    ' from mp_distributing import main;'
-                   ' main()"' % self.tempdir])
+                   ' main()"' % (cachedir, self.tempdir)])
         self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
                                      stdout=subprocess.PIPE,
                                      stderr=subprocess.PIPE)
@@ -368,8 +377,7 @@ class Host(object):  #pragma no cover
             )
         cPickle.dump(data, self.proc.stdin, cPickle.HIGHEST_PROTOCOL)
         self.proc.stdin.close()
-# TODO: put timeout in accept() to avoid this hack.
-        time.sleep(1)  # Give the proc time to register startup problems.
+        # Startup problems are detected by Cluster polling while accepting.
         self.poll()
         if self.state != 'failed':
             self.state = 'started'
@@ -430,26 +438,77 @@ def _check_ssh(hostname):  #pragma no cover
     raise RuntimeError(msg)
 
 
-_UNZIP_CODE = '''"import tempfile, os, sys, tarfile
+# Runs on the remote host. Reads digest of files from stdin, replies
+# whether the files are needed, extracts them if so, then replies with
+# a new temporary directory and the directory containing the files.
+_COPY_CODE = """\
+import os, shutil, sys, tarfile, tempfile
+digest = sys.stdin.readline().strip()
+root = os.path.expanduser(%r)
+cachedir = os.path.join(root, digest)
+if os.path.exists(cachedir):
+    sys.stdout.write('have\\n')
+    sys.stdout.flush()
+else:
+    sys.stdout.write('need\\n')
+    sys.stdout.flush()
+    if not os.path.exists(root):
+        try:
+            os.makedirs(root)
+        except OSError:  # Possibly created by another process.
+            pass
+    tmpdir = tempfile.mkdtemp(prefix='tmp-', dir=root)
+    tf = tarfile.open(fileobj=sys.stdin, mode='r|gz')
+    tf.extractall(tmpdir)
+    try:
+        os.rename(tmpdir, cachedir)
+    except OSError:  # Another process got there first.
+        shutil.rmtree(tmpdir)
 tempdir = tempfile.mkdtemp(prefix='omdao-')
-os.chdir(tempdir)
-tf = tarfile.open(fileobj=sys.stdin, mode='r|gz')
-tf.extractall()
-print tempdir"'''
+sys.stdout.write('%%s\\n%%s\\n' %% (tempdir, cachedir))
+"""
+
+def _digest(files):
+    """ Return hex digest of names and contents of `files`. """
+    sha = hashlib.sha1()
+    for name in sorted(files):
+        sha.update(os.path.basename(name))
+        with open(name, 'rb') as inp:
+            sha.update(inp.read())
+    return sha.hexdigest()
 
 # Requires ssh configuration.
 def _copy_to_remote(hostname, files, python):  #pragma no cover
-    """ Copy files to remote directory, returning directory path. """
+    """
+    Copy files to remote cache directory unless they are already there.
+    Returns ``(tempdir, cachedir)``, a new remote directory to run in and
+    the remote directory containing `files`.
+    """
+    code = base64.b64encode(_COPY_CODE % _CACHE_DIR)
     cmd = copy.copy(_SSH)
-    cmd.extend([hostname, python, '-c', _UNZIP_CODE.replace('\n', ';')])
+    cmd.extend([hostname, python, '-c',
+                '"import base64; exec(base64.b64decode(\'%s\'))"' % code])
     proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stdin=subprocess.PIPE,
                             stderr=subprocess.PIPE)
-    archive = tarfile.open(fileobj=proc.stdin, mode='w|gz')
-    for name in files:
-        archive.add(name, os.path.basename(name))
-    archive.close()
+    proc.stdin.write('%s\n' % _digest(files))
+    proc.stdin.flush()
+    reply = proc.stdout.readline().strip()
+    if reply == 'need':
+        archive = tarfile.open(fileobj=proc.stdin, mode='w|gz')
+        for name in files:
+            archive.add(name, os.path.basename(name))
+        archive.close()
+    elif reply != 'have':
+        proc.stdin.close()
+        msg = 'copy to %r failed: %s %s' \
+              % (hostname, reply, proc.stderr.read().strip())
+        _LOGGER.error(msg)
+        raise RuntimeError(msg)
     proc.stdin.close()
-    return proc.stdout.read().rstrip()
+    tempdir = proc.stdout.readline().rstrip()
+    cachedir = proc.stdout.readline().rstrip()
+    proc.wait()
+    return (tempdir, cachedir)
 
 
 # Runs on the remote host.
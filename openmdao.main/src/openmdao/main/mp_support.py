@@ -12,10 +12,15 @@ is used between the Proxy and Server:
 2. Server responds with random session key, encrypted with proxy's public key.
 
 3. Subsequent communication is encrypted with the session key (which presumably
-   is quicker than public/private key encryption).
+   is quicker than public/private key encryption). If the server trusts
+   local connections (see :func:`openmdao.main.mp_util.trusted_local`) and
+   this is an ``AF_UNIX`` connection, it says so in its response and data is
+   sent in the clear.
 
 If `authkey` is not 'PublicKey', then the above session protocol is not used,
-and channel data is in the clear.
+and channel data is in the clear. In either case messages are sent via a
+:class:`openmdao.main.mp_util.Session`, which sends large :mod:`numpy` arrays
+as raw buffers rather than pickling them.
 
 Public methods of an object are determined by a role-based access control
 attribute associated with the method. The server will verify that the current
@@ -35,11 +40,13 @@ method.
 # else might bleed in) as our private multiprocessing package.
 # No obvious 'best' alternative.
 
+import copy
+import cPickle
 import errno
-import hashlib
 import inspect
 import logging
 import os
+import Queue
 import signal
 import socket
 import sys
@@ -59,11 +66,11 @@ if sys.platform == 'win32':  #pragma no cover
 from enthought.traits.trait_handlers import TraitDictObject
 
 from openmdao.main.interfaces import obj_has_interface
-from openmdao.main.mp_util import decrypt, encrypt, is_legal_connection, \
-                                  keytype, make_typeid, public_methods, \
-                                  SPECIALS
+from openmdao.main.mp_util import is_legal_connection, keytype, \
+                                  make_typeid, public_methods, trusted_local, \
+                                  Session, SPECIALS
 from openmdao.main.rbac import AccessController, RoleError, check_role, \
-                               need_proxy, Credentials, \
+                               need_proxy, Credentials, CredentialsError, \
                                get_credentials, set_credentials
 
 from openmdao.util.publickey import decode_public_key, encode_public_key, \
@@ -77,6 +84,12 @@ CLASSES_TO_PROXY = []
 # Cache of proxies created by _make_proxy_type().
 _PROXY_CACHE = {}
 
+# Number of threads processing batch requests for each client connection.
+_BATCH_THREADS = 4
+
+# Seconds before credentials verified for a connection are verified again.
+_TOKEN_LIFETIME = 300
+
 
 def is_instance(obj, typ):
     """
@@ -121,6 +134,15 @@ def has_interface(obj, *ifaces):
         return obj_has_interface(obj, *ifaces)
 
 
+def _is_picklable(obj):
+    """ Return True if `obj` can be pickled. """
+    try:
+        cPickle.dumps(obj, cPickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return False
+    return True
+
+
 class OpenMDAO_Server(Server):
     """
     A :class:`Server` that supports dynamic proxy generation and credential
@@ -164,14 +186,9 @@ class OpenMDAO_Server(Server):
         self.name = name or 'OMS_%d' % os.getpid()
         self.host = socket.gethostname()
         self._allowed_users = allowed_users
+        self._users_generation = 0
         if self._allowed_users is not None:
-            hosts = set()
-            for user_host in self._allowed_users.keys():
-                user, host = user_host.split('@')
-                hosts.add(socket.gethostbyname(host))
-                if host == socket.gethostname():
-                    hosts.add('127.0.0.1')
-            self._allowed_hosts = list(hosts)
+            self._allowed_hosts = self._user_hosts(self._allowed_users)
         else:
             self._allowed_hosts = allowed_hosts or []
 
@@ -208,6 +225,39 @@ class OpenMDAO_Server(Server):
             self._access_controller.class_proxy_required(cls)
         self._address_type = connection.address_type(self.address)
 
+    @staticmethod
+    def _user_hosts(allowed_users):
+        """ Return list of host addresses for `allowed_users`. """
+        hosts = set()
+        for user_host in allowed_users.keys():
+            user, host = user_host.split('@')
+            hosts.add(socket.gethostbyname(host))
+            if host == socket.gethostname():
+                hosts.add('127.0.0.1')
+        return list(hosts)
+
+    def set_allowed_users(self, allowed_users):
+        """
+        Set the users allowed access. Credentials already verified for
+        existing connections are verified again on their next use.
+
+        allowed_users: dict
+            Dictionary of users and corresponding public keys allowed access.
+            If None, any user may access. If empty, no user may access.
+            Host addresses to accept connections from are updated to match.
+        """
+        self._allowed_users = allowed_users
+        if allowed_users is None:
+            self._logger.warning('    allowed_users: ANY')
+        else:
+            self._allowed_hosts = self._user_hosts(allowed_users)
+            if self._allow_tunneling and \
+               '127.0.0.1' not in self._allowed_hosts:
+                self._allowed_hosts.append('127.0.0.1')
+            self._logger.info('    allowed_users: %s',
+                              sorted(allowed_users.keys()))
+        self._users_generation += 1
+
     @property
     def public_key(self):
         """ Public key for session establishment. """
@@ -349,157 +399,323 @@ class OpenMDAO_Server(Server):
             Connection to process.
 
         This version supports dynamic proxy generation and credential checking.
+        Batch requests are queued to a small pool of threads for this
+        connection, so the proxy may have several outstanding at once.
+        Other requests are processed only after all batch requests received
+        before them have completed.
+        Credentials are verified once for the connection, after which the
+        proxy refers to them by token (see :meth:`_verify_credentials`).
         """
         self._logger.debug('starting server thread to service %r, %s',
                            threading.current_thread().name,
                            keytype(self._authkey))
-        recv = conn.recv
-        send = conn.send
-        id_to_obj = self.id_to_obj
-        id_to_controller = self._id_to_controller
+        send_lock = threading.Lock()
+        batches = None
+        tokens = {}
 
         if self._authkey == 'PublicKey':
             client_key, session_key = self._init_session(conn)
         else:
             client_key = ''
             session_key = ''
+        session = Session(session_key)
 
-        while not self.stop:
+        try:
+            while not self.stop:
 
-            try:
-                ident = methodname = args = kwds = credentials = None
-                obj = exposed = gettypeid = None
-                data = recv()
                 try:
-                    request = decrypt(data, session_key)
-                except Exception as exc:
+                    methodname = None
+                    try:
+                        request = session.recv(conn)
+                    except EOFError:
+                        raise
+                    except Exception as exc:
+                        trace = traceback.format_exc()
+                        msg = "Can't decrypt/unpack request. This could be" \
+                              " the result of referring to a dead server."
+                        self._logger.error(msg)
+                        self._logger.error(trace)
+                        raise RuntimeError(msg)
+
+                    # Verify credentials here, so tokens are registered in
+                    # the order requests were sent.
+                    try:
+                        credentials = self._verify_credentials(request[-1],
+                                                               tokens)
+                    except Exception as exc:
+                        self._logger.error('%r' % exc)
+                        msg = ('#TRACEBACK', traceback.format_exc())
+                        if request[0] == '#BATCH':
+                            msg = ('#BATCH', request[1],
+                                   [msg] * len(request[3]))
+                    else:
+                        request = request[:-1] + (credentials,)
+                        if request[0] == '#BATCH':
+                            if batches is None:
+                                batches = self._start_batch_threads(conn,
+                                                                    session,
+                                                                    send_lock)
+                            batches.put(request)
+                            continue
+
+                        methodname = request[1]
+                        if batches is not None:
+                            batches.join()  # Complete earlier batches.
+                        msg = self._process_request(conn, request)
+
+                except EOFError:
+                    util.debug('got EOF -- exiting thread serving %r',
+                               threading.current_thread().name)
+                    sys.exit(0)
+
+                # Just being defensive, this should never happen.
+                except Exception:  #pragma no cover
                     trace = traceback.format_exc()
-                    msg = "Can't decrypt/unpack request. This could be the" \
-                          " result of referring to a dead server."
-                    self._logger.error(msg)
+                    self._logger.error('serve_client exception, method %s',
+                                       methodname)
                     self._logger.error(trace)
-                    raise RuntimeError(msg)
+                    msg = ('#TRACEBACK', trace)
 
-                ident, methodname, args, kwds, credentials = request
-#                self._logger.debug('request %s %s %s',
-#                                   ident, methodname, credentials)
-#                self._logger.debug('id_to_obj:\n%s', self.debug_info(conn))
+                if not self._send_reply(conn, msg, session, send_lock):
+                    conn.close()  #pragma no cover
+                    sys.exit(1)   #pragma no cover
+        finally:
+            if batches is not None:
+                for i in range(_BATCH_THREADS):
+                    batches.put(None)
 
-                # Decode and verify valid credentials.
+    def _verify_credentials(self, encoded, tokens):
+        """
+        Return verified :class:`Credentials` from `encoded`, which is one of:
+
+        - ``('#NEWTOKEN', token, credentials)``: `credentials` are verified
+          and recorded in `tokens` for later reference. If verification
+          fails, they are recorded to be verified again on next use.
+        - ``('#TOKEN', token, client_creds)``: refers to credentials
+          previously recorded in `tokens`. Recorded credentials are verified
+          again if more than `_TOKEN_LIFETIME` seconds have passed since they
+          were last verified or the allowed users have changed.
+        - Encoded credentials, which are verified.
+
+        encoded: tuple
+            Encoded credentials or token reference.
+
+        tokens: dict
+            Credentials verified for this connection, keyed by token.
+        """
+        tag = encoded[0]
+        if tag == '#TOKEN':
+            tag, token, client_creds = encoded
+            try:
+                credentials, expires, generation = tokens[token]
+            except KeyError:
+                raise CredentialsError('Invalid credentials token %r' % token)
+            if time.time() > expires or \
+               generation != self._users_generation:
                 try:
-                    credentials = Credentials.verify(credentials,
+                    credentials = Credentials.verify(credentials.encode(),
                                                      self._allowed_users)
-                except Exception as exc:
-                    self._logger.error('%r' % exc)
+                except Exception:
+                    # Verify again next time.
+                    tokens[token] = (credentials, 0, generation)
                     raise
-
-                try:
-                    obj, exposed, gettypeid = id_to_obj[ident]
-                # Hard to cause this to happen.
-                except KeyError:  #pragma no cover
-                    msg = 'No object for ident %s' % ident
-                    self._logger.error(msg)
-                    raise KeyError('%s %r: %s' % (self.host, self.name, msg))
-
-                if methodname not in exposed:
-                    # Try to raise with a useful error message.
-                    if methodname == '__getattr__':
-                        try:
-                            val = getattr(obj, args[0])
-                        except AttributeError:
-                            raise AttributeError(
-                                  'attribute %r of %r object does not exist'
-                                  % (args[0], type(obj)))
-                        if inspect.ismethod(val):
-                            methodname = args[0]
-                        else:
-                            raise AttributeError(
-                                  'attribute %r of %r is not accessible'
-                                  % (args[0], type(obj)))
-                    raise AttributeError(
-                                  'method %r of %r object is not in exposed=%r'
-                                  % (methodname, type(obj), exposed))
-
-                # Set correct credentials for function lookup.
-                set_credentials(credentials)
-                function = getattr(obj, methodname)
-
-                # Proxy pass-through only happens remotely.
-                if isinstance(obj, BaseProxy):  #pragma no cover
-                    role = None
-                    access_controller = None
-                else:
-                    # Check for allowed access.
-                    role, credentials, access_controller = \
-                        self._check_access(ident, methodname, function, args,
-                                           credentials)
-                if methodname != 'echo':
-                    # 'echo' is used for performance tests, keepalives, etc.
-                    self._logger.debug("Invoke %s %s '%s'",
-                                       methodname, role, credentials)
-#                    self._logger.debug('       %s %s', args, kwds)
-
-                # Invoke function.
+                tokens[token] = (credentials, time.time() + _TOKEN_LIFETIME,
+                                 self._users_generation)
+            # The recorded credentials are shared by concurrent requests.
+            credentials = copy.copy(credentials)
+            credentials.client_creds = client_creds
+            return credentials
+
+        elif tag == '#NEWTOKEN':
+            tag, token, encoded = encoded
+            try:
+                credentials = Credentials.verify(encoded, self._allowed_users)
+            except Exception:
+                # The client records the token regardless, so record it
+                # to be verified again on next use.
+                exc_info = sys.exc_info()
                 try:
-                    try:
-                        res = function(*args, **kwds)
-#                        self._logger.debug('       res %r', res)
-                    except AttributeError as exc:
-                        if isinstance(obj, BaseProxy) and \
-                           methodname == '__getattribute__':
-                            # Avoid an extra round-trip.
-                            res = obj.__getattr__(*args, **kwds)
-                        else:
-                            raise
-                except Exception as exc:
-                    self._logger.error('%s %s %s: %r',
-                                       methodname, role, credentials, exc)
-                    msg = ('#ERROR', exc)
+                    unverified = Credentials(encoded)
+                except Exception:
+                    pass  # Malformed, can never be verified.
                 else:
-                    msg = self._form_reply(res, ident, methodname, function,
-                                           args, access_controller, conn)
+                    tokens[token] = (unverified, 0, self._users_generation)
+                raise exc_info[0], exc_info[1], exc_info[2]
+            tokens[token] = (credentials, time.time() + _TOKEN_LIFETIME,
+                             self._users_generation)
+            return credentials
 
-            except AttributeError:
-                # Just being defensive, this should never happen.
-                if methodname is None:  #pragma no cover
-                    msg = ('#TRACEBACK', traceback.format_exc())
-                else:
-                    orig_traceback = traceback.format_exc()
+        return Credentials.verify(encoded, self._allowed_users)
+
+    def _process_request(self, conn, request):
+        """
+        Process a single method `request` received on `conn` and return
+        the reply message. The request's credentials must have been verified.
+        """
+        ident = methodname = args = kwds = credentials = None
+        obj = exposed = gettypeid = None
+        try:
+            ident, methodname, args, kwds, credentials = request
+#            self._logger.debug('request %s %s %s',
+#                               ident, methodname, credentials)
+#            self._logger.debug('id_to_obj:\n%s', self.debug_info(conn))
+
+            try:
+                obj, exposed, gettypeid = self.id_to_obj[ident]
+            # Hard to cause this to happen.
+            except KeyError:  #pragma no cover
+                msg = 'No object for ident %s' % ident
+                self._logger.error(msg)
+                raise KeyError('%s %r: %s' % (self.host, self.name, msg))
+
+            if methodname not in exposed:
+                # Try to raise with a useful error message.
+                if methodname == '__getattr__':
                     try:
-                        fallback_func = self.fallback_mapping[methodname]
-                        self._logger.debug('Fallback %s', methodname)
-                        result = fallback_func(self, conn, ident, obj,
-                                               *args, **kwds)
-                        msg = ('#RETURN', result)
-                    except Exception:
-                        msg = ('#TRACEBACK', orig_traceback)
-
-            except EOFError:
-                util.debug('got EOF -- exiting thread serving %r',
-                           threading.current_thread().name)
-                sys.exit(0)
+                        val = getattr(obj, args[0])
+                    except AttributeError:
+                        raise AttributeError(
+                              'attribute %r of %r object does not exist'
+                              % (args[0], type(obj)))
+                    if inspect.ismethod(val):
+                        methodname = args[0]
+                    else:
+                        raise AttributeError(
+                              'attribute %r of %r is not accessible'
+                              % (args[0], type(obj)))
+                raise AttributeError(
+                              'method %r of %r object is not in exposed=%r'
+                              % (methodname, type(obj), exposed))
+
+            # Set correct credentials for function lookup.
+            set_credentials(credentials)
+            function = getattr(obj, methodname)
+
+            # Proxy pass-through only happens remotely.
+            if isinstance(obj, BaseProxy):  #pragma no cover
+                role = None
+                access_controller = None
+            else:
+                # Check for allowed access.
+                role, credentials, access_controller = \
+                    self._check_access(ident, methodname, function, args,
+                                       credentials)
+            if methodname != 'echo':
+                # 'echo' is used for performance tests, keepalives, etc.
+                self._logger.debug("Invoke %s %s '%s'",
+                                   methodname, role, credentials)
+#                self._logger.debug('       %s %s', args, kwds)
+
+            # Invoke function.
+            try:
+                try:
+                    res = function(*args, **kwds)
+#                    self._logger.debug('       res %r', res)
+                except AttributeError as exc:
+                    if isinstance(obj, BaseProxy) and \
+                       methodname == '__getattribute__':
+                        # Avoid an extra round-trip.
+                        res = obj.__getattr__(*args, **kwds)
+                    else:
+                        raise
+            except Exception as exc:
+                self._logger.error('%s %s %s: %r',
+                                   methodname, role, credentials, exc)
+                msg = ('#ERROR', exc)
+            else:
+                msg = self._form_reply(res, ident, methodname, function,
+                                       args, access_controller, conn)
 
+        except AttributeError:
             # Just being defensive, this should never happen.
-            except Exception:  #pragma no cover
-                trace = traceback.format_exc()
-                self._logger.error('serve_client exception, method %s',
-                                   methodname)
-                self._logger.error(trace)
-                msg = ('#TRACEBACK', trace)
+            if methodname is None:  #pragma no cover
+                msg = ('#TRACEBACK', traceback.format_exc())
+            else:
+                orig_traceback = traceback.format_exc()
+                try:
+                    fallback_func = self.fallback_mapping[methodname]
+                    self._logger.debug('Fallback %s', methodname)
+                    result = fallback_func(self, conn, ident, obj,
+                                           *args, **kwds)
+                    msg = ('#RETURN', result)
+                except Exception:
+                    msg = ('#TRACEBACK', orig_traceback)
 
+        except EOFError:
+            raise
+
+        # Just being defensive, this should never happen.
+        except Exception:  #pragma no cover
+            trace = traceback.format_exc()
+            self._logger.error('serve_client exception, method %s',
+                               methodname)
+            self._logger.error(trace)
+            msg = ('#TRACEBACK', trace)
+
+        return msg
+
+    def _start_batch_threads(self, conn, session, send_lock):
+        """
+        Start threads to process batch requests received on `conn`.
+        Returns the queue to put requests on.
+        """
+        requests = Queue.Queue()
+        for i in range(_BATCH_THREADS):
+            thread = threading.Thread(target=self._serve_batches,
+                                      args=(conn, requests, session,
+                                            send_lock))
+            thread.daemon = True
+            thread.start()
+        return requests
+
+    def _serve_batches(self, conn, requests, session, send_lock):
+        """
+        Process batch requests from `requests` until a None request is
+        received. The calls within a batch are processed in order, and one
+        ``('#BATCH', reqid, replies)`` message is sent for each batch.
+        """
+        while True:
+            request = requests.get()
             try:
+                if request is None:
+                    return
+                tag, reqid, ident, calls, credentials = request
+                replies = [self._process_request(conn, (ident, methodname,
+                                                        args, kwds,
+                                                        credentials))
+                           for methodname, args, kwds in calls]
+                if not self._send_reply(conn, ('#BATCH', reqid, replies),
+                                        session, send_lock):
+                    conn.close()  #pragma no cover
+                    return        #pragma no cover
+            finally:
+                requests.task_done()
+
+    def _send_reply(self, conn, msg, session, send_lock):
+        """
+        Send reply `msg` on `conn`. Returns False if the reply couldn't be
+        sent.
+        """
+        try:
+            with send_lock:
                 try:
-                    send(encrypt(msg, session_key))
+                    session.send(conn, msg)
                 except Exception:
-                    send(encrypt(('#UNSERIALIZABLE', repr(msg)), session_key))
-            # Just being defensive, this should never happen.
-            except Exception as exc: #pragma no cover
-                self._logger.error('exception in thread serving %r',
-                                   threading.current_thread().name)
-                self._logger.error(' ... message was %r', msg)
-                self._logger.error(' ... exception was %r', exc)
-                conn.close()
-                sys.exit(1)
+                    if msg[0] == '#BATCH':
+                        replies = [reply if _is_picklable(reply) else
+                                   ('#UNSERIALIZABLE', repr(reply))
+                                   for reply in msg[2]]
+                        session.send(conn, ('#BATCH', msg[1], replies))
+                    else:
+                        session.send(conn, ('#UNSERIALIZABLE', repr(msg)))
+        # Just being defensive, this should never happen.
+        except Exception as exc: #pragma no cover
+            self._logger.error('exception in thread serving %r',
+                               threading.current_thread().name)
+            self._logger.error(' ... message was %r', msg)
+            self._logger.error(' ... exception was %r', exc)
+            return False
+        return True
 
     def _init_session(self, conn):
         """ Receive client public key, send session key. """
@@ -511,8 +727,8 @@ class OpenMDAO_Server(Server):
             raise
 
         client_version = client_data[0]
-        if client_version != 1:  #pragma no cover
-            msg = 'Expected client protocol version 1, got %r' % client_version
+        if client_version != 2:  #pragma no cover
+            msg = 'Expected client protocol version 2, got %r' % client_version
             self._logger.error(msg)
             raise RuntimeError(msg)
 
@@ -529,15 +745,19 @@ class OpenMDAO_Server(Server):
             self._logger.error("Can't recreate client key: %r", exc)
             raise
 
-        server_version = 1
+        # Tell the client if encryption is being skipped for local connections.
+        server_version = 2
+        trusted = trusted_local(self.address)
         try:
-            session_key = hashlib.sha1(str(id(conn))).hexdigest()
+            session_key = os.urandom(16)  # AES-128 key.
             data = client_key.encrypt(session_key, '')
-            conn.send((server_version, data))
+            conn.send((server_version, data, trusted))
         except Exception as exc:  #pragma no cover
             self._logger.error("Can't send session key: %r", exc)
             raise
 
+        if trusted:
+            session_key = ''
         return (client_key, session_key)
 
     def _check_access(self, ident, methodname, function, args, credentials):
@@ -1116,6 +1336,177 @@ class ObjectManager(object):
         self._server.serve_forever()
 
 
+class _Channel(object):
+    """
+    A thread's connection to a server. Replies to batch requests are matched
+    to their request by ID, so several batches may be outstanding while
+    other calls are made. Credentials are sent in full only the first time
+    they're used, after that they're referred to by token.
+
+    conn: :class:`Connection`
+        Connection to the server.
+
+    session: :class:`Session`
+        Session used to send and receive on `conn`.
+    """
+
+    def __init__(self, conn, session):
+        self.conn = conn
+        self.session = session
+        self.lock = threading.RLock()
+        self._pending = {}
+        self._next_id = 0
+        self._tokens = {}
+
+    def send(self, request):
+        """
+        Send `request`, whose last item is the :class:`Credentials` to use.
+        """
+        credentials = request[-1]
+        key = (credentials.data, credentials.signature)
+        with self.lock:
+            token = self._tokens.get(key)
+            if token is None:
+                token = len(self._tokens)
+                encoded = ('#NEWTOKEN', token, credentials.encode())
+            else:
+                encoded = ('#TOKEN', token, credentials.client_creds)
+            # Nothing is sent if `request` can't be pickled.
+            self.session.send(self.conn, request[:-1] + (encoded,))
+            self._tokens[key] = token
+
+    def receive(self):
+        """ Receive the ``(kind, result)`` reply to a non-batch request. """
+        with self.lock:
+            while True:
+                reply = self._receive()
+                if reply is not None:
+                    return reply
+
+    def send_batch(self, ident, calls, credentials):
+        """
+        Send a batch of `calls` to object `ident` without waiting for the
+        reply. Returns a :class:`_BatchReply` for the reply.
+        """
+        with self.lock:
+            self._next_id += 1
+            reply = _BatchReply(self, self._next_id)
+            self.send(('#BATCH', reply.reqid, ident, calls, credentials))
+            self._pending[reply.reqid] = reply
+        return reply
+
+    def wait(self, reply):
+        """ Receive messages until `reply` has been received. """
+        with self.lock:
+            while not reply.done:
+                msg = self._receive()
+                # Just being defensive, this should never happen.
+                if msg is not None:  #pragma no cover
+                    raise RuntimeError('Unexpected reply %r' % (msg,))
+
+    def _receive(self):
+        """
+        Receive a message. Batch replies are passed to their
+        :class:`_BatchReply` and None is returned, otherwise the message is
+        returned.
+        """
+        msg = self.session.recv(self.conn)
+        if msg[0] == '#BATCH':
+            tag, reqid, replies = msg
+            self._pending.pop(reqid).replies = replies
+            return None
+        return msg
+
+
+class _BatchReply(object):
+    """ Holds the replies to a batch request, once received. """
+
+    def __init__(self, channel, reqid):
+        self.channel = channel
+        self.reqid = reqid
+        self.replies = None
+
+    @property
+    def done(self):
+        """ True if the replies have been received. """
+        return self.replies is not None
+
+    def get(self, index):
+        """ Wait for the replies and return the reply for call `index`. """
+        if self.replies is None:
+            self.channel.wait(self)
+        return self.replies[index]
+
+
+class ProxyFuture(object):
+    """
+    Result of a proxy method call which may not have completed yet.
+    Returned by :meth:`OpenMDAO_Proxy.call_async` and by calls made within
+    :meth:`OpenMDAO_Proxy.batch`.
+    """
+
+    def __init__(self, proxy, methodname, reply=None, index=0):
+        self._proxy = proxy
+        self._methodname = methodname
+        self._reply = reply
+        self._index = index
+
+    def done(self):
+        """ Return True if the result has been received. """
+        return self._reply is not None and self._reply.done
+
+    def result(self):
+        """
+        Return the result of the call, waiting for it if necessary.
+        If the call raised an exception, that exception is raised.
+        """
+        if self._reply is None:
+            raise RuntimeError('%s() has not been sent' % self._methodname)
+        kind, result = self._reply.get(self._index)
+        return self._proxy._convert_reply(kind, result)
+
+
+class _Batch(object):
+    """
+    Queues calls to `proxy` which are then sent in a single request.
+    Any of the proxy's exposed methods may be called, each call returns
+    a :class:`ProxyFuture`.
+    """
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+        self._calls = []
+        self._futures = []
+
+    def __getattr__(self, name):
+        if name[0] == '_' or name not in self._proxy._exposed_:
+            raise AttributeError('%r is not an exposed method' % name)
+
+        def queue_call(*args, **kwds):
+            future = ProxyFuture(self._proxy, name)
+            self._calls.append((name, self._proxy._fix_args(args), kwds))
+            self._futures.append(future)
+            return future
+        return queue_call
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.send()
+
+    def send(self):
+        """ Send queued calls. Does not wait for the results. """
+        if self._calls:
+            reply = self._proxy._send_batch(self._calls)
+            for index, future in enumerate(self._futures):
+                future._reply = reply
+                future._index = index
+            self._calls = []
+            self._futures = []
+
+
 class OpenMDAO_Proxy(BaseProxy):
     """
     Proxy for a remote object.
@@ -1161,6 +1552,69 @@ class OpenMDAO_Proxy(BaseProxy):
         args = args or ()
         kwds = kwds or {}
 
+        channel = self._get_channel(methodname)
+        with channel.lock:
+            try:
+                channel.send((self._id, methodname, self._fix_args(args), kwds,
+                              get_credentials()))
+            except IOError as exc:
+                msg = "Can't send to server at %r for %r: %r" \
+                      % (self._token.address, methodname, exc)
+                logging.error(msg)
+                raise RuntimeError(msg)
+
+            kind, result = channel.receive()
+
+        return self._convert_reply(kind, result)
+
+    def call_async(self, methodname, *args, **kwds):
+        """
+        Send a call to method `methodname` of the referrent and return
+        a :class:`ProxyFuture` for its result without waiting for it.
+        Calls sent this way and separate batches may be processed
+        concurrently by the server, so they must not modify the same
+        object unless it is thread-safe. A subsequent synchronous call is
+        processed only after this call has completed.
+
+        methodname: string
+            Name of method to call.
+
+        args, kwds:
+            Arguments for the call.
+        """
+        reply = self._send_batch([(methodname, self._fix_args(args), kwds)])
+        return ProxyFuture(self, methodname, reply)
+
+    def batch(self):
+        """
+        Return a context manager which queues calls and sends them in one
+        request on exit. Calls in a batch are processed in order, and each
+        returns a :class:`ProxyFuture` for its result. Separate batches may
+        be processed concurrently, as for :meth:`call_async`, but a
+        subsequent synchronous call is processed only after the batch has
+        completed. For example::
+
+            with proxy.batch() as batch:
+                batch.set('x', 1.)
+                batch.run()
+                y = batch.get('y')
+            print y.result()
+        """
+        return _Batch(self)
+
+    def _send_batch(self, calls):
+        """ Send a batch request and return its :class:`_BatchReply`. """
+        channel = self._get_channel('#BATCH')
+        try:
+            return channel.send_batch(self._id, calls, get_credentials())
+        except IOError as exc:
+            msg = "Can't send to server at %r for %r: %r" \
+                  % (self._token.address, calls[0][0], exc)
+            logging.error(msg)
+            raise RuntimeError(msg)
+
+    def _get_channel(self, methodname):
+        """ Return this thread's :class:`_Channel` to the server. """
         try:
             conn = self._tls.connection
         except AttributeError:
@@ -1177,10 +1631,17 @@ class OpenMDAO_Proxy(BaseProxy):
             if self._authkey == 'PublicKey':
                 self._init_session(conn)
             else:
-                self._tls.session_key = ''
+                self._tls.session = Session(initiator=True)
 
-        session_key = self._tls.session_key
+        channel = getattr(self._tls, 'channel', None)
+        if channel is None or channel.conn is not conn:
+            channel = _Channel(conn, self._tls.session)
+            self._tls.channel = channel
+        return channel
 
+    @staticmethod
+    def _fix_args(args):
+        """ Return list of `args` which can be pickled. """
 # FIXME: Bizarre problem evidenced by test_extcode.py (Python 2.6.1)
 # For some reason pickling the env_vars dictionary causes:
 #    PicklingError: Can't pickle <class 'openmdao.main.mp_support.ObjServer'>:
@@ -1193,18 +1654,10 @@ class OpenMDAO_Proxy(BaseProxy):
                 new_args.append(dict(arg))
             else:
                 new_args.append(arg)
+        return new_args
 
-        try:
-            conn.send(encrypt((self._id, methodname, new_args, kwds,
-                               get_credentials().encode()), session_key))
-        except IOError as exc:
-            msg = "Can't send to server at %r for %r: %r" \
-                  % (self._token.address, methodname, exc)
-            logging.error(msg)
-            raise RuntimeError(msg)
-
-        kind, result = decrypt(conn.recv(), session_key)
-
+    def _convert_reply(self, kind, result):
+        """ Return result from reply, or raise the error it indicates. """
         if kind == '#RETURN':
             return result
 
@@ -1248,14 +1701,14 @@ class OpenMDAO_Proxy(BaseProxy):
 
         server_key = self._pubkey
         encrypted = pk_encrypt(text, server_key)
-        client_version = 1
+        client_version = 2
         conn.send((client_version, server_key.n, server_key.e, encrypted))
 
         server_data = conn.recv()
         server_version = server_data[0]
         # Just being defensive, this should never happen.
-        if server_version != 1:  #pragma no cover
-            msg = 'Expecting server protocol version 1, got %r' % server_version
+        if server_version != 2:  #pragma no cover
+            msg = 'Expecting server protocol version 2, got %r' % server_version
             logging.error(msg)
             if server_version == '#TRACEBACK':
                 try:
@@ -1264,7 +1717,12 @@ class OpenMDAO_Proxy(BaseProxy):
                     pass
             raise RuntimeError(msg)
         
-        self._tls.session_key = key_pair.decrypt(server_data[1])
+        session_key = key_pair.decrypt(server_data[1])
+        # Leading zero bytes of the key are lost in RSA decryption.
+        session_key = session_key.rjust(16, '\0')
+        if server_data[2]:  # Server trusts local connections.
+            session_key = ''
+        self._tls.session = Session(session_key, initiator=True)
 
     def _incref(self):
         """
@@ -5,6 +5,7 @@ Multiprocessing support utilities.
 import atexit
 import ConfigParser
 import cPickle
+import cStringIO
 import errno
 import getpass
 import inspect
@@ -16,6 +17,12 @@ import sys
 import time
 
 from Crypto.Cipher import AES
+from Crypto.Util import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from multiprocessing import current_process, connection
 from multiprocessing.managers import BaseProxy
@@ -29,6 +36,9 @@ from openmdao.util.shellproc import ShellProc, STDOUT
 # Names of attribute access methods requiring special handling.
 SPECIALS = ('__getattribute__', '__getattr__', '__setattr__', '__delattr__')
 
+# Arrays of at least this many bytes are sent by Session as raw buffers.
+_BUFFER_THRESHOLD = 65536
+
 
 def keytype(authkey):
     """
@@ -254,6 +264,136 @@ def decrypt(msg, session_key):
         return msg
 
 
+class Session(object):
+    """
+    Sends and receives messages on a connection. Each message is sent as a
+    pickled envelope followed by the data of any :mod:`numpy` arrays of at
+    least 64KB, which are sent as raw buffers rather than being pickled.
+    Received arrays are read directly into newly allocated arrays.
+
+    If `session_key` is specified, data is encrypted using AES in CTR mode.
+    One cipher is used in each direction for the life of the session, so
+    there's no per-message cipher setup or padding. This requires that
+    messages in each direction are sent and received in the same order.
+
+    session_key: string
+        16 byte key used for encryption. If empty, data is sent in the clear.
+
+    initiator: bool
+        True on the side which initiated the connection (the proxy), False
+        on the other (the server). Selects the counter used in each direction.
+    """
+
+    def __init__(self, session_key='', initiator=False):
+        if session_key:
+            # Just being defensive, this should never happen.
+            if len(session_key) < 16:  #pragma no cover
+                session_key += '!'*16
+            session_key = session_key[:16]
+            send_prefix, recv_prefix = ('C'*8, 'S'*8) if initiator \
+                                       else ('S'*8, 'C'*8)
+            self._encryptor = AES.new(session_key, AES.MODE_CTR,
+                                      counter=Counter.new(64,
+                                                          prefix=send_prefix))
+            self._decryptor = AES.new(session_key, AES.MODE_CTR,
+                                      counter=Counter.new(64,
+                                                          prefix=recv_prefix))
+        else:
+            self._encryptor = None
+            self._decryptor = None
+
+    @property
+    def encrypted(self):
+        """ True if data is encrypted. """
+        return self._encryptor is not None
+
+    def send(self, conn, obj):
+        """
+        Send `obj` on `conn`. If `obj` can't be pickled, nothing is sent.
+
+        conn: :class:`Connection`
+            Connection to send on.
+
+        obj: object
+            Object to be sent.
+        """
+        arrays = []
+        descriptors = []
+        memo = {}
+
+        def persistent_id(obj):
+            if type(obj) is not numpy.ndarray or obj.dtype.hasobject or \
+               obj.nbytes < _BUFFER_THRESHOLD:
+                return None
+            try:
+                return memo[id(obj)]
+            except KeyError:
+                index = memo[id(obj)] = len(arrays)
+                arrays.append(numpy.ascontiguousarray(obj))
+                descriptors.append((obj.dtype.str, obj.shape))
+                return index
+
+        out = cStringIO.StringIO()
+        pickler = cPickle.Pickler(out, cPickle.HIGHEST_PROTOCOL)
+        if numpy is not None:
+            pickler.persistent_id = persistent_id
+        pickler.dump(obj)
+        envelope = cPickle.dumps((descriptors, out.getvalue()),
+                                 cPickle.HIGHEST_PROTOCOL)
+
+        if self._encryptor is None:
+            conn.send_bytes(envelope)
+            for arr in arrays:
+                conn.send_bytes(buffer(arr))
+        else:
+            conn.send_bytes(self._encryptor.encrypt(envelope))
+            for arr in arrays:
+                conn.send_bytes(self._encryptor.encrypt(buffer(arr)))
+
+    def recv(self, conn):
+        """
+        Receive an object from `conn`.
+
+        conn: :class:`Connection`
+            Connection to receive from.
+        """
+        envelope = conn.recv_bytes()
+        if self._decryptor is not None:
+            envelope = self._decryptor.decrypt(envelope)
+        descriptors, data = cPickle.loads(envelope)
+
+        arrays = []
+        for dtype, shape in descriptors:
+            if self._decryptor is None:
+                arr = numpy.empty(shape, dtype)
+                conn.recv_bytes_into(arr)
+            else:
+                arr = numpy.fromstring(self._decryptor.decrypt(
+                                           conn.recv_bytes()), dtype)
+                arr.shape = shape
+            arrays.append(arr)
+
+        unpickler = cPickle.Unpickler(cStringIO.StringIO(data))
+        if arrays:
+            unpickler.persistent_load = arrays.__getitem__
+        return unpickler.load()
+
+
+def trusted_local(address):
+    """
+    Returns True if connections to `address` need not be encrypted.
+    This is the case if `address` is an ``AF_UNIX`` address (which can only
+    be reached from the local host) and the environment variable
+    ``OPENMDAO_TRUSTED_LOCAL`` is set to a non-zero integer.
+
+    address: tuple or string
+        A :mod:`multiprocessing` address.
+    """
+    if not int(os.environ.get('OPENMDAO_TRUSTED_LOCAL', '0')):
+        return False
+    return connection.address_type(address) == 'AF_UNIX'
+
+
 def public_methods(obj):
     """
     Returns a list of names of the methods of `obj` to be exposed.
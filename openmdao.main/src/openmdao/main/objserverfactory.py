@@ -13,12 +13,16 @@ import shutil
 import signal
 import socket
 import sys
+import threading
 import time
+import traceback
 
 from multiprocessing import current_process
 
+from openmdao.main.case import Case
 from openmdao.main.component import SimulationRoot
 from openmdao.main.container import Container
+from openmdao.main.exceptions import TracedError
 from openmdao.main.factory import Factory
 from openmdao.main.factorymanager import create, get_available_types
 from openmdao.main.filevar import RemoteFile
@@ -37,6 +41,23 @@ from openmdao.util.shellproc import ShellProc, STDOUT, DEV_NULL
 _PROXIES = {}
 
 
+class _ServerInfo(object):
+    """ Information about a server started by :class:`ObjServerFactory`. """
+
+    def __init__(self, manager, root_dir, owner, users):
+        self.manager = manager
+        self.root_dir = root_dir
+        self.owner = owner
+        self.users = users  # Key from _users_key().
+        self.uses = 0
+
+
+def _users_key(allowed_users):
+    """ Return hashable key for `allowed_users`. """
+    return tuple(sorted((user, key.n, key.e)
+                        for user, key in allowed_users.items()))
+
+
 class ObjServerFactory(Factory):
     """
     An :class:`ObjServerFactory` creates :class:`ObjServers` and objects
@@ -61,6 +82,10 @@ class ObjServerFactory(Factory):
 
     The environment variable ``OPENMDAO_KEEPDIRS`` can be used to avoid
     having server directory trees removed when servers are shut-down.
+
+    A pool of standby servers may be configured via :meth:`configure_pool`,
+    so that :meth:`create` can return a server without waiting for it to
+    start.
     """
 
     # These are used to propagate selections from main().
@@ -79,6 +104,14 @@ class ObjServerFactory(Factory):
         self._allow_shell = allow_shell or ObjServerFactory._allow_shell
         self._allowed_types = allowed_types or ObjServerFactory._allowed_types
         self._managers = {}
+        self._pool = []  # Idle servers: (users_key, server).
+        self._pool_lock = threading.RLock()
+        self._pool_min_idle = 0
+        self._pool_max_idle = 0
+        self._pool_max_uses = 10
+        self._pool_owner = None
+        self._pool_users = None
+        self._pool_filler = None
         self._logger = logging.getLogger(name)
         self._logger.info('PID: %d, %r, allow_shell %s', os.getpid(),
                           keytype(self._authkey), allow_shell)
@@ -105,10 +138,85 @@ class ObjServerFactory(Factory):
         """
         return args
 
+    def _get_standby(self, allowed_users):
+        """
+        Return an idle server from the pool accessible by `allowed_users`,
+        or None. The pool is refilled in the background.
+        """
+        users = _users_key(allowed_users)
+        server = None
+        with self._pool_lock:
+            # Most recently returned first.
+            for i in range(len(self._pool)-1, -1, -1):
+                if self._pool[i][0] == users:
+                    server = self._pool.pop(i)[1]
+                    break
+        self._fill_pool()
+        if server is not None:
+            self._managers[server].owner = get_credentials()
+            self._logger.info('using standby server %r', server.name)
+        return server
+
+    def _start_server(self, name, allowed_users):
+        """ Start a new server and return a proxy for it. """
+        if not name:
+            name = 'Server_%d' % (len(self._managers) + 1)
+
+        if self._address is None or \
+           isinstance(self._address, basestring) or \
+           self._allow_tunneling:
+            # Local access only via pipe if factory accessed by pipe
+            # or factory is accessed via tunnel.
+            address = None
+        else:
+            # Network access via same IP as factory, system-selected port.
+            address = (self._address[0], 0)
+
+        manager = self.manager_class(address, self._authkey, name=name,
+                                     allowed_users=allowed_users)
+        with self._pool_lock:  # Filler thread may be creating directories.
+            root_dir = name
+            count = 1
+            while os.path.exists(root_dir):
+                count += 1
+                root_dir = '%s_%d' % (name, count)
+            os.mkdir(root_dir)
+
+        # On Windows, when running the full test suite under Nose,
+        # starting the process starts a new Nose test session, which
+        # will eventually get here and start a new Nose session, which...
+        orig_main = None
+        if sys.platform == 'win32':  #pragma no cover
+            scripts = ('openmdao-script.py', 'openmdao_test-script.py')
+            if sys.modules['__main__'].__file__.endswith(scripts):
+                orig_main = sys.modules['__main__'].__file__
+                sys.modules['__main__'].__file__ = \
+                    pkg_resources.resource_filename('openmdao.main',
+                                                    'objserverfactory.py')
+        owner = get_credentials()
+        self._logger.debug('%s starting server %r in dir %s',
+                           owner, name, root_dir)
+        try:
+            manager.start(cwd=root_dir)
+        finally:
+            if orig_main is not None:  #pragma no cover
+                sys.modules['__main__'].__file__ = orig_main
+
+        self._logger.info('new server %r for %s', name, owner)
+        self._logger.info('    in dir %s', root_dir)
+        self._logger.info('    listening on %s', manager.address)
+        server_class = getattr(manager, self.server_classname)
+        server = server_class(name=name, allow_shell=self._allow_shell,
+                              allowed_types=self._allowed_types)
+        self._managers[server] = _ServerInfo(manager, root_dir, owner,
+                                             _users_key(allowed_users))
+        return server
+
     @rbac(('owner', 'user'))
     def release(self, server):
         """
-        Shut-down :class:`ObjServer` `server`.
+        Shut-down :class:`ObjServer` `server`, or return it to the pool of
+        standby servers (see :meth:`configure_pool`).
 
         server: :class:`ObjServer`
             Server to be shut down.
@@ -120,7 +228,7 @@ class ObjServerFactory(Factory):
         self._logger.debug('release %r', server)
         self._logger.debug('        at %r', address)
         try:
-            manager, root_dir, owner = self._managers[server]
+            info = self._managers[server]
         except KeyError:
             # Not identical to any of our proxies.
             # Could still be a reference to the same remote object.
@@ -134,7 +242,7 @@ class ObjServerFactory(Factory):
 
             for key in self._managers.keys():
                 if key.host == server_host and key.pid == server_pid:
-                    manager, root_dir, owner = self._managers[key]
+                    info = self._managers[key]
                     server = key
                     break
             else:
@@ -144,31 +252,146 @@ class ObjServerFactory(Factory):
                     self._logger.debug('    at %r', key._token.address)
                 raise ValueError('server %r not found' % server)
 
-        if get_credentials().user != owner.user:
+        if get_credentials().user != info.owner.user:
             raise RoleError('only the owner can release')
 
-        manager.shutdown()
+        # Return to pool if allowed.
+        info.uses += 1
+        with self._pool_lock:
+            reuse = info.users == self._pool_users and \
+                    info.uses < self._pool_max_uses and \
+                    len(self._pool) < self._pool_max_idle
+        if reuse:
+            try:
+                server.reset()
+            except Exception as exc:
+                self._logger.error("Can't reset %r for reuse: %r",
+                                   server.name, exc)
+            else:
+                with self._pool_lock:
+                    self._pool.append((info.users, server))
+                self._logger.debug('    returned to pool')
+                return
+
+        self._shutdown(server)
+
+    def _shutdown(self, server):
+        """ Shut-down `server` and remove its directory. """
+        info = self._managers.pop(server)
+        info.manager.shutdown()
         server._close.cancel()
-        del self._managers[server]
         keep_dirs = int(os.environ.get('OPENMDAO_KEEPDIRS', '0'))
-        if not keep_dirs and os.path.exists(root_dir):
-            shutil.rmtree(root_dir)
+        if not keep_dirs and os.path.exists(info.root_dir):
+            shutil.rmtree(info.root_dir)
 
     @rbac('owner')
     def cleanup(self):
         """ Shut-down all remaining :class:`ObjServers`. """
         self._logger.debug('cleanup')
+
+        # Stop pool use.
+        with self._pool_lock:
+            self._pool_min_idle = 0
+            self._pool_max_idle = 0
+            filler = self._pool_filler
+        if filler is not None:
+            filler.join()
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for users, server in pool:
+            self._shutdown(server)
+
         cleanup_creds = get_credentials()
         servers = self._managers.keys()
         for server in servers:
             # Cleanup overrides release() 'owner' protection.
-            set_credentials(self._managers[server][2])
+            set_credentials(self._managers[server].owner)
             try:
                 self.release(server)
             finally:
                 set_credentials(cleanup_creds)
         self._managers = {}
 
+    @rbac('owner')
+    def configure_pool(self, min_idle=0, max_idle=None, max_uses=10):
+        """
+        Configure the pool of standby servers. Servers for the current user
+        are started in the background until `min_idle` are idle. Released
+        servers have their directory reset and are returned to the pool
+        unless `max_idle` are already idle or they've been used `max_uses`
+        times. A server is shut down if it can't be reset.
+
+        Only requests for servers accessible by just the current user are
+        satisfied from the pool. A standby server keeps its original name
+        rather than any `name` passed to :meth:`create`.
+
+        Resetting a server only releases its loaded model and cleans its
+        directory. Modules it imported, its environment, and other process
+        state carry over to the next user. A server which has created
+        objects via :meth:`ObjServer.create` is shut down rather than
+        reused, since those objects may still be referenced.
+
+        min_idle: int
+            Number of idle servers to keep started.
+
+        max_idle: int
+            Maximum number of idle servers to keep. Defaults to `min_idle`.
+
+        max_uses: int
+            Number of times a server may be used before being shut down.
+        """
+        if max_idle is None:
+            max_idle = min_idle
+        if min_idle < 0 or max_idle < min_idle:
+            raise ValueError('Invalid pool size: min_idle %s, max_idle %s'
+                             % (min_idle, max_idle))
+        if max_uses < 1:
+            raise ValueError('max_uses must be >= 1, got %s' % max_uses)
+
+        self._logger.debug('configure_pool %s %s %s',
+                           min_idle, max_idle, max_uses)
+        with self._pool_lock:
+            self._pool_min_idle = min_idle
+            self._pool_max_idle = max_idle
+            self._pool_max_uses = max_uses
+            self._pool_owner = get_credentials()
+            self._pool_users = _users_key({self._pool_owner.user:
+                                           self._pool_owner.public_key})
+            excess = self._pool[max_idle:]
+            del self._pool[max_idle:]
+        for users, server in excess:
+            self._shutdown(server)
+        self._fill_pool()
+
+    def _fill_pool(self):
+        """ Start filling the pool in the background if necessary. """
+        with self._pool_lock:
+            if self._pool_filler is None and \
+               len(self._pool) < self._pool_min_idle:
+                self._pool_filler = threading.Thread(target=self._filler,
+                                                     name='PoolFiller')
+                self._pool_filler.daemon = True
+                self._pool_filler.start()
+
+    def _filler(self):
+        """ Start servers until the pool has `min_idle` servers. """
+        owner = set_credentials(self._pool_owner)
+        allowed_users = {owner.user: owner.public_key}
+        while True:
+            with self._pool_lock:
+                if len(self._pool) >= self._pool_min_idle:
+                    self._pool_filler = None
+                    return
+            try:
+                server = self._start_server('', allowed_users)
+            except Exception as exc:
+                self._logger.error("Can't start standby server: %r", exc)
+                with self._pool_lock:
+                    self._pool_filler = None
+                return
+            with self._pool_lock:
+                self._pool.append((self._managers[server].users, server))
+
     @rbac('*')
     def get_available_types(self, groups=None):
         """
@@ -216,8 +439,6 @@ class ObjServerFactory(Factory):
 
         if server is None:
             name = ctor_args.get('name', '')
-            if not name:
-                name = 'Server_%d' % (len(self._managers) + 1)
 
             allowed_users = ctor_args.get('allowed_users')
             if not allowed_users:
@@ -226,52 +447,9 @@ class ObjServerFactory(Factory):
             else:
                 del ctor_args['allowed_users']
 
-            if self._address is None or \
-               isinstance(self._address, basestring) or \
-               self._allow_tunneling:
-                # Local access only via pipe if factory accessed by pipe
-                # or factory is accessed via tunnel.
-                address = None
-            else:
-                # Network access via same IP as factory, system-selected port.
-                address = (self._address[0], 0)
-
-            manager = self.manager_class(address, self._authkey, name=name,
-                                         allowed_users=allowed_users)
-            root_dir = name
-            count = 1
-            while os.path.exists(root_dir):
-                count += 1
-                root_dir = '%s_%d' % (name, count)
-            os.mkdir(root_dir)
-
-            # On Windows, when running the full test suite under Nose,
-            # starting the process starts a new Nose test session, which
-            # will eventually get here and start a new Nose session, which...
-            orig_main = None
-            if sys.platform == 'win32':  #pragma no cover
-                scripts = ('openmdao-script.py', 'openmdao_test-script.py')
-                if sys.modules['__main__'].__file__.endswith(scripts):
-                    orig_main = sys.modules['__main__'].__file__
-                    sys.modules['__main__'].__file__ = \
-                        pkg_resources.resource_filename('openmdao.main',
-                                                        'objserverfactory.py')
-            owner = get_credentials()
-            self._logger.debug('%s starting server %r in dir %s',
-                               owner, name, root_dir)
-            try:
-                manager.start(cwd=root_dir)
-            finally:
-                if orig_main is not None:  #pragma no cover
-                    sys.modules['__main__'].__file__ = orig_main
-
-            self._logger.info('new server %r for %s', name, owner)
-            self._logger.info('    in dir %s', root_dir)
-            self._logger.info('    listening on %s', manager.address)
-            server_class = getattr(manager, self.server_classname)
-            server = server_class(name=name, allow_shell=self._allow_shell,
-                                  allowed_types=self._allowed_types)
-            self._managers[server] = (manager, root_dir, owner)
+            server = self._get_standby(allowed_users)
+            if server is None:
+                server = self._start_server(name, allowed_users)
 
         if typname:
             obj = server.create(typname, version, None, res_desc, **ctor_args)
@@ -333,6 +511,7 @@ class ObjServer(object):
 
         SimulationRoot.chroot(self._root_dir)
         self.tlo = None
+        self._created = False  # True if create() has returned an object.
 
         # Ensure Traits Array support is initialized. The code contains
         # globals for numpy symbols that are initialized within
@@ -354,6 +533,33 @@ class ObjServer(object):
         """
         return args
 
+    @rbac('owner')
+    def reset(self):
+        """
+        Prepare for reuse by another client: release any loaded model and
+        remove everything from the server directory other than the server's
+        own output and log files. Other process state is not reset.
+        Raises :class:`RuntimeError` if objects have been created via
+        :meth:`create`, since they may still be referenced.
+        """
+        self._logger.debug('reset')
+        if self._created:
+            raise RuntimeError('objects created by this server may still'
+                               ' be in use')
+        if self.tlo:
+            self.tlo.pre_delete()
+        self.tlo = None
+        os.chdir(self._root_dir)
+        SimulationRoot.chroot(self._root_dir)
+        for name in os.listdir(self._root_dir):
+            if name in ('stdout', 'stderr', 'openmdao_log.txt'):
+                continue
+            path = os.path.join(self._root_dir, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
     @rbac('owner', proxy_types=[object])
     def create(self, typname, version=None, server=None,
                res_desc=None, **ctor_args):
@@ -367,6 +573,7 @@ class ObjServer(object):
                           res_desc, ctor_args)
         if typname in self._allowed_types:
             obj = create(typname, version, server, res_desc, **ctor_args)
+            self._created = True
             self._logger.info('    returning %s', obj)
             return obj
         else:
@@ -475,6 +682,59 @@ class ObjServer(object):
         self.tlo = Container.load_from_eggfile(egg_filename)
         return self.tlo
 
+    @rbac('owner')
+    def run_cases(self, cases, itername, events=(), egg_filename=None):
+        """
+        Run `cases` in the loaded model, returning a list of
+        ``(outputs, exc)``, one per case. `outputs` is a list of
+        ``(name, value)`` and `exc` is None if the case ran successfully.
+        Otherwise `exc` is a :class:`TracedError` and `outputs` is None.
+        This allows a driver to run several cases with a single request.
+
+        cases: list
+            ``(inputs, outputs, seqno, case_uuid)`` for each case, where
+            `inputs` is a list of ``(name, value)`` and `outputs` is a list
+            of names or expressions to be evaluated after the case is run.
+
+        itername: string
+            Iteration name of the calling driver.
+
+        events: list(string)
+            Events to be set before each case is run.
+
+        egg_filename: string
+            If not None, the model is reloaded from this egg before each
+            case other than the first.
+        """
+        results = []
+        for i, (inputs, outputs, seqno, case_uuid) in enumerate(cases):
+            case = Case(inputs, outputs, case_uuid=case_uuid)
+            try:
+                if i and egg_filename is not None:
+                    self.load_model(egg_filename)
+                if self.tlo is None:
+                    raise RuntimeError('no model loaded')
+                try:
+                    for event in events:
+                        self.tlo.set(event, True)
+                    case.apply_inputs(self.tlo)
+                except Exception as exc:
+                    raise RuntimeError('Exception setting case inputs: %s'
+                                       % exc)
+                self.tlo.set_itername(itername, seqno)
+                self.tlo.run(case_id=case.uuid)
+                try:
+                    case.update_outputs(self.tlo)
+                except Exception as exc:
+                    raise RuntimeError('Exception getting case outputs: %s'
+                                       % exc)
+            except Exception as exc:
+                self._logger.debug('run_cases: case %s: %s', seqno, exc)
+                results.append((None, TracedError(exc, traceback.format_exc())))
+            else:
+                results.append((case.items(iotype='out'), None))
+        return results
+
     @rbac('owner')
     def pack_zipfile(self, patterns, filename):
         """
@@ -13,6 +13,7 @@ import os.path
 import string
 import sys
 
+from openmdao.main import job_array
 from openmdao.main.mp_support import OpenMDAO_Manager, register
 from openmdao.main.objserverfactory import ObjServer
 from openmdao.main.rbac import rbac
@@ -188,6 +189,9 @@ class PBS_Server(ObjServer):
     """ Knows about executing a command via `qsub`. """
 
     _QSUB = ['qsub']  # Replaced with fake command for testing.
+    _QSTAT = ['qstat']  # Replaced with fake command for testing.
+
+    _monitor = None  # JobMonitor for job arrays.
 
     @rbac('owner')
     def configure(self, accounting_id):
@@ -314,9 +318,6 @@ class PBS_Server(ObjServer):
             prefix = '#PBS'
             cmd.extend(('-S', '/bin/sh'))
             suffix = '.qsub'
-        env = None
-        inp, out, err = None, None, None
-        join_files = False
 
         # Set working directory now, for possible path fixing.
         try:
@@ -336,6 +337,10 @@ class PBS_Server(ObjServer):
         script_name = '%s%s' % (base, suffix)
 
         native_specification = resource_desc.get('native_specification', [])
+        inp = resource_desc.get('input_path')
+        out = resource_desc.get('output_path')
+        err = resource_desc.get('error_path')
+        join_files = resource_desc.get('join_files', False)
 
         with open(script_name, 'w') as script:
             if sys.platform == 'win32':  # pragma no cover
@@ -343,86 +348,9 @@ class PBS_Server(ObjServer):
             else:
                 script.write('#!/bin/sh\n')
 
-            # PBS (at least at NAS) requires 'group_list' be set.
-            if 'accounting_id' in resource_desc:
-                accounting_id = resource_desc['accounting_id']
-            else:
-                accounting_id = self.accounting_id
-            script.write('%s -W group_list=%s\n'
-                         % (prefix, accounting_id.strip()))
-
-            # Process description in fixed, repeatable order.
-            keys = ('submit_as_hold',
-                    'rerunnable',
-                    'job_environment',
-                    'min_cpus',
-                    'email',
-                    'email_on_started',
-                    'email_on_terminated',
-                    'job_name',
-                    'input_path',
-                    'output_path',
-                    'error_path',
-                    'join_files',
-                    'queue_name',
-                    'priority',
-                    'start_time')
-
-            email_events = ''
-            for key in keys:
-                try:
-                    value = resource_desc[key]
-                except KeyError:
-                    continue
-
-                if key == 'submit_as_hold':
-                    if value:
-                        script.write('%s -h\n' % prefix)
-                elif key == 'rerunnable':
-                    script.write('%s -r %s\n' % (prefix, 'y' if value else 'n'))
-                elif key == 'job_environment':
-                    env = value
-                elif key == 'min_cpus':
-                    # Only write select clause if not in 'native_specification'.
-                    for arg in native_specification:
-                        if 'select' in arg:
-                            break
-                    else:
-                        script.write('%s -l select=%d:ncpus=1\n' % (prefix, value))
-                elif key == 'email':
-                    script.write('%s -M %s\n' % (prefix, ','.join(value)))
-                elif key == 'email_on_started':
-                    email_events += 'b'
-                elif key == 'email_on_terminated':
-                    email_events += 'e'
-                elif key == 'job_name':
-                    script.write('%s -N %s\n' % (prefix, self._jobname(value)))
-                elif key == 'input_path':
-                    inp = value
-                elif key == 'output_path':
-                    out = value
-                elif key == 'error_path':
-                    err = value
-                elif key == 'join_files':
-                    join_files = value
-                elif key == 'queue_name':
-                    script.write('%s -q %s\n' % (prefix, value))
-                elif key == 'priority':
-                    script.write('%s -p %d\n' % (prefix, value))
-                elif key == 'start_time':
-                    script.write('%s -a %s\n'
-                                 % (prefix, value.strftime('%Y%m%d%H%M.%S')))
-
-            if email_events:
-                script.write('%s -m %s\n' % (prefix, email_events))
-
-            # Set resource limits.
-            if 'resource_limits' in resource_desc:
-                limits = resource_desc['resource_limits']
-                if 'wallclock_time' in limits:
-                    wall_time = limits['wallclock_time']
-                    script.write('%s -l walltime=%s\n'
-                                 % (prefix, self._timelimit(wall_time)))
+            directives, env = self._directives(prefix, resource_desc)
+            for line in directives:
+                script.write('%s\n' % line)
 
             # Have script move to work directory relative to
             # home directory on execution host.
@@ -473,6 +401,155 @@ class PBS_Server(ObjServer):
         self._logger.debug('    returning %s', (return_code, error_msg))
         return (return_code, error_msg)
 
+    def _directives(self, prefix, resource_desc):
+        """
+        Return ``(directives, env)`` for `resource_desc`. `directives` is the
+        list of script header lines.
+        """
+        directives = []
+        env = None
+        native_specification = resource_desc.get('native_specification', [])
+
+        # PBS (at least at NAS) requires 'group_list' be set.
+        if 'accounting_id' in resource_desc:
+            accounting_id = resource_desc['accounting_id']
+        else:
+            accounting_id = self.accounting_id
+        directives.append('%s -W group_list=%s'
+                          % (prefix, accounting_id.strip()))
+
+        # Process description in fixed, repeatable order.
+        keys = ('submit_as_hold',
+                'rerunnable',
+                'job_environment',
+                'min_cpus',
+                'email',
+                'email_on_started',
+                'email_on_terminated',
+                'job_name',
+                'queue_name',
+                'priority',
+                'start_time')
+
+        email_events = ''
+        for key in keys:
+            try:
+                value = resource_desc[key]
+            except KeyError:
+                continue
+
+            if key == 'submit_as_hold':
+                if value:
+                    directives.append('%s -h' % prefix)
+            elif key == 'rerunnable':
+                directives.append('%s -r %s' % (prefix, 'y' if value else 'n'))
+            elif key == 'job_environment':
+                env = value
+            elif key == 'min_cpus':
+                # Only write select clause if not in 'native_specification'.
+                for arg in native_specification:
+                    if 'select' in arg:
+                        break
+                else:
+                    directives.append('%s -l select=%d:ncpus=1'
+                                      % (prefix, value))
+            elif key == 'email':
+                directives.append('%s -M %s' % (prefix, ','.join(value)))
+            elif key == 'email_on_started':
+                email_events += 'b'
+            elif key == 'email_on_terminated':
+                email_events += 'e'
+            elif key == 'job_name':
+                directives.append('%s -N %s' % (prefix, self._jobname(value)))
+            elif key == 'queue_name':
+                directives.append('%s -q %s' % (prefix, value))
+            elif key == 'priority':
+                directives.append('%s -p %d' % (prefix, value))
+            elif key == 'start_time':
+                directives.append('%s -a %s'
+                                  % (prefix, value.strftime('%Y%m%d%H%M.%S')))
+
+        if email_events:
+            directives.append('%s -m %s' % (prefix, email_events))
+
+        # Set resource limits.
+        if 'resource_limits' in resource_desc:
+            limits = resource_desc['resource_limits']
+            if 'wallclock_time' in limits:
+                wall_time = limits['wallclock_time']
+                directives.append('%s -l walltime=%s'
+                                  % (prefix, self._timelimit(wall_time)))
+
+        return (directives, env)
+
+    @rbac('owner')
+    def execute_array(self, resource_descs, poll_delay=5.):
+        """
+        Submit a job array with one task per entry in `resource_descs` and
+        wait for all tasks to complete. Returns a list of
+        ``(return_code, error_msg)``, one per task.
+
+        resource_descs: list(dict)
+            Descriptions of commands and required resources.
+
+        poll_delay: float (seconds)
+            Time between `qstat` polls while waiting.
+
+        Rather than using '-W block=true', the job array is submitted with
+        ``-J 1-N`` and completion is detected by polling `qstat` from a
+        single background thread. The submitted script selects the command
+        for each task based on ``PBS_ARRAY_INDEX``.
+
+        'remote_command', 'args', 'job_environment', 'working_directory',
+        'input_path', 'output_path', 'error_path', and 'join_files' may differ
+        between tasks and are handled in the generated script. Defaults are
+        as for :meth:`execute_command`, except that the default output path
+        is ``<remote_command>.<index>.stdout``. All other keys apply to the
+        whole job, and must be the same in every description. They are
+        translated as for :meth:`execute_command`.
+
+        Job arrays are not supported on Windows.
+
+        Output from `qsub` itself is routed to ``qsub.out``.
+        """
+        if sys.platform == 'win32':  # pragma no cover
+            raise NotImplementedError('job arrays require a POSIX shell')
+
+        self.home_dir = os.path.expanduser('~')
+        self.work_dir = ''
+
+        job_desc, task_descs = job_array.split_descriptions(resource_descs)
+        if 'job_name' in job_desc:
+            base = self._jobname(job_desc['job_name'])
+        else:
+            base = os.path.basename(task_descs[0]['remote_command'])
+        script_name = os.path.join(os.getcwd(), '%s.array.qsub' % base)
+
+        directives, env = self._directives('#PBS', job_desc)
+        commands = []
+        root = os.getcwd()
+        for i, task_desc in enumerate(task_descs):
+            self.work_dir = ''
+            if 'working_directory' in task_desc:
+                self.work_dir = self._fix_path(task_desc['working_directory'])
+            work_dir = os.path.join(root, self.work_dir)
+            commands.append(job_array.task_command(task_desc, i+1,
+                                                   self._fix_path, work_dir))
+        job_array.write_script(script_name, directives, commands,
+                               'PBS_ARRAY_INDEX', script_name+'.status')
+
+        cmd = list(self._QSUB)
+        cmd.extend(('-V', '-j', 'oe', '-S', '/bin/sh',
+                    '-J', '1-%d' % len(task_descs)))
+        cmd.extend(job_desc.get('native_specification', []))
+        cmd.append(script_name)
+
+        if self._monitor is None:
+            self._monitor = job_array.JobMonitor(self._QSTAT)
+        self._monitor.poll_delay = poll_delay
+        return job_array.submit(cmd, env, len(task_descs),
+                                script_name+'.status', self._monitor)
+
     def _fix_path(self, path):
         """ Translates special prefixes. """
         if path.startswith(HOME_DIRECTORY):
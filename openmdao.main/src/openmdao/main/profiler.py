@@ -0,0 +1,205 @@
+"""
+Per-component profiling of model runs.
+
+A :class:`ComponentProfiler` records, for each component pathname, time spent
+executing, transferring data to invalid inputs, invalidating dependents and
+calculating derivatives, along with the number of runs that executed and the
+number that were skipped because the component was already valid. Nested
+assemblies and drivers are reported by their full pathname.
+Typical usage::
+
+    with ComponentProfiler() as prof:
+        set_as_top(model).run()
+    prof.report()
+
+Profiling works via :mod:`openmdao.main.exechooks`, so there is essentially
+no overhead unless a profiler is active.
+"""
+
+__all__ = ['ComponentProfiler']
+
+import json
+import sys
+import threading
+import time
+
+from openmdao.main.exechooks import ExecHook, register_exec_hook, \
+                                    unregister_exec_hook, \
+                                    TRANSFER, INVALIDATE, DERIVATIVES
+
+# Names of the timing statistics for each activity.
+_TIME_KEYS = {
+    TRANSFER:    'transfer_time',
+    INVALIDATE:  'invalidate_time',
+    DERIVATIVES: 'derivative_time',
+}
+
+# Columns of the report table, in order.
+_COLUMNS = ('executions', 'skipped', 'execute_time', 'self_time',
+            'transfer_time', 'invalidate_time', 'derivative_calls',
+            'derivative_time')
+
+
+def _new_stats():
+    """ Return a fresh statistics dictionary. """
+    return dict([(key, 0) for key in _COLUMNS])
+
+
+class ComponentProfiler(ExecHook):
+    """
+    Collects timing statistics for each component while active.
+    Activate via :meth:`start` and :meth:`stop` or by using the profiler
+    as a context manager.
+
+    'execute_time' for an assembly or driver includes the time of the
+    components it runs, 'self_time' excludes it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {}
+        self.elapsed = 0.
+        self._start_time = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        """ Start collecting statistics. """
+        self._start_time = time.time()
+        register_exec_hook(self)
+
+    def stop(self):
+        """ Stop collecting statistics. """
+        unregister_exec_hook(self)
+        if self._start_time is not None:
+            self.elapsed += time.time() - self._start_time
+            self._start_time = None
+
+    def reset(self):
+        """ Discard all collected statistics. """
+        with self._lock:
+            self._stats = {}
+        self.elapsed = 0.
+
+    def _get_stack(self):
+        """ Return the stack of in-progress executions for this thread. """
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _update(self, comp, **incrs):
+        """ Add `incrs` to the statistics for `comp`. """
+        path = comp.get_pathname()
+        with self._lock:
+            try:
+                stats = self._stats[path]
+            except KeyError:
+                stats = self._stats[path] = _new_stats()
+            for key, val in incrs.items():
+                stats[key] += val
+
+    def pre_execute(self, comp):
+        # Entries are [start_time, time_in_nested_executions].
+        self._get_stack().append([time.time(), 0.])
+
+    def post_execute(self, comp):
+        stack = self._get_stack()
+        if not stack:  # Profiler was started during this execution.
+            return
+        start, nested = stack.pop()
+        total = time.time() - start
+        if stack:
+            stack[-1][1] += total
+        self._update(comp, executions=1, execute_time=total,
+                     self_time=total - nested)
+
+    def skipped(self, comp):
+        self._update(comp, skipped=1)
+
+    def pre_activity(self, comp, activity):
+        self._get_stack().append([time.time(), 0.])
+
+    def post_activity(self, comp, activity):
+        stack = self._get_stack()
+        if not stack:
+            return
+        start, nested = stack.pop()
+        total = time.time() - start
+        # Like a nested execution, this isn't part of the enclosing
+        # execution's self time.
+        if stack:
+            stack[-1][1] += total
+        if activity == DERIVATIVES:
+            self._update(comp, derivative_calls=1, derivative_time=total)
+        else:
+            self._update(comp, **{_TIME_KEYS[activity]: total})
+
+    def get_stats(self):
+        """
+        Return a dictionary, keyed by component pathname, of dictionaries
+        containing 'executions', 'skipped', 'execute_time', 'self_time',
+        'transfer_time', 'invalidate_time', 'derivative_calls' and
+        'derivative_time'. Times are in seconds.
+        """
+        with self._lock:
+            return dict([(path, stats.copy())
+                         for path, stats in self._stats.items()])
+
+    def to_json(self, stream=None):
+        """
+        Return statistics as a JSON string, and optionally write them
+        to `stream`.
+
+        stream: file
+            If not None, JSON data is written here.
+        """
+        data = json.dumps({'elapsed': self.elapsed,
+                           'components': self.get_stats()},
+                          indent=2, sort_keys=True)
+        if stream is not None:
+            stream.write(data)
+        return data
+
+    def report(self, stream=None, sort_by='self_time'):
+        """
+        Write a table of statistics to `stream`, sorted in descending
+        order by `sort_by`.
+
+        stream: file
+            Where to write the report, default ``sys.stdout``.
+
+        sort_by: string
+            Name of statistic to sort by.
+        """
+        if stream is None:
+            stream = sys.stdout
+        if sort_by not in _COLUMNS:
+            raise ValueError('sort_by must be one of %s' % (_COLUMNS,))
+
+        stats = self.get_stats()
+        rows = sorted(stats.items(), key=lambda item: item[1][sort_by],
+                      reverse=True)
+        width = max([len(path) for path in stats] + [len('component')])
+
+        stream.write('%-*s' % (width, 'component'))
+        for col in _COLUMNS:
+            stream.write(' %16s' % col)
+        stream.write('\n')
+        for path, row in rows:
+            stream.write('%-*s' % (width, path or '<top>'))
+            for col in _COLUMNS:
+                if col.endswith('_time'):
+                    stream.write(' %16.6f' % row[col])
+                else:
+                    stream.write(' %16d' % row[col])
+            stream.write('\n')
+        stream.write('Elapsed time: %.6f\n' % self.elapsed)
+
@@ -506,11 +506,20 @@ def check_role(role, meth):
     """
     try:
         patterns = meth._rbac[0]
+        cache = meth._rbac[3]
     except AttributeError:
         raise RoleError('No RBAC for function!')
 
-    for pattern in patterns:
-        if fnmatch.fnmatchcase(role, pattern):
-            return
-    raise RoleError("No access for role '%s'" % role)
+    # Cache is shared with need_proxy(), which uses result classes as keys.
+    try:
+        allowed = cache[role]
+    except KeyError:
+        allowed = False
+        for pattern in patterns:
+            if fnmatch.fnmatchcase(role, pattern):
+                allowed = True
+                break
+        cache[role] = allowed
+    if not allowed:
+        raise RoleError("No access for role '%s'" % role)
 
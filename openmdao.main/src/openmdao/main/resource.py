@@ -103,17 +103,28 @@ class ResourceAllocationManager(object):
     By default ``~/.openmdao/resources.cfg`` will be used for additional
     configuration information. To avoid this, call :meth:`configure` before
     any other allocation routines.
+
+    Allocators are queried concurrently, and each allocator's
+    :meth:`max_servers` and :meth:`time_estimate` results are reused for up to
+    `_CACHE_TTL` seconds, or until a server is deployed on or released to
+    that allocator. If no resource is available, allocation waits for a
+    server to be released (or `_RETRY_DELAY` seconds) before trying again.
     """
 
     _lock = threading.Lock()
+    _released = threading.Condition(_lock)  # Notified when server released.
     _RAM = None  # Singleton.
 
+    _CACHE_TTL = 2.    # Seconds to reuse an allocator query result.
+    _RETRY_DELAY = 1.  # Maximum seconds to wait before retrying allocation.
+
     def __init__(self, config_filename=None):
         self._logger = logging.getLogger('RAM')
         self._pid = os.getpid()  # For detecting copy from fork.
         self._allocations = 0
         self._allocators = []
         self._deployed_servers = {}
+        self._cache = {}  # (method, id(allocator)): (expires, rdesc, result)
         self._allocators.append(LocalAllocator('LocalHost',
                                                authkey='PublicKey',
                                                allow_shell=True))
@@ -278,8 +289,8 @@ class ResourceAllocationManager(object):
     def _max_servers(self, resource_desc):
         """ Return total of each allocator's max servers. """
         total = 0
-        for allocator in self._allocators:
-            count, criteria = allocator.max_servers(resource_desc)
+        results = self._query_allocators('max_servers', resource_desc)
+        for allocator, (count, criteria) in zip(self._allocators, results):
             if count <= 0:
                 key = criteria.keys()[0]
                 info = criteria[key]
@@ -318,6 +329,7 @@ class ResourceAllocationManager(object):
                 self._logger.debug('deploying on %r', best_allocator._name)
                 server = best_allocator.deploy(name, resource_desc,
                                                best_criteria)
+                self._invalidate(best_allocator)
                 if server is not None:
                     server_info = {
                         'name': name,
@@ -342,7 +354,7 @@ class ResourceAllocationManager(object):
                 return (None, None)
             # Difficult to generate deployable request that won't deploy...
             else:  #pragma no cover
-                time.sleep(1)  # Wait a bit between retries.
+                self._wait_for_release()
 
     @staticmethod
     def get_hostnames(resource_desc):
@@ -373,7 +385,15 @@ class ResourceAllocationManager(object):
                 return None
             # Difficult to generate deployable request that won't deploy...
             else:  #pragma no cover
-                time.sleep(1)  # Wait a bit between retries.
+                self._wait_for_release()
+
+    def _wait_for_release(self):
+        """
+        Wait until a server is released or `_RETRY_DELAY` seconds have
+        passed, then discard cached results. Must be called with `_lock` held.
+        """
+        ResourceAllocationManager._released.wait(self._RETRY_DELAY)
+        self._cache.clear()
 
     def _get_estimates(self, resource_desc, need_hostnames=False):
         """ Return best (estimate, criteria, allocator). """
@@ -381,8 +401,8 @@ class ResourceAllocationManager(object):
         best_criteria = None
         best_allocator = None
 
-        for allocator in self._allocators:
-            estimate, criteria = allocator.time_estimate(resource_desc)
+        results = self._query_allocators('time_estimate', resource_desc)
+        for allocator, (estimate, criteria) in zip(self._allocators, results):
             if estimate == -2:
                 key = criteria.keys()[0]
                 info = criteria[key]
@@ -407,6 +427,69 @@ class ResourceAllocationManager(object):
 
         return (best_estimate, best_criteria, best_allocator)
 
+    def _query_allocators(self, method, resource_desc):
+        """
+        Return list of results from calling `method` on each allocator.
+        Cached results are used where possible, remaining allocators are
+        queried concurrently.
+        """
+        now = time.time()
+        results = [None] * len(self._allocators)
+        todo = []
+        for i, allocator in enumerate(self._allocators):
+            try:
+                expires, rdesc, result = self._cache[(method, id(allocator))]
+            except KeyError:
+                todo.append(i)
+            else:
+                if expires > now and rdesc == resource_desc:
+                    results[i] = result
+                else:
+                    todo.append(i)
+
+        if len(todo) == 1:  # No need for another thread.
+            i = todo[0]
+            results[i] = self._query(self._allocators[i], method,
+                                     resource_desc)
+        elif todo:
+            credentials = get_credentials()
+            reply_q = Queue.Queue()
+            indices = {}
+            for i in todo:
+                worker_q = WorkerPool.get()
+                indices[worker_q] = i
+                worker_q.put((self._query,
+                              (self._allocators[i], method, resource_desc,
+                               credentials), {}, reply_q))
+            error = None
+            for i in range(len(todo)):
+                worker_q, retval, exc, trace = reply_q.get()
+                WorkerPool.release(worker_q)
+                if exc:
+                    self._logger.error(trace)
+                    error = exc
+                results[indices[worker_q]] = retval
+            if error is not None:
+                raise error
+
+        expires = time.time() + self._CACHE_TTL
+        for i in todo:
+            self._cache[(method, id(self._allocators[i]))] = \
+                (expires, resource_desc.copy(), results[i])
+        return results
+
+    @staticmethod
+    def _query(allocator, method, resource_desc, credentials=None):
+        """ Return result of calling `method` on `allocator`. """
+        if credentials is not None:
+            set_credentials(credentials)
+        return getattr(allocator, method)(resource_desc)
+
+    def _invalidate(self, allocator):
+        """ Discard cached results for `allocator`. """
+        for method in ('max_servers', 'time_estimate'):
+            self._cache.pop((method, id(allocator)), None)
+
     @staticmethod
     def release(server):
         """
@@ -439,6 +522,11 @@ class ResourceAllocationManager(object):
             self._logger.error("Can't release %r: %r", server_info['name'], exc)
         server._close.cancel()
 
+        # Wake any allocation waiting for a server to be released.
+        with ResourceAllocationManager._released:
+            self._invalidate(allocator)
+            ResourceAllocationManager._released.notify_all()
+
     @staticmethod
     def add_remotes(server, prefix=''):
         """
@@ -840,7 +928,9 @@ class FactoryAllocator(ResourceAllocator):
             Configuration data is located under the section matching
             this allocator's `name`.
 
-        Allows modifying `auth_key` and `allow_shell`.
+        Allows modifying `auth_key` and `allow_shell`, and configuring a
+        pool of standby servers via `pool_min_idle`, `pool_max_idle`, and
+        `pool_max_uses` (see :meth:`ObjServerFactory.configure_pool`).
         """
         if cfg.has_option(self.name, 'authkey'):
             value = cfg.get(self.name, 'authkey')
@@ -852,6 +942,17 @@ class FactoryAllocator(ResourceAllocator):
             self._logger.debug('    allow_shell: %s', value)
             self.factory._allow_shell = value
 
+        pool_args = {}
+        for option, arg in (('pool_min_idle', 'min_idle'),
+                            ('pool_max_idle', 'max_idle'),
+                            ('pool_max_uses', 'max_uses')):
+            if cfg.has_option(self.name, option):
+                value = cfg.getint(self.name, option)
+                self._logger.debug('    %s: %s', option, value)
+                pool_args[arg] = value
+        if pool_args:
+            self.factory.configure_pool(**pool_args)
+
     @rbac('*')
     def deploy(self, name, resource_desc, criteria):
         """
@@ -922,6 +1023,13 @@ class LocalAllocator(FactoryAllocator):
         authkey: PublicKey
         allow_shell: True
 
+    To reduce deployment latency, a pool of standby servers may be
+    configured by adding (for example)::
+
+        pool_min_idle: 2
+        pool_max_idle: 4
+        pool_max_uses: 10
+
     """
 
     def __init__(self, name='LocalAllocator', total_cpus=0, max_load=1.0,
@@ -1169,6 +1277,10 @@ class ClusterAllocator(ResourceAllocator):  #pragma no cover
 
     We assume that machines in the cluster are similar enough that ranking
     by load average is reasonable.
+
+    The machines are queried concurrently via a :class:`WorkerPool`, which
+    adds workers as needed. Its activity is available from
+    ``self.worker_pool.get_metrics()``.
     """
 
     def __init__(self, name, machines=None, authkey=None, allow_shell=False):
@@ -1187,6 +1299,7 @@ class ClusterAllocator(ResourceAllocator):  #pragma no cover
         self._last_deployed = None
         self._reply_q = Queue.Queue()
         self._deployed_servers = {}
+        self.worker_pool = WorkerPool()
 
         if machines is not None:
             self._initialize(machines)
@@ -1320,16 +1433,10 @@ class ClusterAllocator(ResourceAllocator):  #pragma no cover
                     break
 
             # Get counts via worker threads.
-            todo = []
-            max_workers = 10
-            for i, allocator in enumerate(self._allocators.values()):
-                if i < max_workers:
-                    worker_q = WorkerPool.get()
-                    worker_q.put((self._get_count,
-                                  (allocator, resource_desc, credentials),
-                                  {}, self._reply_q))
-                else:
-                    todo.append(allocator)
+            for allocator in self._allocators.values():
+                self.worker_pool.submit(self._get_count,
+                                        (allocator, resource_desc, credentials),
+                                        {}, self._reply_q)
 
             # Process counts.
             total = 0
@@ -1339,14 +1446,6 @@ class ClusterAllocator(ResourceAllocator):  #pragma no cover
                     self._logger.error(trace)
                     raise exc
 
-                try:
-                    next_allocator = todo.pop(0)
-                except IndexError:
-                    WorkerPool.release(worker_q)
-                else:
-                    worker_q.put((self._get_count,
-                                  (next_allocator, resource_desc, credentials),
-                                  {}, self._reply_q))
                 count = retval
                 if count:
                     total += count
@@ -1425,16 +1524,10 @@ class ClusterAllocator(ResourceAllocator):  #pragma no cover
                     break
 
             # Get estimates via worker threads.
-            todo = []
-            max_workers = 10
-            for i, allocator in enumerate(self._allocators.values()):
-                if i < max_workers:
-                    worker_q = WorkerPool.get()
-                    worker_q.put((self._get_estimate,
-                                  (allocator, rdesc, credentials),
-                                  {}, self._reply_q))
-                else:
-                    todo.append(allocator)
+            for allocator in self._allocators.values():
+                self.worker_pool.submit(self._get_estimate,
+                                        (allocator, rdesc, credentials),
+                                        {}, self._reply_q)
 
             # Process estimates.
             host_loads = []  # Sorted list of (load, criteria)
@@ -1444,15 +1537,6 @@ class ClusterAllocator(ResourceAllocator):  #pragma no cover
                     self._logger.error(trace)
                     retval = None
 
-                try:
-                    next_allocator = todo.pop(0)
-                except IndexError:
-                    WorkerPool.release(worker_q)
-                else:
-                    worker_q.put((self._get_estimate,
-                                  (next_allocator, rdesc, credentials),
-                                  {}, self._reply_q))
-
                 if retval is None:
                     continue
                 allocator, estimate, criteria = retval
@@ -0,0 +1,56 @@
+"""
+Fake job array execution and 'qstat' for testing.
+
+Submitted job arrays are recorded in ``fake_array.<id>`` files in the
+current directory, which are removed when all tasks have run.
+
+Usage::
+
+    fake_array.py qstat
+    fake_array.py run <record> <script> <index_var> <ntasks>
+"""
+
+import glob
+import os.path
+import subprocess
+import sys
+
+
+def submit(script, index_var, ntasks, qstat_id):
+    """ Record job array and run its tasks in the background. """
+    record = 'fake_array.%d' % os.getpid()
+    with open(record, 'w') as out:
+        out.write('%s\n' % qstat_id)
+    path = os.path.splitext(os.path.abspath(__file__))[0] + '.py'
+    subprocess.Popen([sys.executable, path, 'run', record, script,
+                      index_var, str(ntasks)])
+
+
+def run(record, script, index_var, ntasks):
+    """ Run each task in turn, then remove job array record. """
+    for i in range(1, ntasks+1):
+        env = os.environ.copy()
+        env[index_var] = str(i)
+        subprocess.call(['/bin/sh', script], env=env)
+    os.remove(record)
+
+
+def qstat():
+    """ List recorded job arrays. """
+    print 'job-ID  prior   name       user         state'
+    print '-----------------------------------------------'
+    for record in sorted(glob.glob('fake_array.*')):
+        with open(record, 'r') as inp:
+            qstat_id = inp.read().strip()
+        print qstat_id, '0.5 array user r'
+
+
+def main():
+    if sys.argv[1] == 'qstat':
+        qstat()
+    else:
+        run(sys.argv[2], sys.argv[3], sys.argv[4], int(sys.argv[5]))
+
+
+if __name__ == '__main__':
+    main()
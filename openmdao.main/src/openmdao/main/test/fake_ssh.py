@@ -0,0 +1,20 @@
+"""
+Fake 'ssh' for testing: runs the command on the local host.
+
+Usage::
+
+    fake_ssh.py <hostname> <command> [<args> ...]
+"""
+
+import subprocess
+import sys
+
+
+def main():
+    """ Ignore `hostname` and run remainder of command line via the shell. """
+    sys.exit(subprocess.call(' '.join(sys.argv[2:]), shell=True))
+
+
+if __name__ == '__main__':
+    main()
+
@@ -2,9 +2,12 @@
 Fake 'qsub' for testing.
 """
 
+import os
 import subprocess
 import sys
 
+import fake_array
+
 
 def main():
     cmd = 'no-cmd-set'
@@ -13,6 +16,7 @@ def main():
     stdout = 'qsub.stdout'
     stderr = 'qsub.stderr'
     join_eo = False
+    tasks = None
 
     print ' '.join(sys.argv[1:])
 
@@ -20,13 +24,17 @@ def main():
     while i < len(sys.argv):
         opt = sys.argv[i]
         i += 1
-        if opt in ('-V', '-cwd', '-h'):
+        if opt in ('-V', '-cwd', '-h', '-terse'):
             print opt
         elif opt in ('-sync', '-b', '-N', '-wd', '-M', '-m', '-a', '-dl',
                      '-r', '-ar', '-q', '-p', '-A', '-ac'):
             arg = sys.argv[i]
             i += 1
             print opt, 'arg', arg
+        elif opt == '-t':
+            tasks = sys.argv[i]
+            i += 1
+            print opt, 'tasks', tasks
         elif opt == '-pe':
             arg = sys.argv[i]
             i += 1
@@ -64,6 +72,12 @@ def main():
     cmdlist.extend(args)
     print ' '.join(cmdlist)
 
+    if tasks is not None:
+        first, last = tasks.split('-')
+        fake_array.submit(cmd, 'SGE_TASK_ID', int(last), os.getpid())
+        print '%d.%s:1' % (os.getpid(), tasks)
+        sys.exit(0)
+
     inp = open(stdin, 'r')
     out = open(stdout, 'w')
     if join_eo:
@@ -2,13 +2,17 @@
 Fake 'qsub' for testing.
 """
 
+import os
 import subprocess
 import sys
 
+import fake_array
+
 
 def main():
     cmd = 'no-cmd-set'
     args = []
+    tasks = None
     print ' '.join(sys.argv[1:])
 
     i = 1
@@ -21,6 +25,10 @@ def main():
             arg = sys.argv[i]
             i += 1
             print opt, 'arg', arg
+        elif opt == '-J':
+            tasks = sys.argv[i]
+            i += 1
+            print opt, 'tasks', tasks
         else:
             cmd = opt
             args = sys.argv[i:]
@@ -30,6 +38,13 @@ def main():
     cmdlist.extend(args)
     print ' '.join(cmdlist)
 
+    if tasks is not None:
+        first, last = tasks.split('-')
+        qstat_id = '%d[].fakehost' % os.getpid()
+        fake_array.submit(cmd, 'PBS_ARRAY_INDEX', int(last), qstat_id)
+        print qstat_id
+        sys.exit(0)
+
     retcode = subprocess.call(cmdlist, shell=True)
     sys.exit(retcode)
 
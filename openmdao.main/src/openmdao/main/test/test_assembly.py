@@ -1,5 +1,6 @@
 # pylint: disable-msg=C0111,C0103
 
+import cPickle
 import cStringIO
 import os
 import shutil
@@ -230,6 +231,18 @@ class AssemblyTestCase(unittest.TestCase):
         top.driver.workflow.add(['comp1','nested','comp2','comp3'])
         nested.driver.workflow.add('comp1')
                 
+    def test_setstate_without_batch(self):
+        # State saved before invalidation batching was added.
+        top = set_as_top(Assembly())
+        top.add('comp', Simple())
+        top.driver.workflow.add('comp')
+        del top._invalidation_batch
+        del top._batch_depth
+        top = cPickle.loads(cPickle.dumps(top, -1))
+        top.comp.a = 6.
+        top.run()
+        self.assertEqual(top.comp.c, 11.)
+
     def test_lazy_eval(self):
         top = set_as_top(Assembly())
         comp1 = top.add('comp1', Multiplier())
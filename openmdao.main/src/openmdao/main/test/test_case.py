@@ -1,8 +1,10 @@
 import unittest
 import copy
 import array
+import pickle
 
 from openmdao.main.api import Component, Assembly, Case, set_as_top
+from openmdao.main.case import _get_expr
 from openmdao.lib.datatypes.api import Int, List
 from openmdao.main.numpy_fallback import array as nparray
 
@@ -158,6 +160,42 @@ class CaseTestCase(unittest.TestCase):
                                                              ('comp1.vt.v2',2.)
                                                              ]))
 
+    def test_lazy_uuid(self):
+        case = Case(inputs=[('comp1.a', 1)])
+        self.assertEqual(case._uuid, None)
+        uuid = case.uuid
+        self.assertEqual(case.uuid, uuid)
+
+        # Copies keep the same uuid, even if it hadn't been generated yet.
+        case = Case(inputs=[('comp1.a', 1)], outputs=['comp2.c+comp2.d'])
+        for dup in (copy.deepcopy(case), pickle.loads(pickle.dumps(case)),
+                    pickle.loads(pickle.dumps(case, -1))):
+            self.assertEqual(dup.uuid, case.uuid)
+            self.assertEqual(dup._inputs, case._inputs)
+            self.assertEqual(dup._outputs, case._outputs)
+
+        case.reset()
+        self.assertNotEqual(case.uuid, uuid)
+
+    def test_shared_exprs(self):
+        case1 = Case(inputs=[('comp1.a', 3)], outputs=['comp2.c+comp2.d'])
+        case2 = Case(inputs=[('comp1.a', 4)], outputs=['comp2.c+comp2.d'])
+        self.assertTrue(_get_expr('comp2.c+comp2.d') is
+                        _get_expr('comp2.c+comp2.d'))
+        self.assertEqual(_get_expr('comp1.a'), None)
+        for case, expected in ((case1, 14), (case2, 16)):
+            case.apply_inputs(self.top)
+            self.top.run()
+            case.update_outputs(self.top)
+            self.assertEqual(case['comp2.c+comp2.d'], expected)
+
+        # A new scope works after the old one is gone.
+        self.setUp()
+        case1.apply_inputs(self.top)
+        self.top.run()
+        case1.update_outputs(self.top)
+        self.assertEqual(case1['comp2.c+comp2.d'], 14)
+
 if __name__ == "__main__":
     unittest.main()
 
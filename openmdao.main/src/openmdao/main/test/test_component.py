@@ -54,6 +54,20 @@ class TestCase(unittest.TestCase):
         newvalids = comp.get_valid(['x','xout'])
         self.assertEqual(newvalids, [True, True])
 
+    def test_invalid_tracking(self):
+        comp = self.comp
+        self.assertEqual(comp._valid_dict.invalid, set(['xout']))
+        self.assertEqual(comp.list_outputs(valid=False), ['xout'])
+        self.assertEqual(comp.list_inputs(valid=False), [])
+        comp.set_valid(['xout'], True)
+        self.assertEqual(comp._valid_dict.invalid, set())
+        self.assertEqual(comp.list_outputs(valid=False), [])
+        comp.invalidate_deps()
+        self.assertEqual(comp._valid_dict.invalid, set(['xout']))
+        comp.run()
+        self.assertEqual(comp._valid_dict.invalid, set())
+        self.assertEqual(comp.is_valid(), True)
+
     def test_connect(self):
         comp = self.comp
         
@@ -272,6 +272,17 @@ class DepGraphTestCase(unittest.TestCase):
         for line, expect in zip(lines, expected):
             self.assertEqual(line, expect)
             
+    def test_fanout_cache(self):
+        self.assertEqual(self.dep._get_fanout('A', ['c']), [('B', ['b'])])
+        self.assertEqual(self.dep._get_fanout('A', ['x']), [])
+        self.assertTrue(('A', frozenset(['c'])) in self.dep._fanout_cache)
+        self.dep.connect('A.c', 'C.a')
+        self.assertEqual(self.dep._fanout_cache, {})
+        self.assertEqual(set([d for d, v in self.dep._get_fanout('A', ['c'])]),
+                         set(['B', 'C']))
+        self.dep.disconnect('A.c', 'C.a')
+        self.assertEqual(self.dep._get_fanout('A', ['c']), [('B', ['b'])])
+            
 
 if __name__ == "__main__":
     unittest.main()
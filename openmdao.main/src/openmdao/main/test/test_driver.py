@@ -5,6 +5,7 @@ import unittest
 from enthought.traits.api import Event
 from openmdao.main.api import Assembly, Component, Driver, set_as_top
 from openmdao.main.container import _get_entry_group
+from openmdao.main.interfaces import implements, ICaseRecorder
 
 
 class EventComp(Component):
@@ -20,6 +21,32 @@ class EventComp(Component):
     def execute(self):
         pass
 
+class FailComp(Component):
+
+    def execute(self):
+        raise RuntimeError('execute failed')
+
+class FlushRecorder(object):
+    implements(ICaseRecorder)
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.flushes = 0
+
+    def record(self, case):
+        pass
+
+    def get_iterator(self):
+        return []
+
+    def close(self):
+        pass
+
+    def flush(self):
+        self.flushes += 1
+        if self.fail:
+            raise RuntimeError('flush failed')
+
 class DriverTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -48,6 +75,32 @@ class DriverTestCase(unittest.TestCase):
     def test_default_value_force(self):
         #driver default value should be True
         self.assertTrue(self.asm.driver.force_execute)
+
+    def test_flush_recorders(self):
+        # Recorders of nested drivers are flushed once, by the outermost.
+        top = self.asm
+        top.add('inner', Driver())
+        top.inner.workflow.add('evcomp')
+        top.driver.workflow.add('inner')
+        outer_rec = FlushRecorder()
+        inner_rec = FlushRecorder()
+        top.driver.recorders = [outer_rec]
+        top.inner.recorders = [inner_rec]
+        top.run()
+        self.assertEqual(outer_rec.flushes, 1)
+        self.assertEqual(inner_rec.flushes, 1)
+
+        # Flush errors don't hide the original exception.
+        top.add('fail', FailComp())
+        top.inner.workflow.add('fail')
+        inner_rec.fail = True
+        try:
+            top.run()
+        except RuntimeError as exc:
+            self.assertTrue('execute failed' in str(exc))
+        else:
+            self.fail('Expected RuntimeError')
+        self.assertEqual(inner_rec.flushes, 2)
         
 if __name__ == "__main__":
     unittest.main()
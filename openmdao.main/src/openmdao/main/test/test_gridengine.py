@@ -7,6 +7,7 @@ import os.path
 import pkg_resources
 import shutil
 import sys
+import time
 import unittest
 
 from openmdao.main.resource import HOME_DIRECTORY, WORKING_DIRECTORY
@@ -31,12 +32,22 @@ class TestCase(unittest.TestCase):
         GridEngineAllocator._QHOST[:] = \
             ['python', os.path.join(TestCase.directory, 'ge_qhost.py')]
 
+        # Force use of fake 'qstat'.
+        self.orig_qstat = list(GridEngineServer._QSTAT)
+        GridEngineServer._QSTAT[:] = \
+            ['python', os.path.join(TestCase.directory, 'fake_array.py'),
+             'qstat']
+
     def tearDown(self):
         GridEngineServer._QSUB[:] = self.orig_qsub
         GridEngineAllocator._QHOST[:] = self.orig_qhost
+        GridEngineServer._QSTAT[:] = self.orig_qstat
         for name in ('echo.in', 'echo.out', 'echo.err', 'qsub.out'):
             if os.path.exists(name):
                 os.remove(name)
+        for pattern in ('echo.*.out', 'false.*.stdout', '*.array.qsub'):
+            for name in glob.glob(pattern):
+                os.remove(name)
         for name in glob.glob('GridEngineTestServer*'):
             shutil.rmtree(name)
 
@@ -104,6 +115,60 @@ class TestCase(unittest.TestCase):
         nhosts, criteria = allocator.max_servers({})
         self.assertEqual(nhosts, 0)
 
+    def test_refresh(self):
+        logging.debug('')
+        logging.debug('test_refresh')
+
+        # Report estimates per second with and without the host table.
+        allocator = GridEngineAllocator(refresh_interval=0)
+        count = 10
+        start = time.time()
+        for i in range(count):
+            allocator.time_estimate({})
+        et = time.time() - start
+        uncached = count / et
+        logging.debug('%d estimates running qhost in %.3f sec (%.1f/sec)',
+                      count, et, uncached)
+
+        allocator = GridEngineAllocator(refresh_interval=3600)
+        allocator.time_estimate({})
+        count = 1000
+        start = time.time()
+        for i in range(count):
+            allocator.time_estimate({})
+        et = time.time() - start
+        cached = count / et
+        logging.debug('%d estimates from host table in %.3f sec (%.1f/sec)',
+                      count, et, cached)
+        self.assertTrue(cached > uncached * 10)
+
+        # Deployed servers add to host load until the next refresh.
+        estimate, criteria = allocator.time_estimate({})
+        self.assertEqual(criteria['hostnames'][0], 'hx17')
+        server = allocator.deploy('GridEngineTestServer', {'min_cpus': 2},
+                                  criteria)
+        estimate, criteria = allocator.time_estimate({})
+        self.assertEqual(criteria['hostnames'][0], 'hx11')
+        self.assertEqual(criteria['hostnames'].index('hx17'), 12*48)
+        self.assertEqual(criteria['total_cpus'], 19*48)
+        allocator.release(server)
+        estimate, criteria = allocator.time_estimate({})
+        self.assertEqual(criteria['hostnames'][0], 'hx17')
+
+        # Host table is refreshed in the background while in use.
+        allocator = GridEngineAllocator(refresh_interval=0.2)
+        nhosts, criteria = allocator.max_servers({})
+        self.assertEqual(nhosts, 19*48)
+        GridEngineAllocator._QHOST[:] = [os.path.join('bogus-qhost')]
+        time.sleep(0.5)
+        self.assertEqual(allocator._hosts, [])
+        nhosts, criteria = allocator.max_servers({})
+        self.assertEqual(nhosts, 0)
+
+        # Refresh stops when not in use.
+        time.sleep(1)
+        self.assertEqual(allocator._refresher, None)
+
     def test_server(self):
         logging.debug('')
         logging.debug('test_server')
@@ -222,7 +287,45 @@ echo hello world
         code = "server.execute_command(dict(remote_command='echo'))"
         assert_raises(self, code, globals(), locals(), OSError, '')
 
-        
+    def test_array(self):
+        logging.debug('')
+        logging.debug('test_array')
+
+        if sys.platform == 'win32':
+            logging.debug('    requires a POSIX shell, skipping')
+            return
+
+        server = GridEngineServer()
+        server.configure({})
+
+        # One submission for all tasks, each with its own command and output.
+        resource_descs = [dict(remote_command='echo',
+                               args=['task', str(i)],
+                               output_path='echo.%d.out' % i,
+                               queue_name='array_q') for i in range(5)]
+        resource_descs.append(dict(remote_command='false',
+                                   queue_name='array_q'))
+        results = server.execute_array(resource_descs, poll_delay=0.1)
+        self.assertEqual(results[:5], [(0, '')] * 5)
+        self.assertEqual(results[5][0], 1)
+        for i in range(5):
+            with open('echo.%d.out' % i, 'r') as inp:
+                self.assertEqual(inp.read(), 'task %d\n' % i)
+
+        with open('qsub.out', 'r') as inp:
+            submitted = inp.readline()
+        script = os.path.join(os.getcwd(), 'echo.array.qsub')
+        self.assertEqual(submitted,
+                         '-V -terse -t 1-6 -q array_q -cwd -o /dev/null'
+                         ' -j yes %s\n' % script)
+
+        # Job-level resources must be the same for all tasks.
+        resource_descs[5]['queue_name'] = 'other_q'
+        code = 'server.execute_array(resource_descs)'
+        assert_raises(self, code, globals(), locals(), ValueError,
+                      "Job array descriptions differ in 'queue_name'")
+
+
 if __name__ == '__main__':
     sys.argv.append('--cover-package=grid_engine.')
     sys.argv.append('--cover-erase')
@@ -122,6 +122,28 @@ class HasParametersTestCase(unittest.TestCase):
         #except ValueError as err:
             #self.assertEqual(str(err), "parameter value (-1.0) is outside of allowed range [0.0 to 1e+99]")
             
+    def test_set_params_batched_invalidation(self):
+        self.top.add('comp2', ExecComp(exprs=['c=x+y']))
+        self.top.driver.workflow.add('comp2')
+        self.top.connect('comp.c', 'comp2.x')
+        self.top.driver.add_parameter('comp.x', 0., 1.e99) 
+        self.top.driver.add_parameter('comp.y', 0., 1.e99)
+        self.top.run()
+        self.assertEqual(self.top.comp2.get_valid(['x', 'c']), [True, True])
+        
+        calls = []
+        orig = self.top._depgraph.invalidate_deps
+        def _invalidate_deps(*args, **kwargs):
+            calls.append(args[1])
+            return orig(*args, **kwargs)
+        self.top._depgraph.invalidate_deps = _invalidate_deps
+        
+        self.top.driver.set_parameters([22., 33.])
+        self.assertEqual(calls, [['comp']])
+        self.assertEqual(self.top.comp2.get_valid(['x', 'c']), [False, False])
+        self.assertEqual(self.top._batch_depth, 0)
+        self.assertEqual(self.top._invalidation_batch, [])
+            
     def test_set_broadcast_params(self): 
         self.top.driver.add_parameter(('comp.x','comp.y'), low=0.,high=1e99)
         self.top.driver.set_parameters([22.,])
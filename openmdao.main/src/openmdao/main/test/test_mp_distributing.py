@@ -0,0 +1,97 @@
+"""
+Test mp_distributing.py using local 'hosts' reached via a fake `ssh`.
+"""
+
+import logging
+import os.path
+import shutil
+import sys
+import tempfile
+import unittest
+import nose
+
+from openmdao.main import mp_distributing
+from openmdao.main.mp_distributing import Cluster, Host, _copy_to_remote
+
+
+class TestCase(unittest.TestCase):
+    """ Test mp_distributing.py """
+
+    def setUp(self):
+        self.orig_ssh = mp_distributing._SSH[:]
+        self.orig_cache = mp_distributing._CACHE_DIR
+        path = os.path.join(os.path.dirname(__file__), 'fake_ssh.py')
+        mp_distributing._SSH[:] = [sys.executable, path]
+        mp_distributing._CACHE_DIR = tempfile.mkdtemp(prefix='cache-')
+        self.tempdirs = []
+
+    def tearDown(self):
+        mp_distributing._SSH[:] = self.orig_ssh
+        shutil.rmtree(mp_distributing._CACHE_DIR)
+        mp_distributing._CACHE_DIR = self.orig_cache
+        if not os.environ.get('OPENMDAO_KEEPDIRS'):
+            for path in self.tempdirs:
+                if os.path.exists(path):
+                    shutil.rmtree(path, ignore_errors=True)
+
+    def test_copy(self):
+        logging.debug('')
+        logging.debug('test_copy')
+
+        if sys.platform == 'win32':
+            logging.debug('    requires a shell, skipping')
+            return
+
+        files = [mp_distributing.__file__.replace('.pyc', '.py'),
+                 os.path.join(os.path.dirname(__file__), 'fake_ssh.py')]
+        tempdir, cachedir = _copy_to_remote('localhost', files, sys.executable)
+        self.tempdirs.append(tempdir)
+        self.assertTrue(os.path.isdir(tempdir))
+        self.assertEqual(os.listdir(tempdir), [])
+        self.assertEqual(sorted(os.listdir(cachedir)),
+                         ['fake_ssh.py', 'mp_distributing.py'])
+
+        # Same files are not copied again.
+        os.remove(os.path.join(cachedir, 'fake_ssh.py'))
+        tempdir2, cachedir2 = _copy_to_remote('localhost', files,
+                                              sys.executable)
+        self.tempdirs.append(tempdir2)
+        self.assertNotEqual(tempdir2, tempdir)
+        self.assertEqual(cachedir2, cachedir)
+        self.assertEqual(os.listdir(cachedir), ['mp_distributing.py'])
+
+        # Different files are copied to a new directory.
+        tempdir3, cachedir3 = _copy_to_remote('localhost', files[:1],
+                                              sys.executable)
+        self.tempdirs.append(tempdir3)
+        self.assertNotEqual(cachedir3, cachedir)
+        self.assertEqual(os.listdir(cachedir3), ['mp_distributing.py'])
+        self.assertEqual(len(os.listdir(mp_distributing._CACHE_DIR)), 2)
+
+    def test_cluster(self):
+        logging.debug('')
+        logging.debug('test_cluster')
+
+        if sys.platform == 'win32':
+            logging.debug('    requires a shell, skipping')
+            return
+
+        hosts = [Host('host%d' % i, python=sys.executable) for i in range(4)]
+        cluster = Cluster(hosts, max_workers=2)
+        cluster.start()
+        try:
+            self.assertEqual(len(cluster), len(hosts))
+            for host in hosts:
+                self.assertEqual(host.state, 'up')
+                self.tempdirs.append(host.tempdir)
+            # All hosts shared a single copy of the startup files.
+            self.assertEqual(len(os.listdir(mp_distributing._CACHE_DIR)), 1)
+        finally:
+            cluster.shutdown()
+
+
+if __name__ == '__main__':
+    sys.argv.append('--cover-package=openmdao.main')
+    sys.argv.append('--cover-erase')
+    nose.runmodule()
+
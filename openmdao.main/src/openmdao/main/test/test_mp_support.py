@@ -0,0 +1,116 @@
+"""
+Test mp_support.py
+"""
+
+import logging
+import os.path
+import shutil
+import sys
+import time
+import unittest
+import nose
+
+from openmdao.main.mp_support import OpenMDAO_Server
+from openmdao.main.objserverfactory import start_server, stop_server, \
+                                           connect_to_server, _PROXIES
+from openmdao.main.rbac import get_credentials, CredentialsError
+
+from openmdao.util.testutil import assert_raises
+
+
+class TestCase(unittest.TestCase):
+    """ Test mp_support.py """
+
+    def test_tokens(self):
+        logging.debug('')
+        logging.debug('test_tokens')
+
+        credentials = get_credentials()
+        allowed_users = {credentials.user: credentials.public_key}
+        server = OpenMDAO_Server({}, ('127.0.0.1', 0), 'PublicKey', 'pickle',
+                                 allowed_users=allowed_users)
+        try:
+            tokens = {}
+            encoded = ('#NEWTOKEN', 0, credentials.encode())
+            self.assertEqual(server._verify_credentials(encoded, tokens),
+                             credentials)
+            encoded = ('#TOKEN', 0, None)
+            self.assertEqual(server._verify_credentials(encoded, tokens),
+                             credentials)
+
+            # Client credentials are set on a copy of the recorded ones.
+            client = server._verify_credentials(('#TOKEN', 0, 'client'),
+                                                tokens)
+            self.assertEqual(client.client_creds, 'client')
+            self.assertEqual(tokens[0][0].client_creds, None)
+
+            code = "server._verify_credentials(('#TOKEN', 1, None), tokens)"
+            assert_raises(self, code, globals(), locals(), CredentialsError,
+                          'Invalid credentials token 1')
+
+            # Changing allowed users causes verification on next use.
+            code = 'server._verify_credentials(encoded, tokens)'
+            server.set_allowed_users({})
+            assert_raises(self, code, globals(), locals(), CredentialsError,
+                          'User %r not in allowed_users' % credentials.user)
+            assert_raises(self, code, globals(), locals(), CredentialsError,
+                          'User %r not in allowed_users' % credentials.user)
+            server.set_allowed_users(allowed_users)
+            self.assertEqual(server._verify_credentials(encoded, tokens),
+                             credentials)
+
+            # Refused new tokens are verified again on next use.
+            server.set_allowed_users({})
+            code = "server._verify_credentials(('#NEWTOKEN', 1," \
+                   " credentials.encode()), tokens)"
+            assert_raises(self, code, globals(), locals(), CredentialsError,
+                          'User %r not in allowed_users' % credentials.user)
+            server.set_allowed_users(allowed_users)
+            self.assertEqual(server._verify_credentials(('#TOKEN', 1, None),
+                                                        tokens),
+                             credentials)
+            self.assertTrue(tokens[1][1] > time.time())
+
+            # Expired tokens are verified again.
+            creds, expires, generation = tokens[0]
+            tokens[0] = (creds, 0, generation)
+            server._verify_credentials(encoded, tokens)
+            self.assertTrue(tokens[0][1] > time.time())
+        finally:
+            server.listener.close()
+
+    def test_calls(self):
+        logging.debug('')
+        logging.debug('test_calls')
+
+        testdir = 'test_calls'
+        if os.path.exists(testdir):
+            shutil.rmtree(testdir)
+        os.mkdir(testdir)
+        os.chdir(testdir)
+
+        server = None
+        try:
+            # Report calls per second through an encrypted connection.
+            server, cfg = start_server()
+            factory = connect_to_server(cfg)
+            factory.echo('warmup')
+            count = 1000
+            start = time.time()
+            for i in range(count):
+                self.assertEqual(factory.echo(i), (i,))
+            et = time.time() - start
+            logging.debug('%d calls in %.3f sec (%.1f calls/sec)',
+                          count, et, count / et)
+        finally:
+            if server is not None:
+                stop_server(server, cfg)
+            _PROXIES.clear()
+            os.chdir('..')
+            shutil.rmtree(testdir)
+
+
+if __name__ == '__main__':
+    sys.argv.append('--cover-package=openmdao.main')
+    sys.argv.append('--cover-erase')
+    nose.runmodule()
@@ -6,11 +6,16 @@ import logging
 import os.path
 import socket
 import sys
+import threading
 import unittest
 import nose
 
+from multiprocessing import Pipe
+
+import numpy
+
 from openmdao.main.mp_util import read_server_config, read_allowed_hosts, \
-                                  is_legal_connection
+                                  is_legal_connection, trusted_local, Session
 
 from openmdao.util.publickey import make_private, HAVE_PYWIN32
 from openmdao.util.testutil import assert_raises
@@ -125,6 +130,56 @@ class TestCase(unittest.TestCase):
             finally:
                 os.remove('hosts.allow')
 
+    def test_session(self):
+        logging.debug('')
+        logging.debug('test_session')
+
+        big = numpy.arange(100000.).reshape((1000, 100))
+        small = numpy.arange(3)
+        msg = ('hello', big, [big, small], numpy.asfortranarray(big))
+
+        for session_key in ('', '\0' + os.urandom(15)):
+            proxy_conn, server_conn = Pipe()
+            proxy = Session(session_key, initiator=True)
+            server = Session(session_key)
+            self.assertEqual(proxy.encrypted, bool(session_key))
+
+            # Repeat to check the ciphers stay in step.
+            for i in range(3):
+                # Large messages need a concurrent reader.
+                sender = threading.Thread(target=proxy.send,
+                                          args=(proxy_conn, msg))
+                sender.start()
+                received = server.recv(server_conn)
+                sender.join()
+
+                self.assertEqual(received[0], 'hello')
+                self.assertTrue((received[1] == big).all())
+                self.assertTrue(received[2][0] is received[1])
+                self.assertTrue((received[2][1] == small).all())
+                self.assertTrue((received[3] == big).all())
+                received[1][0, 0] = 42.  # Must be writable.
+
+                server.send(server_conn, ('#RETURN', i))
+                self.assertEqual(proxy.recv(proxy_conn), ('#RETURN', i))
+
+    def test_trusted_local(self):
+        logging.debug('')
+        logging.debug('test_trusted_local')
+
+        saved = os.environ.get('OPENMDAO_TRUSTED_LOCAL')
+        try:
+            os.environ['OPENMDAO_TRUSTED_LOCAL'] = '0'
+            self.assertFalse(trusted_local('/tmp/pipe'))
+            os.environ['OPENMDAO_TRUSTED_LOCAL'] = '1'
+            self.assertTrue(trusted_local('/tmp/pipe'))
+            self.assertFalse(trusted_local(('127.0.0.1', 1234)))
+        finally:
+            if saved is None:
+                del os.environ['OPENMDAO_TRUSTED_LOCAL']
+            else:
+                os.environ['OPENMDAO_TRUSTED_LOCAL'] = saved
+
 
 if __name__ == '__main__':
     sys.argv.append('--cover-package=openmdao.main')
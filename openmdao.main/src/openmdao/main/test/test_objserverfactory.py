@@ -4,6 +4,7 @@ Most functionality is exercised by test_distsim.py or test_extcode.py,
 but in an unobservable manner as far as test coverage is concerned.
 """
 
+import cPickle
 import logging
 import os.path
 import shutil
@@ -13,11 +14,15 @@ import time
 import unittest
 import nose
 
+import numpy
+
+from openmdao.main.api import Assembly, set_as_top
 from openmdao.main.component import SimulationRoot
 from openmdao.main.objserverfactory import ObjServerFactory, ObjServer, \
                                            start_server, stop_server, \
                                            connect_to_server, _PROXIES
 from openmdao.main.resource import ResourceAllocationManager as RAM
+from openmdao.test.execcomp import ExecComp
 from openmdao.util.testutil import assert_raises
 
 
@@ -91,6 +96,200 @@ class TestCase(unittest.TestCase):
             if not keep_dirs:
                 shutil.rmtree(testdir)
 
+    def test_batch(self):
+        logging.debug('')
+        logging.debug('test_batch')
+
+        testdir = 'test_batch'
+        if os.path.exists(testdir):
+            shutil.rmtree(testdir)
+        os.mkdir(testdir)
+        os.chdir(testdir)
+
+        factory = None
+        try:
+            factory = ObjServerFactory()
+            comp = factory.create('openmdao.test.execcomp.ExecComp')
+
+            # Calls in a batch are processed in order.
+            with comp.batch() as batch:
+                batch.set('force_execute', True)
+                value = batch.get('force_execute')
+                missing = batch.get('no_such_var')
+                batch.set('force_execute', False)
+            self.assertEqual(value.result(), True)
+            self.assertFalse(comp.get('force_execute'))
+            try:
+                missing.result()
+            except AttributeError as exc:
+                self.assertTrue('no_such_var' in str(exc))
+            else:
+                self.fail('Expected AttributeError')
+
+            # A synchronous call waits for batches sent before it.
+            with comp.batch() as batch:
+                batch.set('force_execute', True)
+            self.assertTrue(comp.get('force_execute'))
+            comp.call_async('set', 'force_execute', False)
+            comp.run()
+            self.assertFalse(comp.get('force_execute'))
+
+            try:
+                comp.batch().no_such_method
+            except AttributeError as exc:
+                self.assertEqual(str(exc),
+                                 "'no_such_method' is not an exposed method")
+            else:
+                self.fail('Expected AttributeError')
+
+            # Compare one call per round-trip with batched and pipelined calls.
+            count = 200
+            start = time.time()
+            results = [comp.get('force_execute') for i in range(count)]
+            serial = time.time() - start
+            self.assertEqual(results, [False] * count)
+
+            start = time.time()
+            with comp.batch() as batch:
+                futures = [batch.get('force_execute') for i in range(count)]
+            results = [future.result() for future in futures]
+            batched = time.time() - start
+            self.assertEqual(results, [False] * count)
+
+            start = time.time()
+            futures = [comp.call_async('get', 'force_execute')
+                       for i in range(count)]
+            # Synchronous calls may be made while replies are outstanding.
+            self.assertFalse(comp.get('force_execute'))
+            results = [future.result() for future in futures]
+            pipelined = time.time() - start
+            self.assertEqual(results, [False] * count)
+
+            # Timings vary too much between hosts to be compared here.
+            logging.debug('%d gets: serial %.3f, batched %.3f, pipelined %.3f',
+                          count, serial, batched, pipelined)
+        finally:
+            if factory is not None:
+                factory.cleanup()
+            SimulationRoot.chroot('..')
+            if sys.platform == 'win32':
+                time.sleep(2)  # Wait for process shutdown.
+            shutil.rmtree(testdir)
+
+    def test_pool(self):
+        logging.debug('')
+        logging.debug('test_pool')
+
+        testdir = 'test_pool'
+        if os.path.exists(testdir):
+            shutil.rmtree(testdir)
+        os.mkdir(testdir)
+        os.chdir(testdir)
+
+        factory = None
+        try:
+            factory = ObjServerFactory()
+
+            # Cold start for reference.
+            start = time.time()
+            server = factory.create('')
+            cold = time.time() - start
+            cold_pid = server.pid
+            factory.release(server)
+            self.assertEqual(factory._pool, [])
+
+            assert_raises(self, 'factory.configure_pool(2, 1)',
+                          globals(), locals(), ValueError,
+                          'Invalid pool size: min_idle 2, max_idle 1')
+            assert_raises(self, 'factory.configure_pool(1, max_uses=0)',
+                          globals(), locals(), ValueError,
+                          'max_uses must be >= 1, got 0')
+
+            factory.configure_pool(min_idle=1, max_idle=2, max_uses=2)
+            for retry in range(100):
+                if factory._pool:
+                    break
+                time.sleep(0.1)
+            else:
+                self.fail('Pool not filled')
+
+            standby_pids = [standby.pid for key, standby in factory._pool]
+            start = time.time()
+            server = factory.create('', name='Pooled')
+            warm = time.time() - start
+            # Timings vary too much between hosts to be compared here.
+            logging.debug('deploy latency: cold %.3f, warm %.3f', cold, warm)
+            pid = server.pid
+            self.assertTrue(pid in standby_pids)
+            self.assertNotEqual(pid, cold_pid)
+
+            # Pool is refilled in the background.
+            while factory._pool_filler is not None:
+                time.sleep(0.1)
+            self.assertEqual(len(factory._pool), 1)
+
+            # Released server is reset and returned to the pool.
+            with server.open('junk', 'w') as out:
+                out.write('junk')
+            factory.release(server)
+            self.assertEqual(len(factory._pool), 2)
+            server = factory.create('')
+            self.assertEqual(server.pid, pid)
+            self.assertFalse('junk' in server.listdir('.'))
+
+            # Server is shut down after max_uses.
+            factory.release(server)
+            self.assertEqual(len(factory._pool), 1)
+            self.assertFalse(pid in [standby.pid
+                                     for key, standby in factory._pool])
+
+            # Server which created objects is shut down rather than reused.
+            server = factory.create('')
+            pid = server.pid
+            server.create('openmdao.test.execcomp.ExecComp')
+            factory.release(server)
+            self.assertFalse(pid in [standby.pid
+                                     for key, standby in factory._pool])
+        finally:
+            if factory is not None:
+                factory.cleanup()
+            SimulationRoot.chroot('..')
+            if sys.platform == 'win32':
+                time.sleep(2)  # Wait for process shutdown.
+            shutil.rmtree(testdir)
+
+    def test_array_transfer(self):
+        logging.debug('')
+        logging.debug('test_array_transfer')
+
+        testdir = 'test_array_transfer'
+        if os.path.exists(testdir):
+            shutil.rmtree(testdir)
+        os.mkdir(testdir)
+        os.chdir(testdir)
+
+        server = None
+        try:
+            # Echo arrays through an encrypted connection, reporting thruput.
+            server, cfg = start_server()
+            factory = connect_to_server(cfg)
+            for mbytes in (1, 10, 100):
+                arr = numpy.random.random(mbytes * 1024 * 1024 / 8)
+                start = time.time()
+                result = factory.echo(arr)[0]
+                et = time.time() - start
+                self.assertTrue((result == arr).all())
+                logging.debug('%d MB round-trip in %.3f sec (%.1f MB/sec)',
+                              mbytes, et, 2 * mbytes / et)
+        finally:
+            if server is not None:
+                stop_server(server, cfg)
+            _PROXIES.clear()
+            os.chdir('..')
+            if sys.platform == 'win32':
+                time.sleep(2)  # Wait for process shutdown.
+            shutil.rmtree(testdir)
+
     def test_server(self):
         logging.debug('')
         logging.debug('test_server')
@@ -270,6 +469,26 @@ class TestCase(unittest.TestCase):
             assert_raises(self, "server.load_model('no-such-egg')",
                           globals(), locals(), ValueError,
                           "'no-such-egg' not found.")
+
+            # Run several cases in one request.
+            top = set_as_top(Assembly())
+            top.add('comp', ExecComp(['y = 2*x']))
+            top.driver.workflow.add('comp')
+            egg_info = top.save_to_egg('cases', '0')
+            server.load_model(egg_info[0])
+            cases = [([('comp.x', 1.)], ['comp.y'], 1, None),
+                     ([('comp.z', 2.)], ['comp.y'], 2, None),
+                     ([('comp.x', 3.)], ['comp.y'], 3, None)]
+            results = server.run_cases(cases, 'driver',
+                                       egg_filename=egg_info[0])
+            self.assertEqual(len(results), 3)
+            self.assertEqual(results[0], ([('comp.y', 2.)], None))
+            self.assertEqual(results[1][0], None)
+            self.assertTrue(str(results[1][1]).startswith(
+                            'Exception setting case inputs:'))
+            exc = cPickle.loads(cPickle.dumps(results[1][1], -1))
+            self.assertEqual(str(exc), str(results[1][1]))
+            self.assertEqual(results[2], ([('comp.y', 6.)], None))
         finally:
             SimulationRoot.chroot('..')
             shutil.rmtree(testdir)
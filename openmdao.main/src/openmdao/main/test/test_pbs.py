@@ -27,8 +27,18 @@ class TestCase(unittest.TestCase):
         PBS_Server._QSUB[:] = \
             ['python', os.path.join(TestCase.directory, 'pbs_qsub.py')]
 
+        # Force use of fake 'qstat'.
+        self.orig_qstat = list(PBS_Server._QSTAT)
+        PBS_Server._QSTAT[:] = \
+            ['python', os.path.join(TestCase.directory, 'fake_array.py'),
+             'qstat']
+
     def tearDown(self):
         PBS_Server._QSUB[:] = self.orig_qsub
+        PBS_Server._QSTAT[:] = self.orig_qstat
+        for pattern in ('echo.*.out', '*.array.qsub'):
+            for name in glob.glob(pattern):
+                os.remove(name)
         for name in ('TestJob.qsub', 'TestJob-qsub.bat', 'qsub.out',
                      'Zbogus-job-(_&^.qsub', 'Zbogus-job-(_&^-qsub.bat',
                      'python.qsub', 'python-qsub.bat',
@@ -215,6 +225,43 @@ python %s hello world <%s >echo.out 2>echo.err
         code = "server.execute_command(dict(remote_command='echo'))"
         assert_raises(self, code, globals(), locals(), OSError, '')
 
+    def test_array(self):
+        logging.debug('')
+        logging.debug('test_array')
+
+        if sys.platform == 'win32':
+            logging.debug('    requires a POSIX shell, skipping')
+            return
+
+        server = PBS_Server()
+        server.configure(accounting_id='test-account')
+
+        # One submission for all tasks, each with its own command and output.
+        echo = os.path.join(TestCase.directory, 'pbs_echo.py')
+        resource_descs = [dict(remote_command='python',
+                               args=[echo, 'task', str(i)],
+                               output_path='echo.%d.out' % i,
+                               job_name='ArrayJob',
+                               queue_name='array_q') for i in range(5)]
+        results = server.execute_array(resource_descs, poll_delay=0.1)
+        self.assertEqual(results, [(0, '')] * 5)
+        for i in range(5):
+            with open('echo.%d.out' % i, 'r') as inp:
+                self.assertEqual(inp.read(), 'task %d\n' % i)
+
+        script = os.path.join(os.getcwd(), 'ArrayJob.array.qsub')
+        with open('qsub.out', 'r') as inp:
+            submitted = inp.readline()
+        self.assertEqual(submitted,
+                         '-V -j oe -S /bin/sh -J 1-5 %s\n' % script)
+        with open(script, 'r') as inp:
+            lines = inp.readlines()
+        self.assertEqual(lines[:4], ['#!/bin/sh\n',
+                                     '#PBS -W group_list=test-account\n',
+                                     '#PBS -N ArrayJob\n',
+                                     '#PBS -q array_q\n'])
+        self.assertEqual(lines[4], 'case $PBS_ARRAY_INDEX in\n')
+
 
 if __name__ == '__main__':
     sys.argv.append('--cover-package=pbs.')
@@ -0,0 +1,89 @@
+"""
+Test of ComponentProfiler.
+"""
+
+import StringIO
+import json
+import unittest
+
+from openmdao.main.api import Assembly, Component, set_as_top
+from openmdao.main.exechooks import get_exec_hooks
+from openmdao.main.profiler import ComponentProfiler
+from openmdao.lib.datatypes.api import Float
+
+
+class Simple(Component):
+
+    x = Float(1., iotype='in')
+    y = Float(iotype='out')
+
+    def execute(self):
+        self.y = self.x * 2.
+
+
+class Model(Assembly):
+
+    def configure(self):
+        self.add('comp1', Simple())
+        self.add('comp2', Simple())
+        self.driver.workflow.add(['comp1', 'comp2'])
+        self.connect('comp1.y', 'comp2.x')
+
+
+class ProfilerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.model = set_as_top(Model())
+
+    def test_profile(self):
+        with ComponentProfiler() as prof:
+            self.model.run()
+            self.model.run()  # Nothing is invalid, so comps are skipped.
+            self.model.comp1.x = 3.
+            self.model.run()
+        self.assertFalse(prof in get_exec_hooks())
+        self.assertEqual(self.model.comp2.y, 12.)
+
+        stats = prof.get_stats()
+        self.assertEqual(stats['comp1']['executions'], 2)
+        self.assertEqual(stats['comp1']['skipped'], 1)
+        self.assertEqual(stats['comp2']['executions'], 2)
+        self.assertEqual(stats['comp2']['skipped'], 1)
+        self.assertTrue(stats['driver']['execute_time'] >=
+                        stats['driver']['self_time'])
+
+        stream = StringIO.StringIO()
+        prof.report(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('component'))
+        self.assertEqual(len(lines), len(stats) + 2)
+
+        data = json.loads(prof.to_json())
+        self.assertEqual(data['components']['comp1']['executions'], 2)
+
+        prof.reset()
+        self.assertEqual(prof.get_stats(), {})
+
+    def test_activities(self):
+        class Recorder(ComponentProfiler):
+            def __init__(self):
+                super(Recorder, self).__init__()
+                self.activities = []
+            def pre_activity(self, comp, activity):
+                self.activities.append((comp.name, activity))
+                super(Recorder, self).pre_activity(comp, activity)
+
+        self.model.run()
+        with Recorder() as prof:
+            self.model.comp1.x = 3.
+            self.model.run()
+        # Setting comp2.x during the transfer also notifies of invalidation.
+        self.assertEqual(prof.activities[:2], [('comp1', 'invalidate'),
+                                               ('comp2', 'transfer')])
+        stats = prof.get_stats()
+        self.assertTrue(stats['comp1']['invalidate_time'] >= 0.)
+        self.assertTrue(stats['comp2']['transfer_time'] >= 0.)
+
+
+if __name__ == '__main__':
+    unittest.main()
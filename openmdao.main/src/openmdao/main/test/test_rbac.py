@@ -161,6 +161,12 @@ class TestCase(unittest.TestCase):
         check_role('user',  obj.multi_role)
         check_role('xyzzy', obj.role_pattern)
 
+        # Results are cached, repeat to check cached results.
+        assert_raises(self, "check_role('xyzzy', obj.single_role)",
+                      globals(), locals(), RoleError,
+                      "No access for role 'xyzzy'")
+        check_role('xyzzy', obj.role_pattern)
+
     def test_access_controller(self):
         logging.debug('')
         logging.debug('test_access_controller')
@@ -14,6 +14,8 @@ import shutil
 import socket
 import sys
 import tempfile
+import threading
+import time
 import unittest
 
 from openmdao.main.mp_util import read_server_config
@@ -27,6 +29,52 @@ from openmdao.util.testutil import assert_raises, find_python
 SSH_USERS = []
 
 
+class StubServer(object):
+    """ Minimal stand-in for a deployed server proxy. """
+
+    def __init__(self):
+        self.host = 'stub'
+        self.pid = 0
+        self._close = self
+
+    def cancel(self):
+        """ Called by RAM when server is released. """
+        return
+
+
+class StubAllocator(ResourceAllocator):
+    """
+    Allocator whose queries take `latency` seconds and which can deploy
+    up to `capacity` servers.
+    """
+
+    def __init__(self, name, latency, capacity=1):
+        super(StubAllocator, self).__init__(name)
+        self.latency = latency
+        self.capacity = capacity
+        self.deployed = 0
+        self.queries = 0
+
+    def max_servers(self, resource_desc):
+        time.sleep(self.latency)
+        self.queries += 1
+        return (self.capacity, {})
+
+    def time_estimate(self, resource_desc):
+        time.sleep(self.latency)
+        self.queries += 1
+        if self.deployed < self.capacity:
+            return (1, {'hostnames': ['stub']})
+        return (-1, {})
+
+    def deploy(self, name, resource_desc, criteria):
+        self.deployed += 1
+        return StubServer()
+
+    def release(self, server):
+        self.deployed -= 1
+
+
 class TestCase(unittest.TestCase):
     """ Test resource allocation. """
 
@@ -410,6 +458,8 @@ authkey: PublicKey
 allow_shell: False
 total_cpus: 42
 max_load: 200
+pool_max_idle: 2
+pool_max_uses: 5
 """)
         try:
             RAM.configure('resources.cfg')
@@ -418,6 +468,9 @@ max_load: 200
             self.assertEqual(local2.factory._allow_shell, False)
             self.assertEqual(local2.total_cpus, 42)
             self.assertEqual(local2.max_load, 200)
+            self.assertEqual(local2.factory._pool_min_idle, 0)
+            self.assertEqual(local2.factory._pool_max_idle, 2)
+            self.assertEqual(local2.factory._pool_max_uses, 5)
             self.assertEqual(local2.host, socket.gethostname())
             self.assertTrue(local2.pid > 0)
             RAM.remove_allocator('Local2')
@@ -548,6 +601,48 @@ max_load: 100
         assert_raises(self, "allocator.release(None)",
                       globals(), locals(), NotImplementedError, 'release')
 
+    def test_estimates(self):
+        logging.debug('')
+        logging.debug('test_estimates')
+
+        latency = 0.1
+        stubs = [StubAllocator('Stub%d' % i, latency) for i in range(4)]
+        ram = RAM._get_instance()
+        ram._allocators = list(stubs)
+
+        # Allocators are queried concurrently, then results are cached.
+        start = time.time()
+        self.assertEqual(RAM.max_servers({}), 4)
+        self.assertEqual(RAM.max_servers({}), 4)
+        et = time.time() - start
+        self.assertTrue(et < 2 * latency)
+        self.assertEqual([stub.queries for stub in stubs], [1, 1, 1, 1])
+
+        # Deployment only invalidates the chosen allocator's results.
+        start = time.time()
+        servers = []
+        for i in range(len(stubs)):
+            server, server_info = RAM.allocate({})
+            servers.append(server)
+        et = time.time() - start
+        serial = len(stubs) * len(stubs) * latency
+        logging.debug('%d allocations in %.3f sec (%.3f sec serial)',
+                      len(stubs), et, serial)
+        self.assertTrue(et < serial / 2)
+        self.assertEqual([stub.deployed for stub in stubs], [1, 1, 1, 1])
+
+        # With nothing available, allocation waits for a release rather
+        # than the full retry delay.
+        ram._RETRY_DELAY = 10.
+        timer = threading.Timer(0.5, RAM.release, (servers[2],))
+        timer.start()
+        start = time.time()
+        server, server_info = RAM.allocate({})
+        et = time.time() - start
+        timer.join()
+        self.assertTrue(et < 5)
+        self.assertEqual([stub.deployed for stub in stubs], [1, 1, 1, 1])
+
 
 if __name__ == '__main__':
     sys.argv.append('--cover-package=openmdao.main')
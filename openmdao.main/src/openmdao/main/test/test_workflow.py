@@ -6,6 +6,8 @@ import unittest
 
 from openmdao.main.api import Assembly, Component, set_as_top
 from openmdao.main.exceptions import RunStopped
+from openmdao.main.exechooks import ExecHook, register_exec_hook, \
+                                   unregister_exec_hook
 from openmdao.lib.datatypes.api import Int, Bool
 
 # pylint: disable-msg=E1101,E1103
@@ -89,6 +91,37 @@ class TestCase(unittest.TestCase):
         self.assertEqual(self.model.comp_b.total_executions, 2)
         self.assertEqual(self.model.comp_c.total_executions, 2)
 
+    def test_lean(self):
+        self.model.driver.workflow.lean = True
+        self.model.run()
+        self.assertEqual(self.model.comp_c.total_executions, 1)
+        self.assertEqual(self.model.comp_b._itername, ('1', 2))
+        self.assertEqual(self.model.comp_b.get_itername(), '1-2')
+        self.assertEqual(self.model.comp_b._itername, '1-2')
+
+    def test_exec_hooks(self):
+        class Hook(ExecHook):
+            def __init__(self):
+                self.calls = []
+            def pre_execute(self, comp):
+                self.calls.append(('pre', comp.name))
+            def post_execute(self, comp):
+                self.calls.append(('post', comp.name))
+
+        hook = Hook()
+        register_exec_hook(hook)
+        try:
+            self.model.run()
+        finally:
+            unregister_exec_hook(hook)
+        names = [name for kind, name in hook.calls if kind == 'pre']
+        self.assertEqual(names, ['', 'driver', 'comp_a', 'comp_b', 'comp_c'])
+        self.assertEqual(len(hook.calls), 10)
+        self.assertEqual(hook.calls[-1], ('post', ''))
+
+        self.model.rerun()
+        self.assertEqual(len(hook.calls), 10)
+
     def test_stepping(self):
         try:
             self.model.step()
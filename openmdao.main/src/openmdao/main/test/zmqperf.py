@@ -0,0 +1,128 @@
+"""
+Compare set/run/get cycles per second via :class:`ZMQ_RPC` (REQ/REP) and
+:class:`ZMQ_AsyncRPC` (DEALER/ROUTER) over inproc and tcp connections.
+"""
+
+import threading
+import time
+
+import numpy
+import zmq
+from zmq.eventloop import ioloop
+
+from openmdao.main.api import Assembly, Component, set_as_top
+from openmdao.main.datatypes.api import Array, Float
+from openmdao.main.zmqcomp import ZmqCompWrapper, ZmqCompRouter
+from openmdao.main.zmqrpc import ZMQ_RPC, ZMQ_AsyncRPC
+from openmdao.util.network import get_unused_ip_port
+
+
+class Summer(Component):
+    """ Sums its input array. """
+
+    x = Array(iotype='in')
+    y = Float(iotype='out')
+
+    def execute(self):
+        self.y = float(self.x.sum())
+
+
+def start_servers(context, servers):
+    """
+    Serve a model for each ``(wrapper_class, url)`` in `servers`.
+    Returns ``(loop, thread)`` for the thread running the servers.
+    """
+    loop = ioloop.IOLoop.instance()
+    ready = threading.Event()
+
+    def serve():
+        for wrapper_class, url in servers:
+            top = set_as_top(Assembly())
+            top.add('comp', Summer())
+            top.driver.workflow.add('comp')
+            wrapper_class(context, top, url)
+        ready.set()
+        loop.start()
+
+    thread = threading.Thread(target=serve)
+    thread.daemon = True
+    thread.start()
+    ready.wait()
+    return (loop, thread)
+
+
+def sync_cycle(proxy, x):
+    """ One call at a time. """
+    proxy.set('comp.x', x)
+    proxy.run()
+    return proxy.get('comp.y')
+
+
+def pipelined_cycle(proxy, x):
+    """ Send all calls before waiting for a reply. """
+    proxy.invoke_async('set', 'comp.x', x)
+    proxy.invoke_async('run')
+    return proxy.invoke_async('get', 'comp.y').result()
+
+
+def batched_cycle(proxy, x):
+    """ Send all calls in one request. """
+    return proxy.invoke_many([('set', ('comp.x', x)),
+                              ('run', ()),
+                              ('get', ('comp.y',))])[2]
+
+
+def run_test(name, proxy, cycle, x):
+    """ Report cycles per second for `cycle` via `proxy`. """
+    for i in range(10):
+        cycle(proxy, x)  # 'prime' the connection.
+
+    reps = 1000 if x.size < 1000 else 100
+    start = time.time()
+    for i in range(reps):
+        y = cycle(proxy, x)
+    et = time.time() - start
+    assert y == x.size, 'unexpected result %r' % (y,)
+    print '    %-30s %d cycles in %.3f sec (%.1f cycles/sec)' \
+          % (name, reps, et, reps / et)
+
+
+def main():
+    """ Run set/run/get cycles via various connections. """
+    context = zmq.Context()
+    connections = []
+    servers = []
+    for transport in ('inproc', 'tcp'):
+        if transport == 'inproc':
+            rep_url = 'inproc://zmqperf_rep'
+            router_url = 'inproc://zmqperf_router'
+        else:
+            rep_url = 'tcp://127.0.0.1:%d' % get_unused_ip_port()
+            router_url = 'tcp://127.0.0.1:%d' % get_unused_ip_port()
+        connections.append((transport, rep_url, router_url))
+        servers.append((ZmqCompWrapper, rep_url))
+        servers.append((ZmqCompRouter, router_url))
+    loop, thread = start_servers(context, servers)
+
+    for size in (10, 100000):
+        x = numpy.ones(size)
+        print
+        print '%d element array:' % size
+        for transport, rep_url, router_url in connections:
+            proxy = ZMQ_RPC(rep_url, context)
+            run_test('%s REQ/REP' % transport, proxy, sync_cycle, x)
+            proxy.close()
+
+            proxy = ZMQ_AsyncRPC(router_url, context)
+            run_test('%s DEALER/ROUTER' % transport, proxy, sync_cycle, x)
+            run_test('%s pipelined' % transport, proxy, pipelined_cycle, x)
+            run_test('%s invoke_many' % transport, proxy, batched_cycle, x)
+            proxy.close()
+
+    loop.add_callback(loop.stop)
+    thread.join()
+
+
+if __name__ == '__main__':
+    main()
+
@@ -2,6 +2,7 @@
 
 # pylint: disable-msg=E0611,F0401
 from openmdao.main.exceptions import RunStopped
+import openmdao.main.exechooks as exechooks
 
 __all__ = ['Workflow']
 
@@ -12,6 +13,13 @@ class Workflow(object):
     in some order.
     """
 
+    # If True, formatting of each component's iteration coordinates is
+    # deferred until they are requested. This is the only effect: the base
+    # coordinates are still computed once per run, and Component.run()
+    # bookkeeping (directory changes for components with a directory,
+    # validity updates) is unchanged.
+    lean = False
+
     def __init__(self, parent=None, scope=None, members=None):
         """Create a Workflow.
         
@@ -79,9 +87,13 @@ class Workflow(object):
         self._exec_count += 1
         self._comp_count = 0
         iterbase = self._iterbase(case_id)
+        lean = self.lean
         for comp in self._iterator:
             self._comp_count += 1
-            comp.set_itername('%s-%d' % (iterbase, self._comp_count))
+            if lean:
+                comp.set_itername((iterbase, self._comp_count))
+            else:
+                comp.set_itername('%s-%d' % (iterbase, self._comp_count))
             comp.run(ffd_order=ffd_order, case_id=case_id)
             if self._stop:
                 raise RunStopped('Stop requested')
@@ -124,7 +136,11 @@ class Workflow(object):
         self._stop = False
         self._iterator = self.__iter__()
         for node in self._iterator:
-            node.calc_derivatives(first, second)
+            if exechooks.HOOKS:
+                exechooks.run_activity(node, exechooks.DERIVATIVES,
+                                       node.calc_derivatives, first, second)
+            else:
+                node.calc_derivatives(first, second)
             if self._stop:
                 raise RunStopped('Stop requested')
         self._iterator = None
@@ -1,6 +1,7 @@
 import sys
 import traceback
 import cPickle as pickle
+from cStringIO import StringIO
 
 import time
 import threading
@@ -10,6 +11,11 @@ import optparse
 import zmq
 from zmq.eventloop import ioloop, zmqstream
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from openmdao.test.execcomp import ExecComp
 from openmdao.main.api import Assembly, set_as_top
 from openmdao.main.container import deep_getattr
@@ -40,7 +46,60 @@ def decode(msg):
     return pickle.loads(msg)
 
 
+# Arrays of at least this many bytes are sent as separate frames.
+_FRAME_THRESHOLD = 4096
+
+def encode_frames(msg):
+    """Return a list of frames for `msg`.  The first frame is the pickled
+    message, with any large numpy arrays replaced by references to the
+    following frames, which are the arrays themselves.  Send with
+    ``copy=False`` to avoid copying array data.
+    """
+    arrays = []
+    descriptors = []
+    memo = {}
+
+    def persistent_id(obj):
+        if type(obj) is not numpy.ndarray or obj.dtype.hasobject or \
+           obj.nbytes < _FRAME_THRESHOLD:
+            return None
+        try:
+            return memo[id(obj)]
+        except KeyError:
+            index = memo[id(obj)] = len(arrays)
+            arrays.append(numpy.ascontiguousarray(obj))
+            descriptors.append((obj.dtype.str, obj.shape))
+            return index
+
+    out = StringIO()
+    pickler = pickle.Pickler(out, -1)
+    if numpy is not None:
+        pickler.persistent_id = persistent_id
+    pickler.dump(msg)
+    return [pickle.dumps((descriptors, out.getvalue()), -1)] + arrays
+
+def decode_frames(frames):
+    """Return the message in `frames` (as created by :func:`encode_frames`).
+    If `frames` were received with ``copy=False`` then arrays refer directly
+    to the received data and are read-only.
+    """
+    header = getattr(frames[0], 'bytes', frames[0])
+    descriptors, data = pickle.loads(header)
+    arrays = []
+    for (dtype, shape), frame in zip(descriptors, frames[1:]):
+        arr = numpy.frombuffer(getattr(frame, 'buffer', frame), dtype)
+        arr.shape = shape
+        arrays.append(arr)
+    unpickler = pickle.Unpickler(StringIO(data))
+    if arrays:
+        unpickler.persistent_load = arrays.__getitem__
+    return unpickler.load()
+
+
 class ZmqCompWrapper(object):
+    _socket_type = zmq.REP
+    _recv_copy = True
+
     def __init__(self, context, comp, rep_url=None, decoder=None, encoder=None):
         self._context = context
         self._comp = comp
@@ -56,32 +115,39 @@ class ZmqCompWrapper(object):
         if rep_url is None:
             rep_url = 'inproc://%s_rep' % comp.comp.get_pathname()
         self._rep_url = rep_url
-        repsock = context.socket(zmq.REP)
+        repsock = context.socket(self._socket_type)
         repsock.bind(rep_url)
         self._repstream = zmqstream.ZMQStream(repsock)
-        self._repstream.on_recv(self.handle_req)
+        self._repstream.on_recv(self.handle_req, copy=self._recv_copy)
         
     def handle_req(self, msg):
         parts = self._decoder(msg[0])
         #print 'received %s' % parts
+        ret = self._invoke(*parts)
+        #print 'returning %s' % ret
+        self._repstream.send_multipart([self._encoder(ret)])
+
+    def _invoke(self, fname, args=(), kwargs=None):
+        """Return result of calling `fname`, or the traceback if it fails."""
         try:
-            funct = deep_getattr(self._comp, parts[0])
-            ret = funct(*parts[1], **parts[2])
+            funct = deep_getattr(self._comp, fname)
+            return funct(*args, **(kwargs or {}))
         except Exception as err:
             exc_type, exc_value, exc_traceback = sys.exc_info()
-            ret = traceback.format_exc(exc_traceback)
-        #print 'returning %s' % ret
-        self._repstream.send_multipart([self._encoder(ret)])
+            return traceback.format_exc(exc_traceback)
         
     @staticmethod
     def serve(top, context=None, wspub=None, wscmd=None, port=8888,
-              rep_url='tcp://*:5555', pub_url='inproc://_pub_'):
+              rep_url='tcp://*:5555', pub_url='inproc://_pub_', router=False):
 
         if context is None:
             context = zmq.Context()
 
         loop = ioloop.IOLoop.instance()
-        actor = ZmqCompWrapper(context, top, rep_url)
+        if router:
+            actor = ZmqCompRouter(context, top, rep_url)
+        else:
+            actor = ZmqCompWrapper(context, top, rep_url)
         
         # initialize the publisher
         from openmdao.main.publisher import Publisher
@@ -104,6 +170,25 @@ class ZmqCompWrapper(object):
             loop.start()
         except KeyboardInterrupt:
             print ' Interrupted'
+
+
+class ZmqCompRouter(ZmqCompWrapper):
+    """Serves requests on a ROUTER socket, so a client such as
+    :class:`ZMQ_AsyncRPC` may have many requests outstanding.  A request is
+    ``(req_id, calls)``, where `calls` is a list of ``(fname, args, kwargs)``.
+    The reply is ``(req_id, results)``.  Messages are encoded by
+    :func:`encode_frames`, so large numpy arrays are not pickled or copied.
+    """
+    _socket_type = zmq.ROUTER
+    _recv_copy = False
+
+    def handle_req(self, msg):
+        rframes, pframes = msg_split(msg)
+        req_id, calls = decode_frames(pframes)
+        results = [self._invoke(*call) for call in calls]
+        self._repstream.send_multipart(rframes + ['']
+                                       + encode_frames((req_id, results)),
+                                       copy=False)
     
 def main(args=None):
     if args is None:
@@ -122,6 +207,8 @@ def main(args=None):
                       help="route to pub websocket")
     parser.add_option("--wscmd", action="store", type="string", dest='wscmd', 
                       help="route to cmd websocket")
+    parser.add_option("--router", action="store_true", dest='router', 
+                      help="serve on a ROUTER socket (for ZMQ_AsyncRPC)")
 
     (options, args) = parser.parse_args(args)
     
@@ -148,7 +235,8 @@ def main(args=None):
     top.register_published_vars(options.published)
     
     ZmqCompWrapper.serve(top, rep_url=options.repurl, pub_url=options.puburl,
-                         wspub=options.wspub, wscmd=options.wscmd)
+                         wspub=options.wspub, wscmd=options.wscmd,
+                         router=options.router)
     
 
 if __name__ == '__main__':
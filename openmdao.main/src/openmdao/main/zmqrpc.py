@@ -3,9 +3,11 @@ import sys
 import traceback
 import optparse
 import pprint
+import itertools
+import weakref
 from functools import partial
 
-from zmqcomp import encode, decode
+from zmqcomp import encode, decode, encode_frames, decode_frames, msg_split
 
 class ZMQ_RPC(object):
     def __init__(self, url, context=None):
@@ -34,6 +36,95 @@ class ZMQ_RPC(object):
     def close(self):
         self._cmdsock.close()
 
+
+class ZMQ_Future(object):
+    """Result of a call sent by :meth:`ZMQ_AsyncRPC.invoke_async`."""
+
+    def __init__(self, rpc, req_id):
+        self._rpc = rpc
+        self._req_id = req_id
+        self._done = False
+        self._value = None
+
+    def done(self):
+        """Return True if the result has been received."""
+        return self._done
+
+    def result(self):
+        """Return the result of the call, waiting for it if necessary."""
+        if not self._done:
+            self._set(self._rpc._wait(self._req_id)[0])
+        return self._value
+
+    def _set(self, value):
+        self._value = value
+        self._done = True
+
+
+class ZMQ_AsyncRPC(object):
+    """Client for a :class:`ZmqCompRouter`, using a DEALER socket.
+    Each request carries an ID, so many requests may be outstanding.
+    Calls made by :meth:`invoke_async` are sent immediately, their results
+    are collected later.  :meth:`invoke_many` sends a list of calls in a
+    single request.  As with :class:`ZMQ_RPC`, a call which fails returns
+    the remote traceback.
+    """
+
+    def __init__(self, url, context=None):
+        import zmq
+
+        if context is None:
+            context = zmq.Context()
+
+        self._cmdsock = context.socket(zmq.DEALER)
+        self._cmdsock.connect(url)
+        self._req_ids = itertools.count()
+        self._futures = weakref.WeakValueDictionary()
+
+    def __getattr__(self, name):
+        f = partial(self.invoke, name)
+        setattr(self, name, f)
+        return f
+
+    def invoke(self, fname, *args, **kwargs):
+        return self._wait(self._send([(fname, args, kwargs)]))[0]
+
+    def invoke_async(self, fname, *args, **kwargs):
+        """Send call without waiting for the reply, returns a
+        :class:`ZMQ_Future`."""
+        req_id = self._send([(fname, args, kwargs)])
+        future = self._futures[req_id] = ZMQ_Future(self, req_id)
+        return future
+
+    def invoke_many(self, calls):
+        """Send `calls` in a single request and return a list of results.
+        Each call is ``(fname, args)`` or ``(fname, args, kwargs)``.
+        """
+        return self._wait(self._send([tuple(call) for call in calls]))
+
+    def _send(self, calls):
+        """Send request for `calls`, returns request ID."""
+        req_id = self._req_ids.next()
+        self._cmdsock.send_multipart([''] + encode_frames((req_id, calls)),
+                                     copy=False)
+        return req_id
+
+    def _wait(self, req_id):
+        """Return results for `req_id`.  Other replies received are passed
+        to their futures, or discarded if the future no longer exists."""
+        while True:
+            frames = self._cmdsock.recv_multipart(copy=False)
+            rframes, pframes = msg_split(frames)
+            reply_id, results = decode_frames(pframes)
+            if reply_id == req_id:
+                return results
+            future = self._futures.pop(reply_id, None)
+            if future is not None:
+                future._set(results[0])
+
+    def close(self):
+        self._cmdsock.close()
+
 def main(args):
     parser = optparse.OptionParser()
     parser.add_option("-u", "--url", action="store", type="string", dest='url', 
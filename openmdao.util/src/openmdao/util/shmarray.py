@@ -0,0 +1,160 @@
+"""
+Support for passing large :mod:`numpy` arrays between processes on the same
+host via memory-mapped files rather than by pickling them. Where available,
+the files are created in ``/dev/shm``, so the data never touches disk.
+
+Typical usage is for the sending process to call :func:`share_items` on a
+list of (name, value) tuples before sending it, and for the receiving process
+to call :func:`attach_items` on what it receives. If the items can't be sent,
+the sender calls :func:`release_items`. Files may be created in a directory
+from :func:`make_share_dir`, so any left behind by an aborted exchange can be
+removed along with the directory.
+"""
+
+import logging
+import os.path
+import tempfile
+
+try:
+    import numpy
+    from numpy.lib.format import open_memmap
+except ImportError as err:
+    logging.warn("In %s: %r" % (__file__, err))
+    numpy = None
+
+__all__ = ['ArrayHandle', 'make_share_dir', 'share_array', 'attach_array',
+           'share_items', 'attach_items', 'release_items']
+
+# Directory for shared array files.
+if os.path.isdir('/dev/shm'):
+    _SHM_DIR = '/dev/shm'
+else:
+    _SHM_DIR = None  # Use default temporary directory.
+
+
+class ArrayHandle(object):
+    """
+    Refers to an array stored by :func:`share_array`.
+
+    path: string
+        Path to the ``.npy`` file containing the array.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __repr__(self):
+        return 'ArrayHandle(%r)' % self.path
+
+
+def make_share_dir():
+    """
+    Create and return a new directory for shared array files. The caller is
+    responsible for removing it.
+    """
+    return tempfile.mkdtemp(prefix='omshm-', dir=_SHM_DIR)
+
+
+def share_array(arr, directory=None):
+    """
+    Copy `arr` to a new memory-mapped file and return an
+    :class:`ArrayHandle` referring to it.
+
+    arr: :class:`numpy.ndarray`
+        Array to be shared. Must not have an object dtype.
+
+    directory: string
+        Directory to create the file in. If None, ``/dev/shm`` is used if
+        available, otherwise the default temporary directory.
+    """
+    fd, path = tempfile.mkstemp(suffix='.npy', prefix='omshm-',
+                                dir=directory or _SHM_DIR)
+    os.close(fd)
+    try:
+        mapped = open_memmap(path, mode='w+', dtype=arr.dtype, shape=arr.shape)
+        mapped[...] = arr
+        mapped.flush()
+        del mapped
+    except Exception:
+        os.remove(path)
+        raise
+    return ArrayHandle(path)
+
+
+def attach_array(handle, remove=True):
+    """
+    Return the array referred to by `handle`. The array is a copy-on-write
+    mapping of the file, so no data is copied unless it's modified.
+
+    handle: :class:`ArrayHandle`
+        Handle returned by :func:`share_array`.
+
+    remove: bool
+        If True, the file is removed. The returned array remains valid.
+    """
+    mapped = open_memmap(handle.path, mode='c')
+    if remove:
+        try:
+            os.remove(handle.path)
+        except OSError:  # Windows won't remove a mapped file.
+            pass
+    return mapped.view(numpy.ndarray)
+
+
+def share_items(items, threshold, directory=None):
+    """
+    Return a copy of `items` with each value that's a :mod:`numpy` array of
+    at least `threshold` bytes replaced by an :class:`ArrayHandle`.
+
+    items: list
+        List of (name, value) tuples.
+
+    threshold: int
+        Minimum size in bytes of arrays to be shared. If zero, `items` is
+        returned unchanged.
+
+    directory: string
+        Directory to create files in, see :func:`share_array`.
+    """
+    if not threshold or numpy is None:
+        return items
+    shared = []
+    try:
+        for name, value in items:
+            if isinstance(value, numpy.ndarray) and \
+               value.nbytes >= threshold and not value.dtype.hasobject:
+                value = share_array(value, directory)
+            shared.append((name, value))
+    except Exception:
+        release_items(shared)
+        raise
+    return shared
+
+
+def attach_items(items):
+    """
+    Return a copy of `items` with each :class:`ArrayHandle` value replaced by
+    the array it refers to. The shared files are removed.
+
+    items: list
+        List of (name, value) tuples.
+    """
+    return [(name, attach_array(value) if isinstance(value, ArrayHandle)
+                                       else value)
+            for name, value in items]
+
+
+def release_items(items):
+    """
+    Remove the files of each :class:`ArrayHandle` value in `items`.
+    Used if items returned by :func:`share_items` won't be attached.
+
+    items: list
+        List of (name, value) tuples.
+    """
+    for name, value in items:
+        if isinstance(value, ArrayHandle):
+            try:
+                os.remove(value.path)
+            except OSError:
+                pass
@@ -0,0 +1,68 @@
+"""
+Test sharing of arrays via memory-mapped files.
+"""
+
+import os.path
+import shutil
+import unittest
+
+import numpy
+
+from openmdao.util.shmarray import ArrayHandle, share_array, attach_array, \
+                                   share_items, attach_items, release_items, \
+                                   make_share_dir
+
+
+class TestCase(unittest.TestCase):
+    """ Test sharing of arrays via memory-mapped files. """
+
+    def test_array(self):
+        arr = numpy.arange(12.).reshape(3, 4)
+        handle = share_array(arr)
+        self.assertTrue(os.path.exists(handle.path))
+        shared = attach_array(handle)
+        self.assertFalse(os.path.exists(handle.path))
+        self.assertEqual(type(shared), numpy.ndarray)
+        self.assertEqual(shared.shape, (3, 4))
+        self.assertTrue((shared == arr).all())
+
+        # Copy-on-write, so modification is allowed.
+        shared[0, 0] = 42.
+        self.assertEqual(shared[0, 0], 42.)
+
+    def test_items(self):
+        big = numpy.ones(100)
+        small = numpy.zeros(2)
+        items = [('big', big), ('small', small), ('x', 1.5),
+                 ('obj', numpy.array([None] * 100))]
+
+        self.assertTrue(share_items(items, 0) is items)
+
+        shared = dict(share_items(items, 800))
+        self.assertTrue(isinstance(shared['big'], ArrayHandle))
+        self.assertTrue(shared['small'] is small)
+        self.assertEqual(shared['x'], 1.5)
+        self.assertTrue(isinstance(shared['obj'], numpy.ndarray))
+
+        attached = dict(attach_items(shared.items()))
+        self.assertTrue((attached['big'] == big).all())
+        self.assertTrue(attached['small'] is small)
+        self.assertFalse(os.path.exists(shared['big'].path))
+
+    def test_release(self):
+        directory = make_share_dir()
+        try:
+            items = [('big', numpy.ones(100)), ('x', 1.5)]
+            shared = share_items(items, 800, directory)
+            path = shared[0][1].path
+            self.assertEqual(os.path.dirname(path), directory)
+            self.assertTrue(os.path.exists(path))
+            release_items(shared)
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(os.listdir(directory), [])
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -80,6 +80,89 @@ class TestCase(unittest.TestCase):
         worker_q.put((self.add, (1,), {}, self.reply_q))
         WorkerPool.cleanup()
 
+    def test_submit(self):
+        logging.debug('')
+        logging.debug('test_submit')
+
+        pool = WorkerPool(max_workers=4)
+        for i in range(10):
+            pool.submit(self.add, (i,), reply_q=self.reply_q)
+        pool.submit(self.add, (None,), reply_q=self.reply_q)
+
+        retvals = []
+        for i in range(11):
+            done_q, retval, exc, trace = self.reply_q.get()
+            self.assertEqual(done_q, None)
+            if exc is None:
+                retvals.append(retval)
+            else:
+                self.assertEqual(type(exc), TypeError)
+        self.assertEqual(sorted(retvals), range(-9, 1))
+
+        metrics = pool.get_metrics()
+        self.assertTrue(metrics['workers'] <= 4)
+        self.assertEqual(metrics['busy'], 0)
+        self.assertEqual(metrics['idle'], metrics['workers'])
+        self.assertEqual(metrics['queued'], 0)
+        self.assertEqual(metrics['completed'], 11)
+        for name in ('wait', 'service'):
+            stats = metrics[name]
+            self.assertEqual(sorted(stats.keys()), ['mean', 'p50', 'p90', 'p99'])
+            self.assertTrue(stats['p50'] <= stats['p90'] <= stats['p99'])
+        pool._cleanup()
+        self.assertEqual(pool.get_metrics()['workers'], 0)
+
+    def test_scaling(self):
+        logging.debug('')
+        logging.debug('test_scaling')
+
+        # Throughput scales with the number of workers the pool may add.
+        count = 20
+        for latency in (0.01, 0.05):
+            rates = {}
+            waits = {}
+            for max_workers in (1, count):
+                pool = WorkerPool(max_workers=max_workers)
+                start = time.time()
+                for i in range(count):
+                    pool.submit(time.sleep, (latency,), reply_q=self.reply_q)
+                for i in range(count):
+                    self.reply_q.get()
+                et = time.time() - start
+                rates[max_workers] = count / et
+                metrics = pool.get_metrics()
+                waits[max_workers] = metrics['wait']['p90']
+                logging.debug('latency %g, max_workers %d: %d requests in'
+                              ' %.3f sec (%.1f/sec), %d workers, p90 wait %g',
+                              latency, max_workers, count, et,
+                              rates[max_workers], metrics['workers'],
+                              waits[max_workers])
+                self.assertEqual(metrics['workers'], max_workers)
+                pool._cleanup()
+            self.assertTrue(rates[count] > rates[1] * 5)
+            self.assertTrue(waits[count] < waits[1])
+
+    def test_shrink(self):
+        logging.debug('')
+        logging.debug('test_shrink')
+
+        pool = WorkerPool(min_workers=1, idle_timeout=0.1)
+        for i in range(5):
+            pool.submit(time.sleep, (0.1,), reply_q=self.reply_q)
+        worker_q = pool._get(False)
+        for i in range(5):
+            self.reply_q.get()
+        pool._release(worker_q)
+        self.assertEqual(pool.get_metrics()['workers'], 6)
+
+        # Idle workers are stopped when the pool is next used.
+        time.sleep(0.2)
+        pool.submit(self.add, (1,), reply_q=self.reply_q)
+        self.assertEqual(self.reply_q.get()[1], -1)
+        self.assertEqual(pool.get_metrics()['workers'], 1)
+        self.assertNotEqual(pool._get(False), worker_q)
+        pool._cleanup()
+
 
 if __name__ == '__main__':
     sys.argv.append('--cover-package=openmdao.util.wrkpool')
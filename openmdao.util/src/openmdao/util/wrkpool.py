@@ -1,20 +1,58 @@
 import atexit
+import collections
 import logging
 import Queue
 import threading
+import time
 import traceback
 
 
 class WorkerPool(object):
-    """ Pool of worker threads; grows as necessary. """
+    """
+    Pool of worker threads; grows as necessary.
+
+    Workers may be dedicated to a caller via :meth:`get` and :meth:`release`,
+    or requests may be queued via :meth:`submit` to be processed by the next
+    available worker. A worker for queued requests is added whenever a
+    request would otherwise have to wait, up to `max_workers`. Workers which
+    have been idle for more than `idle_timeout` seconds are stopped (this is
+    checked whenever the pool is used). :meth:`get_metrics` reports pool
+    activity.
+
+    min_workers: int
+        Number of workers for queued requests which are kept when idle.
+
+    max_workers: int
+        Maximum number of workers for queued requests.
+
+    idle_timeout: float (seconds)
+        Time after which an idle worker is stopped.
+    """
 
     _lock = threading.Lock()
     _pool = None  # Singleton.
 
-    def __init__(self):
-        self._idle = []     # Queues of idle workers.
-        self._workers = {}  # Maps queue to worker.
-        atexit.register(self.cleanup)
+    # Number of recent requests used for wait and service time statistics.
+    _SAMPLES = 1000
+
+    def __init__(self, min_workers=0, max_workers=64, idle_timeout=60.):
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        self._pool_lock = threading.Lock()
+        self._idle = []        # Queues of idle workers, oldest first.
+        self._idle_since = {}  # Maps idle queue to time released.
+        self._workers = {}     # Maps queue to worker.
+        self._tasks = Queue.Queue()  # Requests from submit().
+        self._task_threads = []      # Workers for _tasks.
+        self._task_workers = 0       # Number not told to stop.
+        self._task_idle = []         # Times task workers became idle.
+        self._queued = 0
+        self._busy = 0
+        self._completed = 0
+        self._waits = collections.deque(maxlen=self._SAMPLES)
+        self._services = collections.deque(maxlen=self._SAMPLES)
+        atexit.register(self._cleanup)
 
     @staticmethod
     def get_instance():
@@ -31,18 +69,29 @@ class WorkerPool(object):
 
     def _cleanup(self):
         """ Cleanup resources (worker threads). """
-        with self._lock:
-            for queue in self._workers:
-                queue.put((None, None, None, None))
-                self._workers[queue].join(1)
-                if self._workers[queue].is_alive():
-                    logging.debug('WorkerPool: worker join timed-out.')
-                try:
-                    self._idle.remove(queue)
-                except ValueError:
-                    pass  # Never released due to some other issue...
+        with self._pool_lock:
+            workers = self._workers
+            task_threads = self._task_threads
+            for i in range(self._task_workers):
+                self._tasks.put(None)
             self._idle = []
+            self._idle_since = {}
             self._workers = {}
+            self._tasks = Queue.Queue()
+            self._task_threads = []
+            self._task_workers = 0
+            self._task_idle = []
+            self._queued = 0
+
+        for queue, worker in workers.items():
+            queue.put((None, None, None, None))
+            worker.join(1)
+            if worker.is_alive():
+                logging.debug('WorkerPool: worker join timed-out.')
+        for worker in task_threads:
+            worker.join(1)
+            if worker.is_alive():
+                logging.debug('WorkerPool: worker join timed-out.')
 
     @staticmethod
     def get(one_shot=False):
@@ -62,9 +111,10 @@ class WorkerPool(object):
 
     def _get(self, one_shot):
         """ Get a worker queue from the pool. """
-        with self._lock:
+        with self._pool_lock:
+            self._reap()
             try:
-                return self._idle.pop()
+                queue = self._idle.pop()
             except IndexError:
                 queue = Queue.Queue()
                 worker = threading.Thread(target=self._service_loop,
@@ -72,7 +122,9 @@ class WorkerPool(object):
                 worker.daemon = True
                 worker.start()
                 self._workers[queue] = worker
-                return queue
+            else:
+                del self._idle_since[queue]
+            return queue
 
     @staticmethod
     def release(queue):
@@ -86,8 +138,100 @@ class WorkerPool(object):
 
     def _release(self, queue):
         """ Release a worker queue back to the pool. """
-        with self._lock:
+        with self._pool_lock:
             self._idle.append(queue)
+            self._idle_since[queue] = time.time()
+            self._reap()
+
+    def submit(self, callable, args=(), kwargs=None, reply_q=None):
+        """
+        Queue a request to be processed by the next available worker.
+        Work replies are of the form:
+
+        ``(None, retval, exc, traceback)``
+
+        callable: callable
+            Function to be called.
+
+        args: tuple
+            Positional arguments for `callable`.
+
+        kwargs: dict
+            Keyword arguments for `callable`.
+
+        reply_q: Queue
+            If not None, the reply is put here.
+        """
+        with self._pool_lock:
+            self._reap()
+            self._tasks.put((callable, args, kwargs or {}, reply_q,
+                             time.time()))
+            self._queued += 1
+            if self._queued > len(self._task_idle) and \
+               self._task_workers < self.max_workers:
+                self._task_threads = [worker for worker in self._task_threads
+                                      if worker.is_alive()]
+                worker = threading.Thread(target=self._task_loop,
+                                          args=(self._tasks,))
+                worker.daemon = True
+                worker.start()
+                self._task_threads.append(worker)
+                self._task_workers += 1
+                self._task_idle.append(time.time())
+
+    def _reap(self):
+        """ Stop workers idle for too long. Called with lock held. """
+        limit = time.time() - self.idle_timeout
+        while self._idle and self._idle_since[self._idle[0]] < limit:
+            queue = self._idle.pop(0)
+            del self._idle_since[queue]
+            del self._workers[queue]
+            queue.put((None, None, None, None))
+
+        # Only stop task workers not needed for queued requests.
+        while self._task_idle and self._task_idle[0] < limit and \
+              len(self._task_idle) > self._queued and \
+              self._task_workers > self.min_workers:
+            self._task_idle.pop(0)
+            self._task_workers -= 1
+            self._tasks.put(None)
+
+    def get_metrics(self):
+        """
+        Return dictionary describing pool activity:
+
+        - workers: number of worker threads.
+        - busy: number of workers processing a request.
+        - idle: number of workers not processing a request.
+        - queued: number of requests from :meth:`submit` waiting for a worker.
+        - completed: number of requests processed.
+        - wait: statistics of time requests from :meth:`submit` waited.
+        - service: statistics of time taken to process requests.
+
+        Statistics are dictionaries of 'mean', 'p50', 'p90', and 'p99'
+        times (seconds) for recent requests, or None if there are none.
+        """
+        with self._pool_lock:
+            workers = len(self._workers) + self._task_workers
+            return dict(workers=workers,
+                        busy=self._busy,
+                        idle=workers - self._busy,
+                        queued=self._queued,
+                        completed=self._completed,
+                        wait=self._statistics(self._waits),
+                        service=self._statistics(self._services))
+
+    @staticmethod
+    def _statistics(samples):
+        """ Return mean and percentiles of `samples`. """
+        if not samples:
+            return None
+        samples = sorted(samples)
+        last = len(samples) - 1
+        stats = dict(mean=sum(samples) / len(samples))
+        for percent in (50, 90, 99):
+            stats['p%d' % percent] = samples[int(round(percent * last / 100.))]
+        return stats
 
     def _service_loop(self, request_q, one_shot):
         """ Get (callable, args, kwargs) from request_q and queue result. """
@@ -97,17 +241,10 @@ class WorkerPool(object):
                 request_q.task_done()
                 return  # Shutdown.
 
-            exc = None
-            trace = None
-            retval = None
-            try:
-                retval = callable(*args, **kwargs)
-            except Exception as exc:
-                # Sometimes we have issues at shutdown.
-                try:
-                    trace = traceback.format_exc()
-                except Exception:  #pragma no cover
-                    return
+            result = self._process(callable, args, kwargs)
+            if result is None:  #pragma no cover
+                return
+            retval, exc, trace = result
 
             request_q.task_done()
             if reply_q is not None:
@@ -116,3 +253,55 @@ class WorkerPool(object):
             if one_shot:
                 self._release(request_q)
 
+    def _task_loop(self, tasks):
+        """ Process requests from `tasks` until told to stop. """
+        while True:
+            request = tasks.get()
+            if request is None:
+                return  # Shutdown.
+
+            callable, args, kwargs, reply_q, submitted = request
+            with self._pool_lock:
+                if tasks is self._tasks:  # Not cleaned-up.
+                    self._queued -= 1
+                    if self._task_idle:
+                        self._task_idle.pop()
+                self._waits.append(time.time() - submitted)
+
+            result = self._process(callable, args, kwargs)
+            if result is None:  #pragma no cover
+                return
+            retval, exc, trace = result
+
+            with self._pool_lock:
+                if tasks is self._tasks:
+                    self._task_idle.append(time.time())
+            if reply_q is not None:
+                reply_q.put((None, retval, exc, trace))
+
+    def _process(self, callable, args, kwargs):
+        """
+        Return ``(retval, exc, trace)`` from calling `callable`,
+        or None if there are problems at shutdown.
+        """
+        with self._pool_lock:
+            self._busy += 1
+        start = time.time()
+        exc = None
+        trace = None
+        retval = None
+        try:
+            retval = callable(*args, **kwargs)
+        except Exception as exc:
+            # Sometimes we have issues at shutdown.
+            try:
+                trace = traceback.format_exc()
+            except Exception:  #pragma no cover
+                return None
+        finally:
+            with self._pool_lock:
+                self._busy -= 1
+                self._completed += 1
+                self._services.append(time.time() - start)
+        return (retval, exc, trace)
+